@@ -0,0 +1,113 @@
+# IrenFantasyArt/db_router.py
+import contextvars
+import random
+from functools import wraps
+
+from django.conf import settings
+
+ANALYTICS_DB = 'analytics'
+ANALYTICS_APPS = {'analytics'}
+
+PIN_COOKIE = 'pin_primary'
+SAFE_METHODS = ('GET', 'HEAD', 'OPTIONS')
+
+# Можно ли читать с реплик: включает ReplicaMiddleware для безопасных запросов,
+# вне запросов (команды, cron) всё читается с основной базы
+_replicas_allowed = contextvars.ContextVar('replicas_allowed', default=False)
+_wrote = contextvars.ContextVar('wrote_to_primary', default=False)
+
+
+def replica_aliases():
+    return getattr(settings, 'DATABASE_REPLICAS', [])
+
+
+def analytics_alias():
+    return ANALYTICS_DB if ANALYTICS_DB in settings.DATABASES else None
+
+
+class DatabaseRouter:
+    """
+    Модели analytics - в базу 'analytics', если она настроена.
+    Остальные чтения в GET-запросах - на случайную реплику из DATABASE_REPLICAS,
+    пока запрос (или этот клиент недавно) ничего не записал. Записи аналитики
+    (журналы, суточные итоги) клиент не перечитывает - они клиента не закрепляют.
+    """
+
+    def _analytics(self, model):
+        if model._meta.app_label in ANALYTICS_APPS:
+            return analytics_alias()
+        return None
+
+    def db_for_read(self, model, **hints):
+        alias = self._analytics(model)
+        if alias:
+            return alias
+        replicas = replica_aliases()
+        if replicas and _replicas_allowed.get():
+            return random.choice(replicas)
+        return 'default'
+
+    def db_for_write(self, model, **hints):
+        if model._meta.app_label in ANALYTICS_APPS:
+            return analytics_alias() or 'default'
+        # После записи читаем своё с основной базы до конца запроса
+        _replicas_allowed.set(False)
+        _wrote.set(True)
+        return 'default'
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # Реплики - копии default, аналитика ссылается на картины без ограничений в БД
+        return True
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        if db in replica_aliases():
+            return False
+        if analytics_alias():
+            return (app_label in ANALYTICS_APPS) == (db == ANALYTICS_DB)
+        return None
+
+
+def replica_pin_exempt(view_func):
+    """
+    Записи view (и сохранение сессии после неё) не закрепляют клиента за
+    основной базой: счётчики, которые он сразу не перечитывает (/analytics/collect)
+    """
+    @wraps(view_func)
+    def _wrapped_view(request, *args, **kwargs):
+        request._replica_pin_exempt = True
+        return view_func(request, *args, **kwargs)
+
+    return _wrapped_view
+
+
+class ReplicaMiddleware:
+    """
+    Разрешает чтение с реплик для GET/HEAD/OPTIONS.
+
+    После записи в основную базу клиент получает cookie и REPLICA_PIN_SECONDS
+    читает с основной базы, чтобы видеть свои изменения несмотря на отставание реплик.
+    POST без записи (например, форма с ошибкой) клиента не закрепляет.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        if not replica_aliases():
+            return self.get_response(request)
+
+        allowed = request.method in SAFE_METHODS and PIN_COOKIE not in request.COOKIES
+        allowed_token = _replicas_allowed.set(allowed)
+        wrote_token = _wrote.set(False)
+        try:
+            response = self.get_response(request)
+            wrote = _wrote.get()
+        finally:
+            _replicas_allowed.reset(allowed_token)
+            _wrote.reset(wrote_token)
+
+        if wrote and not getattr(request, '_replica_pin_exempt', False):
+            response.set_cookie(
+                PIN_COOKIE, '1', max_age=settings.REPLICA_PIN_SECONDS, httponly=True, samesite='Lax'
+            )
+        return response
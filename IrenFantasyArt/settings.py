@@ -1,12 +1,15 @@
 import os
 from pathlib import Path
 from dotenv import load_dotenv
-import pymysql
-
-pymysql.install_as_MySQLdb()
 
 load_dotenv()
 
+# PyMySQL нужен только для MySQL - не импортируем его при каждом старте
+if os.getenv('DB_ENGINE', '').endswith('mysql'):
+    import pymysql
+
+    pymysql.install_as_MySQLdb()
+
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent
 
@@ -50,6 +53,7 @@ INSTALLED_APPS = [
 MIDDLEWARE = [
     'django.middleware.security.SecurityMiddleware',
     'whitenoise.middleware.WhiteNoiseMiddleware',
+    'IrenFantasyArt.db_router.ReplicaMiddleware',
 
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
@@ -88,18 +92,56 @@ WSGI_APPLICATION = 'IrenFantasyArt.wsgi.application'
 # Database
 # https://docs.djangoproject.com/en/6.0/ref/settings/#databases
 
+# Профиль SQLite для продакшена: WAL, busy_timeout, mmap и др. (IrenFantasyArt/sqlite.py)
+SQLITE_HARDENED = os.getenv('SQLITE_HARDENED', 'True') == 'True'
+
+
+def sqlite_database(name, **overrides):
+    return {
+        'ENGINE': 'django.db.backends.sqlite3',
+        'NAME': name,
+        # Соединение живёт между запросами, PRAGMA не выполняются заново
+        'CONN_MAX_AGE': 60,
+        'CONN_HEALTH_CHECKS': True,
+        # Запись сразу берёт блокировку: в WAL иначе возможен мгновенный
+        # "database is locked" при повышении блокировки, busy_timeout его не ждёт
+        'OPTIONS': {'transaction_mode': 'IMMEDIATE'},
+        **overrides,
+    }
+
+
 if os.getenv('USE_SQLITE', 'True') == 'True' or DEBUG:
     DATABASES = {
-        'default': {
-            'ENGINE': 'django.db.backends.sqlite3',
-            'NAME': BASE_DIR / 'db.sqlite3',
-        }
+        'default': sqlite_database(BASE_DIR / 'db.sqlite3'),
     }
-    print("SQLite")
+    # Локальная проверка маршрутизации (IrenFantasyArt/db_router.py):
+    # отдельный файл для аналитики и "реплики" - тот же файл только для чтения
+    if os.getenv('SQLITE_ANALYTICS_DB', 'False') == 'True':
+        DATABASES['analytics'] = sqlite_database(BASE_DIR / 'analytics.sqlite3')
+    for i in range(int(os.getenv('SQLITE_READ_REPLICAS', '0'))):
+        DATABASES[f'replica{i + 1}'] = sqlite_database(
+            f"file:{BASE_DIR / 'db.sqlite3'}?mode=ro",
+            OPTIONS={},
+            TEST={'MIRROR': 'default'},
+        )
 else:
     try:
-        DATABASES = {
-            'default': {
+        # Пул соединений есть только у psycopg 3 (pip install "psycopg[binary,pool]"),
+        # с psycopg2 остаются постоянные соединения
+        try:
+            import psycopg_pool  # noqa: F401
+            DB_CONNECTION_OPTIONS = {
+                'OPTIONS': {'pool': {
+                    'min_size': int(os.getenv('DB_POOL_MIN', '2')),
+                    'max_size': int(os.getenv('DB_POOL_MAX', '10')),
+                    'timeout': 10,
+                }},
+            }
+        except ImportError:
+            DB_CONNECTION_OPTIONS = {'CONN_MAX_AGE': 600}
+
+        def postgres_database(**overrides):
+            return {
                 'ENGINE': os.getenv('DB_ENGINE', 'django.db.backends.postgresql'),
                 'NAME': os.getenv('DB_NAME', 'irenfantasyart_db'),
                 'USER': os.getenv('DB_USER', 'irenfantasyart_user'),
@@ -107,21 +149,34 @@ else:
                 'HOST': os.getenv('DB_HOST', 'localhost'),
                 'PORT': os.getenv('DB_PORT', '5432'),
 
-                'CONN_MAX_AGE': 600,
                 'CONN_HEALTH_CHECKS': True,
+                **DB_CONNECTION_OPTIONS,
+                **overrides,
             }
+
+        DATABASES = {
+            'default': postgres_database(),
         }
-        print("MySQL")
+        # Реплики только для чтения: DB_REPLICA_HOSTS=replica1.local,replica2.local
+        for i, host in enumerate(filter(None, os.getenv('DB_REPLICA_HOSTS', '').split(','))):
+            DATABASES[f'replica{i + 1}'] = postgres_database(HOST=host.strip(), TEST={'MIRROR': 'default'})
+        # Отдельная база для журналов просмотров и событий
+        if os.getenv('ANALYTICS_DB_NAME'):
+            DATABASES['analytics'] = postgres_database(
+                NAME=os.getenv('ANALYTICS_DB_NAME'),
+                HOST=os.getenv('ANALYTICS_DB_HOST', os.getenv('DB_HOST', 'localhost')),
+            )
     except Exception as e:
-        print(f"MySQL Error: {e}")
-        print("SQLite")
+        print(f"Ошибка настройки базы данных: {e}, используется SQLite")
         DATABASES = {
-            'default': {
-                'ENGINE': 'django.db.backends.sqlite3',
-                'NAME': BASE_DIR / 'db.sqlite3',
-            }
+            'default': sqlite_database(BASE_DIR / 'db.sqlite3'),
         }
 
+DATABASE_ROUTERS = ['IrenFantasyArt.db_router.DatabaseRouter']
+DATABASE_REPLICAS = [alias for alias in DATABASES if alias.startswith('replica')]
+# Сколько секунд после записи клиент читает с основной базы
+REPLICA_PIN_SECONDS = 10
+
 CACHES = {
     'default': {
         'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
@@ -179,7 +234,8 @@ MEDIA_ROOT = BASE_DIR / 'media'
 
 # CKEditor
 CKEDITOR_UPLOAD_PATH = "ckeditor_uploads/" 
-CKEDITOR_IMAGE_BACKEND = "pillow"
+# Сжатие и дедупликация загрузок по хэшу (blog/ckeditor_backends.py)
+CKEDITOR_IMAGE_BACKEND = "blog.ckeditor_backends.CompressingPillowBackend"
 CKEDITOR_THUMBNAIL_SIZE = (300, 300)
 CKEDITOR_IMAGE_QUALITY = 40
 CKEDITOR_BROWSE_SHOW_DIRS = True
@@ -260,6 +316,31 @@ CKEDITOR_CONFIGS = {
 }
 
 
+# Журналы просмотров: подробные записи хранятся VIEW_LOG_RETENTION_DAYS дней,
+# затем prune_view_logs сворачивает их в суточные итоги и архивирует
+VIEW_LOG_RETENTION_DAYS = int(os.getenv('VIEW_LOG_RETENTION_DAYS', '365'))
+VIEW_LOG_ARCHIVE_DIR = BASE_DIR / 'archive'
+# Период полураспада популярности для блоков "Лучшие работы"/"Популярное" (update_trending)
+TRENDING_HALF_LIFE_DAYS = float(os.getenv('TRENDING_HALF_LIFE_DAYS', '7'))
+
+# Прогрев кэшей после деплоя (warm_cache) и, если включено, при старте каждого воркера
+WARM_CACHE_ON_START = os.getenv('WARM_CACHE_ON_START', 'False') == 'True'
+# Адрес запущенного сайта для warm_cache (например, http://127.0.0.1:8000)
+WARM_CACHE_BASE_URL = os.getenv('WARM_CACHE_BASE_URL', '')
+WARM_CACHE_SOURCES = ['artworks', 'catalog', 'sitemap']
+WARM_CACHE_TOP_ARTWORKS = 20
+WARM_CACHE_TOP_QUERIES = 20
+WARM_CACHE_MAX_PATHS = 300
+WARM_CACHE_CONCURRENCY = 4
+
+# Фильтры и сортировки каталога по колонкам NumPy в памяти воркера (artworks/catalog_engine.py),
+# из БД загружаются только картины видимой страницы
+CATALOG_MEMORY_ENGINE = os.getenv('CATALOG_MEMORY_ENGINE', 'False') == 'True'
+
+# Каталог для export_static_site: HTML публичных страниц для nginx без Python
+STATIC_EXPORT_ROOT = Path(os.getenv('STATIC_EXPORT_ROOT', BASE_DIR / 'static_site'))
+
+
 # Логирование
 LOGGING = {
     'version': 1,
@@ -0,0 +1,51 @@
+# IrenFantasyArt/sqlite.py
+from django.conf import settings
+
+# Профиль SQLite для продакшена: WAL позволяет читать во время записи,
+# synchronous=NORMAL в режиме WAL не теряет целостность, только последние
+# транзакции при отключении питания
+PRAGMAS = [
+    ('busy_timeout', 5000),
+    ('synchronous', 'NORMAL'),
+    ('cache_size', -20000),        # ~20 МБ на соединение
+    ('mmap_size', 128 * 1024 * 1024),
+    ('temp_store', 'MEMORY'),
+]
+# Лимит PRAGMA optimize при открытии соединения: анализирует только то, что нужно
+OPTIMIZE_ON_OPEN = 'PRAGMA optimize=0x10002'
+
+
+def is_read_only(settings_dict):
+    return 'mode=ro' in str(settings_dict['NAME'])
+
+
+def apply_pragmas(cursor, read_only=False):
+    """Включает WAL и настройки производительности на открытом соединении"""
+    if not read_only:
+        # Режим журнала хранится в файле базы - у реплики только для чтения его не сменить
+        cursor.execute('PRAGMA journal_mode=WAL')
+    for name, value in PRAGMAS:
+        cursor.execute(f'PRAGMA {name}={value}')
+    if not read_only:
+        cursor.execute(OPTIMIZE_ON_OPEN)
+
+
+def configure_connection(sender, connection, **kwargs):
+    """Обработчик connection_created (подключается в ArtworksConfig.ready)"""
+    if connection.vendor != 'sqlite' or not getattr(settings, 'SQLITE_HARDENED', False):
+        return
+    if connection.is_in_memory_db():
+        return
+    with connection.cursor() as cursor:
+        apply_pragmas(cursor, read_only=is_read_only(connection.settings_dict))
+
+
+def maintain(connection):
+    """
+    Периодическое обслуживание: PRAGMA optimize и перенос WAL в основной файл
+    с обрезкой журнала. Возвращает (busy, страниц в WAL, перенесено страниц).
+    """
+    with connection.cursor() as cursor:
+        cursor.execute('PRAGMA optimize')
+        cursor.execute('PRAGMA wal_checkpoint(TRUNCATE)')
+        return cursor.fetchone()
@@ -2,7 +2,7 @@ from django.contrib import admin
 from django.urls import path, include
 from django.conf import settings
 from django.conf.urls.static import static
-from django.views.static import serve
+from artworks.views import media
 from django.urls import re_path 
 from django.contrib.sitemaps.views import sitemap
 from artworks.sitemaps import ArtworkSitemap, CollectionSitemap, StaticViewSitemap
@@ -30,7 +30,7 @@ urlpatterns = [
     path('admin/', admin.site.urls),
     path('blog/', include('blog.urls')),
     path('analytics/', include('analytics.urls')),
-    path('ckeditor/', include('ckeditor_uploader.urls')),
+    path('ckeditor/', include('blog.ckeditor_urls')),
     path('', include('artworks.urls')),
 
     path('sitemap.xml', sitemap, {'sitemaps': sitemaps}, 
@@ -45,9 +45,7 @@ urlpatterns = [
 urlpatterns += static(settings.STATIC_URL, document_root=settings.STATIC_ROOT)
 
 urlpatterns += [
-    re_path(r'^media/(?P<path>.*)$', serve, {
-        'document_root': settings.MEDIA_ROOT,
-    }),
+    re_path(r'^media/(?P<path>.*)$', media),
 ]
 
 for old_url, new_url in old_redirects.items():
@@ -0,0 +1,177 @@
+# analytics/beacon.py
+import json
+from collections import Counter
+from urllib.parse import parse_qsl, urlencode
+
+from django.db import router, transaction
+from django.db.models import F
+from django.utils import timezone
+
+from artworks.models import Artwork
+from blog.models import BlogPost
+from .hll import HyperLogLog
+from .models import (
+    ArtworkDailyViews, ArtworkView, BlogPostDailyViews, BlogPostView, CatalogQueryDaily, EngagementEvent,
+    SkippedViewsDaily,
+)
+
+# Ограничения пачки: sendBeacon сам по себе ограничен ~64 КБ
+MAX_PAYLOAD_BYTES = 16 * 1024
+MAX_EVENTS = 50
+# Больше часа на одной странице - скорее забытая вкладка
+MAX_TIME_ON_PAGE = 3600
+
+EVENT_TYPES = {'view', 'zoom', 'time'}
+TARGETS = {
+    'artwork': (Artwork, ArtworkView, ArtworkDailyViews),
+    'post': (BlogPost, BlogPostView, BlogPostDailyViews),
+}
+# Сколько последних просмотров помнить в сессии, чтобы не считать повторные
+SESSION_VIEWED_LIMIT = 50
+
+# Параметры каталога, по которым запоминаются популярные запросы (page и прочее отбрасываются)
+CATALOG_PARAMS = {'q', 'status', 'category', 'theme', 'collection', 'size', 'price_min', 'price_max', 'order', 'per_page'}
+MAX_CATALOG_QUERY_LENGTH = 300
+
+
+def normalize_catalog_query(query):
+    """Строка запроса каталога с параметрами фильтров по алфавиту, None - если слишком длинная"""
+    pairs = sorted(
+        (key, value.strip()) for key, value in parse_qsl(query.lstrip('?'))
+        if key in CATALOG_PARAMS and value.strip()
+    )
+    normalized = urlencode(pairs)
+    return normalized if len(normalized) <= MAX_CATALOG_QUERY_LENGTH else None
+
+
+def parse_events(body):
+    """
+    Разбирает тело beacon: {"events": [{"type": "view", "artwork": 1}, ...]}.
+
+    Возвращает список (type, target, id, value), отбрасывая всё, что не похоже
+    на событие, - ответ клиенту всё равно не нужен. Открытие каталога
+    {"type": "catalog", "query": "theme=1"} - ('catalog', None, запрос, 0).
+    """
+    if len(body) > MAX_PAYLOAD_BYTES:
+        return []
+    try:
+        payload = json.loads(body)
+    except (ValueError, UnicodeDecodeError):
+        return []
+
+    events = payload.get('events') if isinstance(payload, dict) else None
+    if not isinstance(events, list):
+        return []
+
+    parsed = []
+    for event in events[:MAX_EVENTS]:
+        if not isinstance(event, dict):
+            continue
+        if event.get('type') == 'catalog' and isinstance(event.get('query'), str):
+            query = normalize_catalog_query(event['query'])
+            if query is not None:
+                parsed.append(('catalog', None, query, 0))
+            continue
+        if event.get('type') not in EVENT_TYPES:
+            continue
+        for target in TARGETS:
+            object_id = event.get(target)
+            if isinstance(object_id, int) and not isinstance(object_id, bool) and object_id > 0:
+                break
+        else:
+            continue
+
+        value = event.get('value', 0)
+        if not isinstance(value, (int, float)) or isinstance(value, bool) or value < 0:
+            value = 0
+        if event['type'] == 'time':
+            value = min(int(value), MAX_TIME_ON_PAGE)
+            if not value:
+                continue
+        parsed.append((event['type'], target, object_id, int(value)))
+    return parsed
+
+
+def add_visitor(rollup_model, target, object_id, visitor):
+    """Добавляет посетителя в суточный скетч уникальных"""
+    rollup, _ = rollup_model.objects.select_for_update().get_or_create(
+        **{f'{target}_id': object_id, 'day': timezone.localdate()}
+    )
+    sketch = HyperLogLog.from_bytes(rollup.visitors)
+    if sketch.add(visitor):
+        rollup.visitors = sketch.to_bytes()
+        rollup.save(update_fields=['visitors'])
+
+
+def add_catalog_query(query, hits=1):
+    """Счётчик открытий каталога с этими фильтрами за сегодня"""
+    rollup, created = CatalogQueryDaily.objects.select_for_update().get_or_create(
+        query=query, day=timezone.localdate(), defaults={'hits': hits}
+    )
+    if not created:
+        CatalogQueryDaily.objects.filter(pk=rollup.pk).update(hits=F('hits') + hits)
+
+
+def record_skipped(reason, events):
+    """Учёт запроса, который не засчитан: робот, сервис или запрос без User-Agent"""
+    views = sum(1 for event_type, *_ in events if event_type == 'view')
+    with transaction.atomic(using=router.db_for_write(SkippedViewsDaily)):
+        rollup, created = SkippedViewsDaily.objects.select_for_update().get_or_create(
+            day=timezone.localdate(), reason=reason, defaults={'requests': 1, 'views': views}
+        )
+        if not created:
+            SkippedViewsDaily.objects.filter(pk=rollup.pk).update(
+                requests=F('requests') + 1, views=F('views') + views
+            )
+
+
+def record_events(events, session, visitor=None):
+    """Проверяет id одной выборкой на модель и пишет события пачкой"""
+    existing = {}
+    for target, (model, _, _) in TARGETS.items():
+        ids = {object_id for _, event_target, object_id, _ in events if event_target == target}
+        existing[target] = set(model.objects.filter(id__in=ids).values_list('id', flat=True)) if ids else set()
+
+    views = {target: [] for target in TARGETS}
+    engagement = []
+    catalog_queries = Counter()
+    for event_type, target, object_id, value in events:
+        if event_type == 'catalog':
+            catalog_queries[object_id] += 1
+            continue
+        if object_id not in existing[target]:
+            continue
+        if event_type == 'view':
+            viewed = session.get(f'viewed_{target}s', [])
+            if object_id in viewed or object_id in views[target]:
+                continue
+            views[target].append(object_id)
+        else:
+            engagement.append(EngagementEvent(kind=event_type, value=value, **{f'{target}_id': object_id}))
+
+    # Журналы могут жить в отдельной базе: транзакция - по ней,
+    # счётчики просмотров картин и постов обновляются атомарными UPDATE
+    with transaction.atomic(using=router.db_for_write(EngagementEvent)):
+        for target, (model, log_model, rollup_model) in TARGETS.items():
+            object_ids = views[target]
+            if not object_ids:
+                continue
+            log_model.objects.bulk_create([log_model(**{f'{target}_id': object_id}) for object_id in object_ids])
+            # update() не трогает updated_at - валидаторы кэша страниц не меняются
+            model.objects.filter(id__in=object_ids).update(views=F('views') + 1)
+            if visitor:
+                for object_id in object_ids:
+                    add_visitor(rollup_model, target, object_id, visitor)
+
+            key = f'viewed_{target}s'
+            session[key] = (session.get(key, []) + object_ids)[-SESSION_VIEWED_LIMIT:]
+
+        EngagementEvent.objects.bulk_create(engagement)
+        for query, hits in catalog_queries.items():
+            add_catalog_query(query, hits)
+
+    return (
+        sum(len(object_ids) for object_ids in views.values())
+        + len(engagement)
+        + sum(catalog_queries.values())
+    )
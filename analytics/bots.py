@@ -0,0 +1,49 @@
+# analytics/bots.py
+import re
+from functools import lru_cache
+
+# Подстроки User-Agent поисковых роботов, превью соцсетей, мониторинга и HTTP-библиотек.
+# "bot" - только как отдельное слово или имя продукта с версией (Googlebot/2.1):
+# просто окончание bot есть и в названиях телефонов (Cubot)
+BOT_PATTERNS = [
+    r'\bbot\b', r'bot/', r'slackbot', r'telegrambot',
+    # Ссылка на описание робота: (compatible; SomeCrawler/1.0; +https://example.com/bot)
+    r'\+https?://',
+    r'crawl', r'spider', r'slurp', r'mediapartners', r'bingpreview',
+    r'yandex(?:images|metrika|favicons|video|media|turbo|direct|webmaster|pagechecker)',
+    r'facebookexternalhit', r'whatsapp/', r'vkshare', r'skypeuripreview', r'embedly',
+    r'quora link preview', r'preview', r'lighthouse', r'pagespeed', r'gtmetrix', r'pingdom',
+    r'uptime', r'monitor', r'headlesschrome', r'phantomjs', r'python-requests',
+    r'python-urllib', r'aiohttp', r'httpx', r'curl/', r'wget', r'go-http-client',
+    r'java/', r'okhttp', r'axios', r'node-fetch', r'scrapy',
+    # Собственный прогрев кэша (artworks/warmup.py)
+    r'irenfantasyart-warmup',
+]
+BOT_RE = re.compile('|'.join(BOT_PATTERNS), re.IGNORECASE)
+MAX_USER_AGENT_LENGTH = 512
+
+REASON_BOT = 'bot'
+REASON_NO_USER_AGENT = 'no_user_agent'
+
+
+@lru_cache(maxsize=2048)
+def is_bot_user_agent(user_agent):
+    """Вердикт по User-Agent; у посетителей набор строк небольшой - повторные проверки из кэша"""
+    return BOT_RE.search(user_agent) is not None
+
+
+def skip_reason(request):
+    """
+    Причина не считать запрос просмотром или None, если это обычный посетитель.
+
+    Предзагрузку здесь не распознать: Sec-Purpose/Purpose приходят только с
+    запросом самой страницы, а не с beacon. Заранее загруженная страница
+    скриптов не выполняет (prefetch) или откладывает beacon до перехода на
+    неё (prerender, см. beacon.js).
+    """
+    user_agent = request.META.get('HTTP_USER_AGENT', '').strip()[:MAX_USER_AGENT_LENGTH]
+    if not user_agent:
+        return REASON_NO_USER_AGENT
+    if is_bot_user_agent(user_agent):
+        return REASON_BOT
+    return None
@@ -0,0 +1,118 @@
+# analytics/export.py
+import csv
+import datetime
+import json
+import zlib
+
+from django.utils import timezone
+
+from .hll import HyperLogLog
+from .models import ArtworkDailyViews, ArtworkView, BlogPostDailyViews, BlogPostView
+
+CHUNK_SIZE = 2000
+# Строки копятся до этого размера и отдаются (или сжимаются) одним куском
+BLOCK_SIZE = 64 * 1024
+FORMATS = {
+    'csv': 'text/csv; charset=utf-8',
+    'ndjson': 'application/x-ndjson',
+}
+
+
+class Dataset:
+    """Выгружаемая таблица: журнал просмотров или суточные итоги"""
+
+    def __init__(self, model, columns, is_rollup=False):
+        self.model = model
+        self.columns = columns
+        self.is_rollup = is_rollup
+
+    @property
+    def header(self):
+        # Вместо HLL-скетча в итогах - оценка числа уникальных посетителей
+        return [('uniques' if column == 'visitors' else column) for column in self.columns]
+
+    def queryset(self, start, end):
+        """Записи с start по end включительно (локальные даты)"""
+        if self.is_rollup:
+            queryset = self.model.objects.filter(day__gte=start, day__lte=end).order_by('day', 'id')
+        else:
+            tz = timezone.get_current_timezone()
+            since = datetime.datetime.combine(start, datetime.time.min, tz)
+            until = datetime.datetime.combine(end + datetime.timedelta(days=1), datetime.time.min, tz)
+            queryset = self.model.objects.filter(viewed_at__gte=since, viewed_at__lt=until).order_by('id')
+        return queryset.values_list(*self.columns)
+
+    def rows(self, start, end, chunk_size=CHUNK_SIZE):
+        """Строки по одной: в памяти не больше chunk_size записей из БД"""
+        for row in self.queryset(start, end).iterator(chunk_size=chunk_size):
+            if self.is_rollup:
+                *values, visitors = row
+                row = (*values, HyperLogLog.from_bytes(visitors).count() if visitors else 0)
+            yield row
+
+
+DATASETS = {
+    'artwork_views': Dataset(ArtworkView, ('id', 'artwork_id', 'viewed_at')),
+    'post_views': Dataset(BlogPostView, ('id', 'post_id', 'viewed_at')),
+    'artwork_daily': Dataset(ArtworkDailyViews, ('artwork_id', 'day', 'views', 'visitors'), is_rollup=True),
+    'post_daily': Dataset(BlogPostDailyViews, ('post_id', 'day', 'views', 'visitors'), is_rollup=True),
+}
+
+
+def _value(value):
+    return value.isoformat() if isinstance(value, (datetime.date, datetime.datetime)) else value
+
+
+class _Line:
+    """Файлоподобный объект для csv.writer: возвращает строку вместо записи"""
+
+    def write(self, value):
+        return value
+
+
+def csv_lines(header, rows):
+    writer = csv.writer(_Line())
+    yield writer.writerow(header)
+    for row in rows:
+        yield writer.writerow([_value(value) for value in row])
+
+
+def ndjson_lines(header, rows):
+    for row in rows:
+        yield json.dumps(dict(zip(header, map(_value, row))), ensure_ascii=False) + '\n'
+
+
+def blocks(lines, block_size=BLOCK_SIZE):
+    """Склеивает строки в куски по ~block_size байт"""
+    buffer, size = [], 0
+    for line in lines:
+        data = line.encode('utf-8')
+        buffer.append(data)
+        size += len(data)
+        if size >= block_size:
+            yield b''.join(buffer)
+            buffer, size = [], 0
+    if buffer:
+        yield b''.join(buffer)
+
+
+def gzipped(chunks):
+    """Потоковое gzip-сжатие: каждый кусок сжимается сразу, файл целиком не собирается"""
+    compressor = zlib.compressobj(6, zlib.DEFLATED, 31)
+    for chunk in chunks:
+        data = compressor.compress(chunk)
+        if data:
+            yield data
+    yield compressor.flush()
+
+
+def export_chunks(dataset, start, end, fmt='csv', compress=False, chunk_size=CHUNK_SIZE):
+    """Выгрузка набора dataset за период кусками байт (для StreamingHttpResponse и файла)"""
+    dataset = DATASETS[dataset]
+    lines = (csv_lines if fmt == 'csv' else ndjson_lines)(dataset.header, dataset.rows(start, end, chunk_size))
+    chunks = blocks(lines)
+    return gzipped(chunks) if compress else chunks
+
+
+def filename(dataset, start, end, fmt, compress=False):
+    return f"{dataset}-{start:%Y%m%d}-{end:%Y%m%d}.{fmt}{'.gz' if compress else ''}"
@@ -0,0 +1,46 @@
+# analytics/management/commands/export_analytics.py
+import sys
+from datetime import date, timedelta
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+from analytics.export import CHUNK_SIZE, DATASETS, FORMATS, export_chunks, filename
+
+
+class Command(BaseCommand):
+    help = (
+        "Выгружает журналы просмотров и суточные итоги за период в CSV или NDJSON "
+        "(по желанию gzip) потоком, без загрузки в память"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('dataset', choices=sorted(DATASETS))
+        parser.add_argument('--start', type=date.fromisoformat, help="Первый день (ГГГГ-ММ-ДД), по умолчанию 30 дней назад")
+        parser.add_argument('--end', type=date.fromisoformat, help="Последний день включительно, по умолчанию сегодня")
+        parser.add_argument('--format', choices=sorted(FORMATS), default='csv')
+        parser.add_argument('--gzip', action='store_true')
+        parser.add_argument('--chunk-size', type=int, default=CHUNK_SIZE, help="Записей за одно чтение из БД")
+        parser.add_argument('--output', help="Файл (по умолчанию имя по набору и периоду, '-' - stdout)")
+
+    def handle(self, *args, **options):
+        end = options['end'] or timezone.localdate()
+        start = options['start'] or end - timedelta(days=29)
+        if start > end:
+            raise CommandError("Начало периода позже конца")
+
+        fmt, compress = options['format'], options['gzip']
+        chunks = export_chunks(options['dataset'], start, end, fmt, compress, options['chunk_size'])
+        output = options['output'] or filename(options['dataset'], start, end, fmt, compress)
+
+        written = 0
+        if output == '-':
+            for chunk in chunks:
+                sys.stdout.buffer.write(chunk)
+            sys.stdout.buffer.flush()
+            return
+        with open(output, 'wb') as f:
+            for chunk in chunks:
+                f.write(chunk)
+                written += len(chunk)
+        self.stdout.write(self.style.SUCCESS(f"{output}: {written / 1024:.0f} КБ"))
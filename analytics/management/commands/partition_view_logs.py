@@ -0,0 +1,21 @@
+# analytics/management/commands/partition_view_logs.py
+from django.core.management.base import BaseCommand, CommandError
+
+from analytics.retention import VIEW_LOGS
+
+
+class Command(BaseCommand):
+    help = (
+        "Переводит журналы просмотров на месячные партиции PostgreSQL, "
+        "после чего prune_view_logs удаляет старые месяцы через DROP партиции"
+    )
+
+    def handle(self, *args, **options):
+        for log in VIEW_LOGS:
+            if log.connection.vendor != 'postgresql':
+                raise CommandError("Партиционирование доступно только на PostgreSQL")
+            if log.is_partitioned():
+                self.stdout.write(f"{log.table}: уже разбита на партиции")
+                continue
+            log.partition()
+            self.stdout.write(self.style.SUCCESS(f"{log.table}: разбита на партиции по месяцам"))
@@ -0,0 +1,51 @@
+# analytics/management/commands/prune_view_logs.py
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from analytics.models import CatalogQueryDaily, SkippedViewsDaily
+from analytics.retention import BATCH_SIZE, VIEW_LOGS, local_day, retention_cutoff
+
+
+class Command(BaseCommand):
+    help = (
+        "Сворачивает журналы просмотров старше срока хранения в суточные итоги, "
+        "архивирует их в gzip NDJSON и удаляет пачками"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--days', type=int, default=settings.VIEW_LOG_RETENTION_DAYS,
+            help="Сколько дней хранить подробный журнал"
+        )
+        parser.add_argument(
+            '--archive-dir', default=str(settings.VIEW_LOG_ARCHIVE_DIR),
+            help="Каталог архива (пустая строка - без архива)"
+        )
+        parser.add_argument('--batch-size', type=int, default=BATCH_SIZE, help="Записей в одной транзакции")
+        parser.add_argument('--dry-run', action='store_true', help="Только посчитать, ничего не удалять")
+
+    def handle(self, *args, **options):
+        cutoff = retention_cutoff(options['days'])
+        archive_dir = options['archive_dir'] or None
+
+        # Счётчики запросов каталога нужны только warm_cache за последние дни
+        old_queries = CatalogQueryDaily.objects.filter(day__lt=local_day(cutoff))
+
+        for log in VIEW_LOGS:
+            name = log.model._meta.verbose_name_plural
+            if options['dry_run']:
+                self.stdout.write(f"{name}: к удалению {log.count_expired(cutoff)}")
+                continue
+
+            if log.is_partitioned():
+                log.ensure_partitions()
+            pruned = log.prune(cutoff, archive_dir, options['batch_size'])
+            self.stdout.write(self.style.SUCCESS(f"{name}: удалено {pruned}"))
+
+        old_skipped = SkippedViewsDaily.objects.filter(day__lt=local_day(cutoff))
+        for name, queryset in (("Запросы каталога", old_queries), ("Пропущенные просмотры", old_skipped)):
+            if options['dry_run']:
+                self.stdout.write(f"{name}: к удалению {queryset.count()}")
+            else:
+                deleted, _ = queryset.delete()
+                self.stdout.write(self.style.SUCCESS(f"{name}: удалено {deleted}"))
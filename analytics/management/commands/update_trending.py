@@ -0,0 +1,15 @@
+# analytics/management/commands/update_trending.py
+from django.core.management.base import BaseCommand
+
+from analytics.trending import update_trending_scores
+
+
+class Command(BaseCommand):
+    help = "Пересчитывает популярность картин и постов с затуханием по журналам просмотров (запускать по cron)"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--half-life', type=float, help="Период полураспада в днях")
+
+    def handle(self, *args, **options):
+        updated = update_trending_scores(half_life_days=options['half_life'])
+        self.stdout.write(self.style.SUCCESS(f"Обновлено записей: {updated}"))
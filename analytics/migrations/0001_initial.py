@@ -18,7 +18,7 @@ class Migration(migrations.Migration):
             fields=[
                 ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
                 ('viewed_at', models.DateTimeField(auto_now_add=True, verbose_name='Время просмотра')),
-                ('artwork', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='views_log', to='artworks.artwork', verbose_name='Картина')),
+                ('artwork', models.ForeignKey(db_constraint=False, on_delete=django.db.models.deletion.CASCADE, related_name='views_log', to='artworks.artwork', verbose_name='Картина')),
             ],
             options={
                 'verbose_name': 'Просмотр',
@@ -17,7 +17,7 @@ class Migration(migrations.Migration):
             fields=[
                 ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
                 ('viewed_at', models.DateTimeField(auto_now_add=True, verbose_name='Время просмотра')),
-                ('post', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='views_log', to='blog.blogpost', verbose_name='Пост блога')),
+                ('post', models.ForeignKey(db_constraint=False, on_delete=django.db.models.deletion.CASCADE, related_name='views_log', to='blog.blogpost', verbose_name='Пост блога')),
             ],
             options={
                 'verbose_name': 'Просмотр поста',
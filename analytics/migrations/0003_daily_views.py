@@ -0,0 +1,48 @@
+# Generated by Django 6.0.1 on 2026-10-19 10:00
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('analytics', '0002_blogpostview'),
+        ('artworks', '0003_content_hash_storage'),
+        ('blog', '0004_content_hash_storage'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ArtworkDailyViews',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('day', models.DateField(verbose_name='День')),
+                ('views', models.PositiveIntegerField(default=0, verbose_name='Просмотры')),
+                ('artwork', models.ForeignKey(db_constraint=False, on_delete=django.db.models.deletion.CASCADE, related_name='daily_views', to='artworks.artwork', verbose_name='Картина')),
+            ],
+            options={
+                'verbose_name': 'Просмотры картины за день',
+                'verbose_name_plural': 'Просмотры картин по дням',
+                'ordering': ['-day'],
+                'indexes': [models.Index(fields=['day'], name='analytics_a_day_b4993d_idx')],
+                'constraints': [models.UniqueConstraint(fields=('artwork', 'day'), name='analytics_artwork_daily_uniq')],
+            },
+        ),
+        migrations.CreateModel(
+            name='BlogPostDailyViews',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('day', models.DateField(verbose_name='День')),
+                ('views', models.PositiveIntegerField(default=0, verbose_name='Просмотры')),
+                ('post', models.ForeignKey(db_constraint=False, on_delete=django.db.models.deletion.CASCADE, related_name='daily_views', to='blog.blogpost', verbose_name='Пост блога')),
+            ],
+            options={
+                'verbose_name': 'Просмотры поста за день',
+                'verbose_name_plural': 'Просмотры постов по дням',
+                'ordering': ['-day'],
+                'indexes': [models.Index(fields=['day'], name='analytics_b_day_e87286_idx')],
+                'constraints': [models.UniqueConstraint(fields=('post', 'day'), name='analytics_post_daily_uniq')],
+            },
+        ),
+    ]
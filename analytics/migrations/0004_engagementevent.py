@@ -0,0 +1,33 @@
+# Generated by Django 6.0.1 on 2026-10-19 10:00
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('analytics', '0003_daily_views'),
+        ('artworks', '0003_content_hash_storage'),
+        ('blog', '0004_content_hash_storage'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='EngagementEvent',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kind', models.CharField(choices=[('zoom', 'Увеличение изображения'), ('time', 'Время на странице')], max_length=10, verbose_name='Событие')),
+                ('value', models.PositiveIntegerField(default=0, verbose_name='Значение')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='Время события')),
+                ('artwork', models.ForeignKey(blank=True, db_constraint=False, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='engagement_events', to='artworks.artwork', verbose_name='Картина')),
+                ('post', models.ForeignKey(blank=True, db_constraint=False, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='engagement_events', to='blog.blogpost', verbose_name='Пост блога')),
+            ],
+            options={
+                'verbose_name': 'Событие вовлечённости',
+                'verbose_name_plural': 'События вовлечённости',
+                'ordering': ['-created_at'],
+                'indexes': [models.Index(fields=['created_at'], name='analytics_e_created_101835_idx'), models.Index(fields=['kind', 'created_at'], name='analytics_e_kind_c0a564_idx')],
+            },
+        ),
+    ]
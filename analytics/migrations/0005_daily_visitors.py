@@ -0,0 +1,23 @@
+# Generated by Django 6.0.1 on 2026-10-19 10:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('analytics', '0004_engagementevent'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='artworkdailyviews',
+            name='visitors',
+            field=models.BinaryField(default=b'', verbose_name='Уникальные посетители (HLL)'),
+        ),
+        migrations.AddField(
+            model_name='blogpostdailyviews',
+            name='visitors',
+            field=models.BinaryField(default=b'', verbose_name='Уникальные посетители (HLL)'),
+        ),
+    ]
@@ -0,0 +1,46 @@
+# Generated by Django 6.0.1 on 2026-10-19 10:00
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('analytics', '0005_daily_visitors'),
+        ('artworks', '0005_collection_summary'),
+        ('blog', '0005_trending_score'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='artworkdailyviews',
+            name='artwork',
+            field=models.ForeignKey(db_constraint=False, on_delete=django.db.models.deletion.DO_NOTHING, related_name='daily_views', to='artworks.artwork', verbose_name='Картина'),
+        ),
+        migrations.AlterField(
+            model_name='artworkview',
+            name='artwork',
+            field=models.ForeignKey(db_constraint=False, on_delete=django.db.models.deletion.DO_NOTHING, related_name='views_log', to='artworks.artwork', verbose_name='Картина'),
+        ),
+        migrations.AlterField(
+            model_name='blogpostdailyviews',
+            name='post',
+            field=models.ForeignKey(db_constraint=False, on_delete=django.db.models.deletion.DO_NOTHING, related_name='daily_views', to='blog.blogpost', verbose_name='Пост блога'),
+        ),
+        migrations.AlterField(
+            model_name='blogpostview',
+            name='post',
+            field=models.ForeignKey(db_constraint=False, on_delete=django.db.models.deletion.DO_NOTHING, related_name='views_log', to='blog.blogpost', verbose_name='Пост блога'),
+        ),
+        migrations.AlterField(
+            model_name='engagementevent',
+            name='artwork',
+            field=models.ForeignKey(blank=True, db_constraint=False, null=True, on_delete=django.db.models.deletion.DO_NOTHING, related_name='engagement_events', to='artworks.artwork', verbose_name='Картина'),
+        ),
+        migrations.AlterField(
+            model_name='engagementevent',
+            name='post',
+            field=models.ForeignKey(blank=True, db_constraint=False, null=True, on_delete=django.db.models.deletion.DO_NOTHING, related_name='engagement_events', to='blog.blogpost', verbose_name='Пост блога'),
+        ),
+    ]
@@ -0,0 +1,28 @@
+# Generated by Django 6.0.1 on 2026-10-19 10:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('analytics', '0006_cross_database_relations'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CatalogQueryDaily',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('query', models.CharField(blank=True, max_length=300, verbose_name='Параметры каталога')),
+                ('day', models.DateField(verbose_name='День')),
+                ('hits', models.PositiveIntegerField(default=0, verbose_name='Открытий')),
+            ],
+            options={
+                'verbose_name': 'Запрос каталога за день',
+                'verbose_name_plural': 'Запросы каталога по дням',
+                'indexes': [models.Index(fields=['day'], name='analytics_c_day_ab639a_idx')],
+                'constraints': [models.UniqueConstraint(fields=('query', 'day'), name='analytics_catalog_query_uniq')],
+            },
+        ),
+    ]
@@ -0,0 +1,28 @@
+# Generated by Django 6.0.1 on 2026-10-19 10:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('analytics', '0007_catalog_query_daily'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SkippedViewsDaily',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('day', models.DateField(verbose_name='День')),
+                ('reason', models.CharField(choices=[('bot', 'Роботы и сервисы'), ('prefetch', 'Предзагрузка'), ('no_user_agent', 'Без User-Agent')], max_length=20, verbose_name='Причина')),
+                ('requests', models.PositiveIntegerField(default=0, verbose_name='Запросов')),
+                ('views', models.PositiveIntegerField(default=0, verbose_name='Просмотров')),
+            ],
+            options={
+                'verbose_name': 'Пропущенные просмотры за день',
+                'verbose_name_plural': 'Пропущенные просмотры по дням',
+                'constraints': [models.UniqueConstraint(fields=('day', 'reason'), name='analytics_skipped_views_uniq')],
+            },
+        ),
+    ]
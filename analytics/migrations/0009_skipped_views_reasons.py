@@ -0,0 +1,18 @@
+# Generated by Django 6.0.1 on 2026-10-19 10:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('analytics', '0008_skipped_views_daily'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='skippedviewsdaily',
+            name='reason',
+            field=models.CharField(choices=[('bot', 'Роботы и сервисы'), ('no_user_agent', 'Без User-Agent')], max_length=20, verbose_name='Причина'),
+        ),
+    ]
@@ -2,10 +2,16 @@ from django.db import models
 from artworks.models import Artwork
 from blog.models import BlogPost
 
+# Аналитика может жить в отдельной базе (IrenFantasyArt/db_router.py), поэтому
+# ссылки на картины и посты - без ограничений в БД и без каскада Django:
+# записи удаляются сигналами из analytics/signals.py
+
+
 class BlogPostView(models.Model):
     post = models.ForeignKey(
         BlogPost,
-        on_delete=models.CASCADE,
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
         related_name='views_log',
         verbose_name="Пост блога"
     )
@@ -25,7 +31,8 @@ class BlogPostView(models.Model):
 class ArtworkView(models.Model):
     artwork = models.ForeignKey(
         Artwork,
-        on_delete=models.CASCADE,
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
         related_name='views_log',
         verbose_name="Картина"
     )
@@ -40,4 +47,151 @@ class ArtworkView(models.Model):
         ]
 
     def __str__(self):
-        return f"{self.artwork.title} - {self.viewed_at}"
\ No newline at end of file
+        return f"{self.artwork.title} - {self.viewed_at}"
+
+class ArtworkDailyViews(models.Model):
+    """
+    Суточные итоги по картины: просмотры, перенесённые из журнала
+    при очистке, и скетч HyperLogLog уникальных посетителей за день
+    """
+    artwork = models.ForeignKey(
+        Artwork,
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        related_name='daily_views',
+        verbose_name="Картина"
+    )
+    day = models.DateField(verbose_name="День")
+    views = models.PositiveIntegerField(default=0, verbose_name="Просмотры")
+    visitors = models.BinaryField(default=b'', editable=False, verbose_name="Уникальные посетители (HLL)")
+
+    class Meta:
+        verbose_name = "Просмотры картины за день"
+        verbose_name_plural = "Просмотры картин по дням"
+        ordering = ['-day']
+        constraints = [
+            models.UniqueConstraint(fields=['artwork', 'day'], name='analytics_artwork_daily_uniq'),
+        ]
+        indexes = [
+            models.Index(fields=['day']),
+        ]
+
+    def __str__(self):
+        return f"{self.artwork_id} - {self.day}: {self.views}"
+
+
+class BlogPostDailyViews(models.Model):
+    """
+    Суточные итоги по поста: просмотры, перенесённые из журнала
+    при очистке, и скетч HyperLogLog уникальных посетителей за день
+    """
+    post = models.ForeignKey(
+        BlogPost,
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        related_name='daily_views',
+        verbose_name="Пост блога"
+    )
+    day = models.DateField(verbose_name="День")
+    views = models.PositiveIntegerField(default=0, verbose_name="Просмотры")
+    visitors = models.BinaryField(default=b'', editable=False, verbose_name="Уникальные посетители (HLL)")
+
+    class Meta:
+        verbose_name = "Просмотры поста за день"
+        verbose_name_plural = "Просмотры постов по дням"
+        ordering = ['-day']
+        constraints = [
+            models.UniqueConstraint(fields=['post', 'day'], name='analytics_post_daily_uniq'),
+        ]
+        indexes = [
+            models.Index(fields=['day']),
+        ]
+
+    def __str__(self):
+        return f"{self.post_id} - {self.day}: {self.views}"
+
+
+class EngagementEvent(models.Model):
+    """Вовлечённость на странице: увеличение изображения, время чтения/просмотра"""
+    KIND_CHOICES = [
+        ('zoom', 'Увеличение изображения'),
+        ('time', 'Время на странице'),
+    ]
+
+    kind = models.CharField(max_length=10, choices=KIND_CHOICES, verbose_name="Событие")
+    artwork = models.ForeignKey(
+        Artwork,
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        null=True,
+        blank=True,
+        related_name='engagement_events',
+        verbose_name="Картина"
+    )
+    post = models.ForeignKey(
+        BlogPost,
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        null=True,
+        blank=True,
+        related_name='engagement_events',
+        verbose_name="Пост блога"
+    )
+    # Секунды для 'time', номер изображения для 'zoom'
+    value = models.PositiveIntegerField(default=0, verbose_name="Значение")
+    created_at = models.DateTimeField(auto_now_add=True, verbose_name="Время события")
+
+    class Meta:
+        verbose_name = "Событие вовлечённости"
+        verbose_name_plural = "События вовлечённости"
+        ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['created_at']),
+            models.Index(fields=['kind', 'created_at']),
+        ]
+
+    def __str__(self):
+        return f"{self.get_kind_display()} - {self.created_at}"
+
+
+class CatalogQueryDaily(models.Model):
+    """Сколько раз за день открывали каталог с этим набором фильтров (для warm_cache)"""
+    # Нормализованная строка запроса: только параметры фильтров, по алфавиту
+    query = models.CharField(max_length=300, blank=True, verbose_name="Параметры каталога")
+    day = models.DateField(verbose_name="День")
+    hits = models.PositiveIntegerField(default=0, verbose_name="Открытий")
+
+    class Meta:
+        verbose_name = "Запрос каталога за день"
+        verbose_name_plural = "Запросы каталога по дням"
+        constraints = [
+            models.UniqueConstraint(fields=['query', 'day'], name='analytics_catalog_query_uniq'),
+        ]
+        indexes = [
+            models.Index(fields=['day']),
+        ]
+
+    def __str__(self):
+        return f"{self.query or '(без фильтров)'} - {self.day}: {self.hits}"
+
+
+class SkippedViewsDaily(models.Model):
+    """Запросы /analytics/collect от роботов и сервисов, которые не засчитаны (analytics/bots.py)"""
+    REASON_CHOICES = [
+        ('bot', 'Роботы и сервисы'),
+        ('no_user_agent', 'Без User-Agent'),
+    ]
+    day = models.DateField(verbose_name="День")
+    reason = models.CharField(max_length=20, choices=REASON_CHOICES, verbose_name="Причина")
+    requests = models.PositiveIntegerField(default=0, verbose_name="Запросов")
+    views = models.PositiveIntegerField(default=0, verbose_name="Просмотров")
+
+    class Meta:
+        verbose_name = "Пропущенные просмотры за день"
+        verbose_name_plural = "Пропущенные просмотры по дням"
+        constraints = [
+            models.UniqueConstraint(fields=['day', 'reason'], name='analytics_skipped_views_uniq'),
+        ]
+
+    def __str__(self):
+        return f"{self.day} {self.get_reason_display()}: {self.views}"
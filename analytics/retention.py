@@ -0,0 +1,270 @@
+# analytics/retention.py
+import datetime
+import gzip
+import json
+import re
+from collections import Counter
+from pathlib import Path
+
+from django.db import connections, router, transaction
+from django.utils import timezone
+
+from .models import ArtworkDailyViews, ArtworkView, BlogPostDailyViews, BlogPostView
+
+BATCH_SIZE = 5000
+# Сколько месяцев вперёд держать готовые партиции
+PARTITIONS_AHEAD = 2
+
+PARTITION_RE = re.compile(r'_y(\d{4})m(\d{2})$')
+
+
+def month_start(value):
+    return datetime.date(value.year, value.month, 1)
+
+
+def next_month(day):
+    return datetime.date(day.year + day.month // 12, day.month % 12 + 1, 1)
+
+
+def local_day(value):
+    return timezone.localtime(value).date() if timezone.is_aware(value) else value.date()
+
+
+class ViewLog:
+    """
+    Журнал просмотров (ArtworkView/BlogPostView) и его суточные итоги.
+
+    Старые записи сворачиваются в итоги по дням, выгружаются в архив
+    (gzip NDJSON, файл на месяц) и удаляются пачками по batch_size,
+    каждая пачка - в своей транзакции. На PostgreSQL с партициями
+    по месяцам целые месяцы удаляются через DETACH + DROP.
+    """
+
+    def __init__(self, model, fk, rollup_model):
+        self.model = model
+        self.fk = fk
+        self.fk_column = f'{fk}_id'
+        self.rollup_model = rollup_model
+
+    @property
+    def table(self):
+        return self.model._meta.db_table
+
+    @property
+    def db(self):
+        # Журналы могут жить в отдельной базе 'analytics'
+        return router.db_for_write(self.model)
+
+    @property
+    def connection(self):
+        return connections[self.db]
+
+    def partition_name(self, month):
+        return f'{self.table}_y{month.year:04d}m{month.month:02d}'
+
+    # --- Итоги и архив ---
+
+    def add_to_rollups(self, rows):
+        counts = Counter((fk_id, local_day(viewed_at)) for _, fk_id, viewed_at in rows)
+        if not counts:
+            return
+
+        existing = {
+            (getattr(rollup, self.fk_column), rollup.day): rollup
+            for rollup in self.rollup_model.objects.defer('visitors').filter(**{
+                f'{self.fk_column}__in': {fk_id for fk_id, _ in counts},
+                'day__in': {day for _, day in counts},
+            })
+        }
+        to_update, to_create = [], []
+        for (fk_id, day), views in counts.items():
+            rollup = existing.get((fk_id, day))
+            if rollup:
+                rollup.views += views
+                to_update.append(rollup)
+            else:
+                to_create.append(self.rollup_model(**{self.fk_column: fk_id, 'day': day, 'views': views}))
+
+        self.rollup_model.objects.bulk_update(to_update, ['views'], batch_size=BATCH_SIZE)
+        self.rollup_model.objects.bulk_create(to_create, batch_size=BATCH_SIZE)
+
+    def archive(self, rows, archive_dir):
+        by_month = {}
+        for pk, fk_id, viewed_at in rows:
+            by_month.setdefault(month_start(viewed_at), []).append(
+                {'id': pk, self.fk_column: fk_id, 'viewed_at': viewed_at.isoformat()}
+            )
+
+        archive_dir = Path(archive_dir)
+        archive_dir.mkdir(parents=True, exist_ok=True)
+        for month, records in by_month.items():
+            path = archive_dir / f'{self.model._meta.model_name}-{month:%Y-%m}.ndjson.gz'
+            # Дозапись добавляет новый gzip-член, gzip.open читает файл целиком
+            with gzip.open(path, 'at', encoding='utf-8') as f:
+                for record in records:
+                    f.write(json.dumps(record, ensure_ascii=False) + '\n')
+
+    def _retire(self, rows, archive_dir):
+        self.add_to_rollups(rows)
+        if archive_dir:
+            self.archive(rows, archive_dir)
+
+    # --- Очистка ---
+
+    def prune(self, cutoff, archive_dir=None, batch_size=BATCH_SIZE):
+        """Удаляет записи старше cutoff, возвращает их количество"""
+        pruned = 0
+        if self.is_partitioned():
+            pruned += self.drop_partitions(cutoff, archive_dir, batch_size)
+
+        queryset = self.model.objects.filter(viewed_at__lt=cutoff).order_by('id')
+        while True:
+            rows = list(queryset.values_list('id', self.fk_column, 'viewed_at')[:batch_size])
+            if not rows:
+                break
+            # Архив пишется последним: если он упадёт, итоги и удаление откатятся
+            with transaction.atomic(using=self.db):
+                self.model.objects.filter(id__in=[row[0] for row in rows]).delete()
+                self._retire(rows, archive_dir)
+            pruned += len(rows)
+        return pruned
+
+    def count_expired(self, cutoff):
+        return self.model.objects.filter(viewed_at__lt=cutoff).count()
+
+    # --- Партиции (только PostgreSQL) ---
+
+    def is_partitioned(self):
+        if self.connection.vendor != 'postgresql':
+            return False
+        with self.connection.cursor() as cursor:
+            cursor.execute(
+                'SELECT 1 FROM pg_partitioned_table p '
+                'JOIN pg_class c ON c.oid = p.partrelid '
+                'WHERE c.relname = %s AND pg_table_is_visible(c.oid)',
+                [self.table],
+            )
+            return cursor.fetchone() is not None
+
+    def monthly_partitions(self):
+        """{первое число месяца: имя партиции}"""
+        with self.connection.cursor() as cursor:
+            cursor.execute(
+                'SELECT c.relname FROM pg_inherits i '
+                'JOIN pg_class c ON c.oid = i.inhrelid '
+                'JOIN pg_class p ON p.oid = i.inhparent '
+                'WHERE p.relname = %s AND pg_table_is_visible(p.oid)',
+                [self.table],
+            )
+            names = [row[0] for row in cursor.fetchall()]
+
+        partitions = {}
+        for name in names:
+            match = PARTITION_RE.search(name)
+            if match:
+                partitions[datetime.date(int(match[1]), int(match[2]), 1)] = name
+        return partitions
+
+    def create_partition(self, cursor, month):
+        qn = self.connection.ops.quote_name
+        cursor.execute(
+            f'CREATE TABLE IF NOT EXISTS {qn(self.partition_name(month))} '
+            f'PARTITION OF {qn(self.table)} '
+            f"FOR VALUES FROM ('{month.isoformat()}') TO ('{next_month(month).isoformat()}')"
+        )
+
+    def ensure_partitions(self, ahead=PARTITIONS_AHEAD):
+        """Создаёт партиции на текущий и следующие месяцы, чтобы записи не попадали в DEFAULT"""
+        month = month_start(timezone.now())
+        with self.connection.cursor() as cursor:
+            for _ in range(ahead + 1):
+                self.create_partition(cursor, month)
+                month = next_month(month)
+
+    def drop_partitions(self, cutoff, archive_dir=None, batch_size=BATCH_SIZE):
+        """Удаляет месячные партиции, целиком лежащие до cutoff"""
+        qn = self.connection.ops.quote_name
+        dropped = 0
+        for month, name in sorted(self.monthly_partitions().items()):
+            end = next_month(month)
+            # Границы партиций в UTC-сессии Django, сравниваем с датой cutoff в UTC
+            if end > cutoff.astimezone(datetime.timezone.utc).date():
+                continue
+
+            with transaction.atomic(using=self.db):
+                with self.connection.cursor() as cursor:
+                    cursor.execute(f'SELECT id, {qn(self.fk_column)}, viewed_at FROM {qn(name)} ORDER BY id')
+                    while True:
+                        rows = cursor.fetchmany(batch_size)
+                        if not rows:
+                            break
+                        self._retire(rows, archive_dir)
+                        dropped += len(rows)
+                    cursor.execute(f'ALTER TABLE {qn(self.table)} DETACH PARTITION {qn(name)}')
+                    cursor.execute(f'DROP TABLE {qn(name)}')
+        return dropped
+
+    def partition(self, ahead=PARTITIONS_AHEAD):
+        """
+        Переводит обычную таблицу журнала на партиции по месяцам viewed_at.
+
+        Первичный ключ становится (id, viewed_at) - этого требует PostgreSQL.
+        Индексы пересоздаются с прежними именами Django.
+        """
+        qn = self.connection.ops.quote_name
+        table = self.table
+        old_table = f'{table}_unpartitioned'
+        sequence = f'{table}_partitioned_id_seq'
+        fields = [self.model._meta.pk, self.model._meta.get_field(self.fk), self.model._meta.get_field('viewed_at')]
+        columns = [field.column for field in fields]
+        column_list = ', '.join(qn(column) for column in columns)
+
+        with transaction.atomic(using=self.db), self.connection.schema_editor(atomic=False) as editor:
+            editor.execute(f'ALTER TABLE {qn(table)} RENAME TO {qn(old_table)}')
+            editor.execute(f'CREATE SEQUENCE {qn(sequence)}')
+
+            column_defs = [
+                f"{qn(fields[0].column)} {fields[0].rel_db_type(self.connection)} NOT NULL DEFAULT nextval('{sequence}')"
+            ]
+            column_defs += [f'{qn(field.column)} {field.db_type(self.connection)} NOT NULL' for field in fields[1:]]
+            editor.execute(
+                f'CREATE TABLE {qn(table)} ({", ".join(column_defs)}, '
+                f'PRIMARY KEY ({qn(columns[0])}, {qn(columns[2])})) '
+                f'PARTITION BY RANGE ({qn(columns[2])})'
+            )
+            editor.execute(f'ALTER SEQUENCE {qn(sequence)} OWNED BY {qn(table)}.{qn(columns[0])}')
+
+            with self.connection.cursor() as cursor:
+                cursor.execute(f'SELECT MIN(viewed_at) FROM {qn(old_table)}')
+                first = cursor.fetchone()[0]
+                month = month_start(first) if first else month_start(timezone.now())
+                last = month_start(timezone.now())
+                for _ in range(ahead):
+                    last = next_month(last)
+                while month <= last:
+                    self.create_partition(cursor, month)
+                    month = next_month(month)
+                cursor.execute(f'CREATE TABLE {qn(table + "_default")} PARTITION OF {qn(table)} DEFAULT')
+
+                cursor.execute(
+                    f'INSERT INTO {qn(table)} ({column_list}) SELECT {column_list} FROM {qn(old_table)}'
+                )
+                cursor.execute(
+                    f"SELECT setval('{sequence}', COALESCE(MAX({qn(columns[0])}), 0) + 1, false) FROM {qn(table)}"
+                )
+
+            # Старая таблица освобождает имена индексов и ограничений
+            editor.execute(f'DROP TABLE {qn(old_table)}')
+            editor.execute(editor._create_index_sql(self.model, fields=[fields[1]]))
+            for index in self.model._meta.indexes:
+                editor.add_index(self.model, index)
+
+
+VIEW_LOGS = [
+    ViewLog(ArtworkView, 'artwork', ArtworkDailyViews),
+    ViewLog(BlogPostView, 'post', BlogPostDailyViews),
+]
+
+
+def retention_cutoff(days):
+    return timezone.now() - datetime.timedelta(days=days)
@@ -0,0 +1,24 @@
+# analytics/signals.py
+from django.db.models.signals import post_delete
+from django.dispatch import receiver
+
+from artworks.models import Artwork
+from blog.models import BlogPost
+
+from .models import (
+    ArtworkDailyViews, ArtworkView, BlogPostDailyViews, BlogPostView, EngagementEvent,
+)
+
+# Вместо каскада Django: аналитика может лежать в другой базе
+RELATED_LOGS = {
+    Artwork: ('artwork', [ArtworkView, ArtworkDailyViews, EngagementEvent]),
+    BlogPost: ('post', [BlogPostView, BlogPostDailyViews, EngagementEvent]),
+}
+
+
+@receiver(post_delete, sender=Artwork)
+@receiver(post_delete, sender=BlogPost)
+def delete_analytics(sender, instance, **kwargs):
+    fk, models = RELATED_LOGS[sender]
+    for model in models:
+        model.objects.filter(**{f'{fk}_id': instance.pk}).delete()
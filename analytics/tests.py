@@ -1,3 +1,24 @@
-from django.test import TestCase
+from django.test import SimpleTestCase
 
-# Create your tests here.
+from .bots import is_bot_user_agent
+
+
+class BotUserAgentTests(SimpleTestCase):
+    def test_crawlers(self):
+        for user_agent in (
+            'Mozilla/5.0 (compatible; Googlebot/2.1; +http://www.google.com/bot.html)',
+            'Mozilla/5.0 (compatible; YandexBot/3.0; +http://yandex.com/bots)',
+            'TelegramBot (like TwitterBot)',
+            'curl/8.4.0',
+        ):
+            self.assertTrue(is_bot_user_agent(user_agent), user_agent)
+
+    def test_browsers(self):
+        # "bot" в названии телефона - не робот
+        for user_agent in (
+            'Mozilla/5.0 (Linux; Android 10; CUBOT X30) AppleWebKit/537.36 (KHTML, like Gecko) '
+            'Chrome/120.0 Mobile Safari/537.36',
+            'Mozilla/5.0 (iPhone; CPU iPhone OS 17_0 like Mac OS X) AppleWebKit/605.1.15 '
+            '(KHTML, like Gecko) Version/17.0 Mobile/15E148 Safari/604.1',
+        ):
+            self.assertFalse(is_bot_user_agent(user_agent), user_agent)
@@ -0,0 +1,86 @@
+# analytics/trending.py
+import math
+from datetime import timedelta
+from itertools import islice
+
+import numpy as np
+from django.conf import settings
+from django.utils import timezone
+
+from artworks.models import Artwork
+from blog.models import BlogPost
+from .models import ArtworkView, BlogPostView
+
+BATCH_SIZE = 5000
+# Просмотры старше HALF_LIVES периодов полураспада дают < 0.4% веса и не читаются
+HALF_LIVES = 8
+# Вес накопленных за всё время просмотров: заполняет блоки, пока свежих просмотров мало
+ALL_TIME_WEIGHT = 0.01
+
+TRENDING_TARGETS = [
+    (Artwork, ArtworkView, 'artwork'),
+    (BlogPost, BlogPostView, 'post'),
+]
+
+
+def decayed_counts(log_model, fk, now, half_life_days, batch_size=BATCH_SIZE):
+    """
+    Сумма весов просмотров 2^(-возраст / период полураспада) по каждому объекту.
+
+    Журнал читается пачками, веса считаются векторно и складываются
+    через np.bincount в массив, индексированный id объекта.
+    """
+    window_start = now - timedelta(days=half_life_days * HALF_LIVES)
+    now_ts = now.timestamp()
+    scores = np.zeros(0)
+
+    rows = (
+        log_model.objects
+        .filter(viewed_at__gte=window_start)
+        .order_by()
+        .values_list(f'{fk}_id', 'viewed_at')
+        .iterator(chunk_size=batch_size)
+    )
+    while True:
+        chunk = list(islice(rows, batch_size))
+        if not chunk:
+            break
+        ids = np.fromiter((object_id for object_id, _ in chunk), dtype=np.int64, count=len(chunk))
+        viewed = np.fromiter((viewed_at.timestamp() for _, viewed_at in chunk), dtype=np.float64, count=len(chunk))
+        ages = now_ts - viewed
+        weights = np.exp2(-np.maximum(ages, 0) / (half_life_days * 86400))
+
+        counts = np.bincount(ids, weights=weights)
+        if len(counts) > len(scores):
+            counts[:len(scores)] += scores
+            scores = counts
+        else:
+            scores[:len(counts)] += counts
+    return scores
+
+
+def update_trending_scores(now=None, half_life_days=None):
+    """Пересчитывает trending_score картин и постов, возвращает число обновлённых строк"""
+    now = now or timezone.now()
+    half_life_days = half_life_days or settings.TRENDING_HALF_LIFE_DAYS
+
+    updated = 0
+    for model, log_model, fk in TRENDING_TARGETS:
+        scores = decayed_counts(log_model, fk, now, half_life_days)
+
+        changed = []
+        for obj in model.objects.only('id', 'views', 'trending_score', 'trending_updated_at').order_by().iterator(chunk_size=BATCH_SIZE):
+            score = ALL_TIME_WEIGHT * math.log1p(obj.views)
+            if obj.id < len(scores):
+                score += float(scores[obj.id])
+            score = round(score, 6)
+            if score != obj.trending_score:
+                obj.trending_score = score
+                obj.trending_updated_at = now
+                changed.append(obj)
+
+        # bulk_update не вызывает save(): updated_at и сигналы не трогаются,
+        # смену порядка в блоках валидаторы кэша видят по trending_updated_at
+        model.objects.bulk_update(changed, ['trending_score', 'trending_updated_at'], batch_size=500)
+        updated += len(changed)
+    return updated
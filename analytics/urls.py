@@ -5,4 +5,6 @@ app_name = 'analytics'
 
 urlpatterns = [
     path('', views.analytics_dashboard, name='dashboard'),
+    path('collect', views.collect, name='collect'),
+    path('export/<slug:dataset>.<slug:fmt>', views.export, name='export'),
 ]
\ No newline at end of file
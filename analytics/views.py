@@ -1,33 +1,116 @@
 from django.contrib.admin.views.decorators import staff_member_required
+from django.http import HttpResponse, HttpResponseBadRequest, StreamingHttpResponse
 from django.shortcuts import render
+from django.views.decorators.csrf import csrf_exempt
+from django.views.decorators.http import require_POST
 from django.db.models import Count, Sum
 from django.utils import timezone
-from datetime import timedelta
-from django.db.models.functions import TruncDay
+from datetime import date, timedelta
+import uuid
+from django.db.models.functions import TruncDate
 
+from IrenFantasyArt.db_router import replica_pin_exempt
+from artworks.block_cache import cached_block
 from artworks.models import Artwork, Theme
 from blog.models import BlogPost
-from .models import ArtworkView, BlogPostView  # исправленный импорт
+from .beacon import parse_events, record_events, record_skipped
+from .bots import skip_reason
+from .export import DATASETS, FORMATS, export_chunks, filename
+from .hll import HyperLogLog
+from .models import ArtworkView, BlogPostView, ArtworkDailyViews, BlogPostDailyViews, SkippedViewsDaily  # исправленный импорт
 
+# Периоды дашборда в днях
+DASHBOARD_PERIODS = (7, 30, 90, 365)
+DEFAULT_PERIOD = 30
+DASHBOARD_TTL = 300
+# Период выгрузки по умолчанию
+EXPORT_DEFAULT_DAYS = 30
 
-@staff_member_required
-def analytics_dashboard(request):
-    # --- Данные для картин ---
-    top_artworks = Artwork.objects.filter(views__gt=0).order_by('-views')[:10]
+VISITOR_COOKIE = 'visitor'
+VISITOR_COOKIE_AGE = 365 * 24 * 60 * 60
 
-    end_date = timezone.now()
-    start_date = end_date - timedelta(days=30)
-    
-    artwork_daily_views = (
-        ArtworkView.objects
+
+def daily_counts(log_model, rollup_model, start_date):
+    """Просмотры по дням: подробный журнал плюс итоги, оставшиеся после prune_view_logs"""
+    counts = {}
+    raw = (
+        log_model.objects
         .filter(viewed_at__gte=start_date)
-        .annotate(day=TruncDay('viewed_at'))
+        .annotate(day=TruncDate('viewed_at'))
         .values('day')
         .annotate(count=Count('id'))
-        .order_by('day')
+        .order_by()
     )
-    artwork_chart_labels = [item['day'].strftime('%d.%m') for item in artwork_daily_views]
-    artwork_chart_data = [item['count'] for item in artwork_daily_views]
+    for item in raw:
+        counts[item['day']] = counts.get(item['day'], 0) + item['count']
+
+    rolled_up = (
+        rollup_model.objects
+        .filter(day__gte=timezone.localtime(start_date).date())
+        .values('day')
+        .annotate(count=Sum('views'))
+        .order_by()
+    )
+    for item in rolled_up:
+        counts[item['day']] = counts.get(item['day'], 0) + item['count']
+
+    return sorted(counts.items())
+
+
+def unique_visitors(rollup_model, fk, start_day, groupings=None):
+    """
+    Уникальные посетители с start_day: суточные скетчи объединяются в памяти.
+
+    groupings - {имя: {id объекта: группа}}, например тематика каждой картины
+    (аналитика может лежать в другой базе, поэтому без JOIN).
+    Возвращает (всего, {id объекта: уникальные}, {имя: {группа: уникальные}}).
+    """
+    groupings = groupings or {}
+    total = HyperLogLog()
+    per_object = {}
+    groups = {name: {} for name in groupings}
+    rows = (
+        rollup_model.objects
+        .filter(day__gte=start_day)
+        .exclude(visitors=b'')
+        .values_list(f'{fk}_id', 'visitors')
+    )
+    for object_id, data in rows.iterator():
+        sketch = HyperLogLog.from_bytes(data)
+        total.update(sketch)
+        per_object.setdefault(object_id, HyperLogLog()).update(sketch)
+        for name, mapping in groupings.items():
+            group = mapping.get(object_id)
+            if group is not None:
+                groups[name].setdefault(group, HyperLogLog()).update(sketch)
+
+    def counts(sketches):
+        return {key: sketch.count() for key, sketch in sketches.items()}
+
+    return total.count(), counts(per_object), {name: counts(sketches) for name, sketches in groups.items()}
+
+
+def dashboard_data(days):
+    """Все агрегаты дашборда за последние days дней"""
+    end_date = timezone.now()
+    start_date = end_date - timedelta(days=days)
+    start_day = timezone.localtime(start_date).date()
+
+    # --- Данные для картин ---
+    artwork_groups = {'Тематика': {}, 'Коллекция': {}}
+    for artwork_id, theme, collection in Artwork.objects.values_list('id', 'theme__name', 'collection__name'):
+        artwork_groups['Тематика'][artwork_id] = theme
+        artwork_groups['Коллекция'][artwork_id] = collection
+    artwork_uniques_total, artwork_uniques, group_uniques = unique_visitors(
+        ArtworkDailyViews, 'artwork', start_day, artwork_groups
+    )
+    top_artworks = list(Artwork.objects.filter(views__gt=0).order_by('-views')[:10])
+    for artwork in top_artworks:
+        artwork.uniques = artwork_uniques.get(artwork.id, 0)
+    
+    artwork_daily_views = daily_counts(ArtworkView, ArtworkDailyViews, start_date)
+    artwork_chart_labels = [day.strftime('%d.%m') for day, _ in artwork_daily_views]
+    artwork_chart_data = [count for _, count in artwork_daily_views]
 
     themes = Theme.objects.all()
     theme_data = []
@@ -38,19 +121,22 @@ def analytics_dashboard(request):
     theme_data.sort(key=lambda x: x['views'], reverse=True)
     top_themes = theme_data[:5]
 
+    uniques_by_group = [
+        {'kind': kind, 'name': name, 'uniques': uniques}
+        for kind, groups in group_uniques.items()
+        for name, uniques in groups.items()
+    ]
+    uniques_by_group.sort(key=lambda x: x['uniques'], reverse=True)
+
     # --- Данные для блога ---
-    top_posts = BlogPost.objects.filter(status='published', views__gt=0).order_by('-views')[:10]
+    post_uniques_total, post_uniques, _ = unique_visitors(BlogPostDailyViews, 'post', start_day)
+    top_posts = list(BlogPost.objects.filter(status='published', views__gt=0).order_by('-views')[:10])
+    for post in top_posts:
+        post.uniques = post_uniques.get(post.id, 0)
 
-    blog_daily_views = (
-        BlogPostView.objects
-        .filter(viewed_at__gte=start_date)
-        .annotate(day=TruncDay('viewed_at'))
-        .values('day')
-        .annotate(count=Count('id'))
-        .order_by('day')
-    )
-    blog_chart_labels = [item['day'].strftime('%d.%m') for item in blog_daily_views]
-    blog_chart_data = [item['count'] for item in blog_daily_views]
+    blog_daily_views = daily_counts(BlogPostView, BlogPostDailyViews, start_date)
+    blog_chart_labels = [day.strftime('%d.%m') for day, _ in blog_daily_views]
+    blog_chart_data = [count for _, count in blog_daily_views]
 
     posts = BlogPost.objects.filter(status='published', tags__isnull=False).exclude(tags='')
     tag_views = {}
@@ -61,7 +147,18 @@ def analytics_dashboard(request):
     sorted_tags = sorted(tag_views.items(), key=lambda x: x[1], reverse=True)[:10]
     top_tags = [{'name': tag, 'views': views} for tag, views in sorted_tags]
 
-    context = {
+    # Не засчитанные запросы роботов и сервисов (analytics/bots.py)
+    skipped = [
+        {'reason': dict(SkippedViewsDaily.REASON_CHOICES).get(row['reason'], row['reason']), 'requests': row['requests'], 'views': row['views']}
+        for row in SkippedViewsDaily.objects.filter(day__gte=start_day)
+        .values('reason').annotate(requests=Sum('requests'), views=Sum('views')).order_by('-views')
+    ]
+
+    return {
+        'skipped': skipped,
+        'artwork_uniques_total': artwork_uniques_total,
+        'post_uniques_total': post_uniques_total,
+        'uniques_by_group': uniques_by_group[:10],
         'top_artworks': top_artworks,
         'artwork_chart_labels': artwork_chart_labels,
         'artwork_chart_data': artwork_chart_data,
@@ -71,4 +168,80 @@ def analytics_dashboard(request):
         'blog_chart_data': blog_chart_data,
         'top_tags': top_tags,
     }
-    return render(request, 'analytics/dashboard.html', context)
\ No newline at end of file
+
+
+@staff_member_required
+def analytics_dashboard(request):
+    try:
+        days = int(request.GET.get('days', DEFAULT_PERIOD))
+    except ValueError:
+        days = DEFAULT_PERIOD
+    if days not in DASHBOARD_PERIODS:
+        days = DEFAULT_PERIOD
+
+    # Агрегаты по журналам дорогие: пересчёт в фоне не чаще раза в DASHBOARD_TTL
+    data = cached_block(f'analytics_dashboard:{days}', lambda: dashboard_data(days), soft_ttl=DASHBOARD_TTL)
+    context = {
+        'days': days,
+        'periods': DASHBOARD_PERIODS,
+        **data,
+    }
+    return render(request, 'analytics/dashboard.html', context)
+
+
+@csrf_exempt
+@require_POST
+@replica_pin_exempt
+def collect(request):
+    """
+    Приём пачки событий от navigator.sendBeacon: просмотры, увеличение
+    изображений, время на странице. Детальные страницы сами ничего не пишут
+    и могут целиком отдаваться из кэша.
+    """
+    events = parse_events(request.body)
+    response = HttpResponse(status=204)
+    response['Cache-Control'] = 'no-store'
+    # Роботы не пишут журналы и не получают cookie посетителя
+    reason = skip_reason(request)
+    if reason:
+        if events:
+            record_skipped(reason, events)
+        return response
+
+    visitor = request.COOKIES.get(VISITOR_COOKIE) or uuid.uuid4().hex
+    if events:
+        record_events(events, request.session, visitor[:64])
+    if VISITOR_COOKIE not in request.COOKIES:
+        # Случайный id для скетчей уникальных: сам он нигде не хранится
+        response.set_cookie(VISITOR_COOKIE, visitor, max_age=VISITOR_COOKIE_AGE, httponly=True, samesite='Lax')
+    return response
+
+
+@staff_member_required
+def export(request, dataset, fmt):
+    """
+    Потоковая выгрузка журналов и суточных итогов за период:
+    /analytics/export/artwork_views.csv?start=2024-01-01&end=2024-12-31&gzip=1
+    """
+    if dataset not in DATASETS or fmt not in FORMATS:
+        return HttpResponseBadRequest("Неизвестный набор данных или формат")
+    today = timezone.localdate()
+    try:
+        end = date.fromisoformat(request.GET['end']) if request.GET.get('end') else today
+        start = (
+            date.fromisoformat(request.GET['start']) if request.GET.get('start')
+            else end - timedelta(days=EXPORT_DEFAULT_DAYS - 1)
+        )
+    except ValueError:
+        return HttpResponseBadRequest("Даты - в формате ГГГГ-ММ-ДД")
+    if start > end:
+        return HttpResponseBadRequest("Начало периода позже конца")
+
+    compress = request.GET.get('gzip') == '1'
+    response = StreamingHttpResponse(
+        export_chunks(dataset, start, end, fmt, compress),
+        content_type='application/gzip' if compress else FORMATS[fmt],
+    )
+    response['Content-Disposition'] = f'attachment; filename="{filename(dataset, start, end, fmt, compress)}"'
+    response['Cache-Control'] = 'no-store'
+    return response
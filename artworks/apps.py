@@ -1,5 +1,12 @@
 from django.apps import AppConfig
+from django.db.backends.signals import connection_created
 
 
 class ArtworksConfig(AppConfig):
     name = 'artworks'
+
+    def ready(self):
+        from IrenFantasyArt.sqlite import configure_connection
+        from . import signals  # noqa: F401
+
+        connection_created.connect(configure_connection, dispatch_uid='sqlite_pragmas')
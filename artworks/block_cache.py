@@ -0,0 +1,57 @@
+# artworks/block_cache.py
+import threading
+import time
+
+from django.core.cache import cache
+from django.db import connections
+
+# Блокировка пересчёта снимается сама, если воркер упал посреди него
+LOCK_TIMEOUT = 60
+
+
+def _store(key, value, version, soft_ttl, hard_ttl):
+    cache.set(key, (version, time.time() + soft_ttl, value), hard_ttl)
+
+
+def _refresh(key, compute, version, soft_ttl, hard_ttl):
+    try:
+        _store(key, compute(), version, soft_ttl, hard_ttl)
+    except Exception as e:
+        print(f"Ошибка пересчёта блока {key}: {e}")
+    finally:
+        cache.delete(f'{key}:lock')
+        # Соединения с БД у потока свои - закрываем, чтобы не копились
+        connections.close_all()
+
+
+def cached_block(key, compute, soft_ttl=60, hard_ttl=3600, version=None):
+    """
+    Кэш дорогого блока со stale-while-revalidate.
+
+    До soft_ttl отдаётся сохранённое значение. После него вызывающий всё ещё
+    получает старое значение, а compute() в фоновом потоке запускает только тот,
+    кто первым взял блокировку в кэше (cache.add атомарен). После hard_ttl
+    запись удаляется из кэша, и значение считается заново синхронно.
+
+    version - например, дата последнего изменения из валидаторов cache_policy:
+    при её смене блок пересчитывается сразу, чтобы страница с новым ETag
+    не отдавалась со старыми данными.
+
+    С LocMemCache и блок, и блокировка у каждого процесса свои; одна
+    блокировка на все воркеры - с общим кэшем (Redis, Memcached).
+    """
+    entry = cache.get(key)
+    if entry is None or entry[0] != version:
+        value = compute()
+        _store(key, value, version, soft_ttl, hard_ttl)
+        return value
+
+    _, fresh_until, value = entry
+    if time.time() >= fresh_until and cache.add(f'{key}:lock', 1, LOCK_TIMEOUT):
+        threading.Thread(
+            target=_refresh,
+            args=(key, compute, version, soft_ttl, hard_ttl),
+            name=f'refresh-{key}',
+            daemon=True,
+        ).start()
+    return value
@@ -0,0 +1,95 @@
+# artworks/cards.py
+from django.db.models import OuterRef, Subquery
+from django.db.models.functions import Substr
+from django.urls import reverse
+
+from .models import Artwork, ArtworkImage, format_dimensions, format_price
+
+# Колонки карточки: без description, purchase_url и полных строк категории/тематики
+CARD_COLUMNS = (
+    'id', 'title', 'slug', 'status', 'price', 'width_cm', 'height_cm',
+    'created_year', 'views', 'size_category', 'category__name', 'theme__name',
+    'short_text', 'primary_image',
+)
+# Шаблоны обрезают описание до 100 символов - лишний символ, чтобы осталось многоточие
+SHORT_TEXT_LENGTH = 101
+
+
+def primary_image():
+    """Подзапрос: главное изображение картины, иначе первое по порядку"""
+    return ArtworkImage.objects.filter(
+        artwork=OuterRef('pk')
+    ).order_by('-is_primary', 'order', 'id').values('image')[:1]
+
+
+def card_values(queryset):
+    """values()-запрос с колонками карточки для queryset картин"""
+    return queryset.annotate(
+        primary_image=Subquery(primary_image()),
+        short_text=Substr('short_description', 1, SHORT_TEXT_LENGTH),
+    ).values(*CARD_COLUMNS)
+
+
+class ArtworkCard:
+    """
+    Карточка картины для списков (каталог, главная, поиск, похожие работы).
+
+    Строится из строки card_values(); цена, размеры, ссылка и адрес
+    изображения считаются один раз при создании, а не при каждом
+    обращении из шаблона.
+    """
+
+    __slots__ = (
+        'id', 'title', 'slug', 'status', 'price', 'created_year', 'views',
+        'size_category', 'category_name', 'theme_name', 'short_description',
+        'image_url', 'url', 'get_price_display', 'get_dimensions',
+    )
+
+    def __init__(self, row, image_storage):
+        self.id = row['id']
+        self.title = row['title']
+        self.slug = row['slug']
+        self.status = row['status']
+        self.price = row['price']
+        self.created_year = row['created_year']
+        self.views = row['views']
+        self.size_category = row['size_category']
+        self.category_name = row['category__name']
+        self.theme_name = row['theme__name']
+        self.short_description = row['short_text']
+        self.image_url = image_storage.url(row['primary_image']) if row['primary_image'] else None
+        self.url = reverse('artwork_detail', kwargs={'slug': row['slug']})
+        self.get_price_display = format_price(row['status'], row['price'])
+        self.get_dimensions = format_dimensions(row['width_cm'], row['height_cm'])
+
+    def get_absolute_url(self):
+        return self.url
+
+    def __repr__(self):
+        return f'<ArtworkCard {self.id}: {self.title}>'
+
+
+def image_storage():
+    return ArtworkImage._meta.get_field('image').storage
+
+
+def artwork_cards(queryset, limit=None):
+    """Карточки для queryset картин с его фильтрами и сортировкой, не больше limit"""
+    rows = card_values(queryset)
+    if limit is not None:
+        rows = rows[:limit]
+    storage = image_storage()
+    return [ArtworkCard(row, storage) for row in rows]
+
+
+def artwork_cards_by_id(ids):
+    """Карточки по списку id в том же порядке (отсутствующие пропускаются)"""
+    cards = {card.id: card for card in artwork_cards(Artwork.objects.filter(id__in=ids))}
+    return [cards[pk] for pk in ids if pk in cards]
+
+
+def card_page(page):
+    """Заменяет строки card_values() на странице пагинатора карточками"""
+    storage = image_storage()
+    page.object_list = [ArtworkCard(row, storage) for row in page.object_list]
+    return page
@@ -0,0 +1,305 @@
+# artworks/catalog_engine.py
+import copy
+import threading
+import time
+
+import numpy as np
+from django.core.cache import cache
+from django.db import connections, router, transaction
+
+from .fuzzy import fuzzy_artwork_ids
+from .search_index import fold
+
+# Версия данных каталога в кэше: меняется сигналами, другие процессы перестраивают колонки
+ENGINE_VERSION_KEY = 'catalog_engine_version'
+# Просмотры обновляются через update() без сигналов - колонки перестраиваются не реже
+ENGINE_MAX_AGE = 300
+
+COLUMNS = (
+    'id', 'title', 'tags', 'short_description', 'description', 'status', 'price',
+    'size_category', 'category_id', 'theme_id', 'collection_id', 'views', 'created_at',
+)
+STATUSES = ['available', 'sold']
+SIZES = ['small', 'medium', 'large']
+# Фильтры ArtworkFilter, которые движок умеет считать; с любым другим каталог идёт в SQL
+SUPPORTED_FILTERS = {'status', 'category', 'theme', 'collection', 'size', 'price_min', 'price_max'}
+
+# Колонки-массивы, по одному значению на картину
+ARRAYS = (
+    'ids', 'alive', 'status', 'size', 'price', 'category', 'theme',
+    'collection', 'views', 'created_at', 'titles', 'texts',
+)
+
+STRINGS = np.dtypes.StringDType()
+
+
+def _code(values, value):
+    return values.index(value) if value in values else -1
+
+
+def _tags(tags):
+    return {fold(tag) for tag in (tags or '').split(',') if tag.strip()}
+
+
+class CatalogColumns:
+    """
+    Колонки каталога в массивах NumPy: фильтры ArtworkFilter и сортировки
+    каталога считаются масками и argsort по всем картинам сразу.
+
+    Строки не удаляются, а помечаются в alive - позиции картин не сдвигаются.
+    Теги - битовые маски (массив bool на тег), поиск по тегу - OR масок
+    тегов, содержащих запрос.
+
+    nulls_largest - как база сортирует NULL (features.nulls_order_largest):
+    картины без цены стоят там же, где в ORDER BY price.
+    """
+
+    def __init__(self, rows, nulls_largest=False):
+        rows = list(rows)
+        self.nulls_largest = nulls_largest
+        self.positions = {row['id']: pos for pos, row in enumerate(rows)}
+        self.ids = np.array([row['id'] for row in rows], dtype=np.int64)
+        self.alive = np.ones(len(rows), dtype=bool)
+        self.status = np.array([_code(STATUSES, row['status']) for row in rows], dtype=np.int8)
+        self.size = np.array([_code(SIZES, row['size_category']) for row in rows], dtype=np.int8)
+        # Цена по запросу - NaN: не проходит фильтры по цене, как NULL в SQL
+        self.price = np.array([np.nan if row['price'] is None else row['price'] for row in rows], dtype=np.float64)
+        self.category = np.array([row['category_id'] or 0 for row in rows], dtype=np.int64)
+        self.theme = np.array([row['theme_id'] or 0 for row in rows], dtype=np.int64)
+        self.collection = np.array([row['collection_id'] or 0 for row in rows], dtype=np.int64)
+        self.views = np.array([row['views'] for row in rows], dtype=np.int64)
+        self.created_at = np.array([row['created_at'].timestamp() for row in rows], dtype=np.float64)
+        self.titles = np.array([row['title'] for row in rows], dtype=STRINGS)
+        # Текст для поиска: название, краткое и полное описание
+        self.texts = np.array([self._text(row) for row in rows], dtype=STRINGS)
+        self.tags = {}
+        for pos, row in enumerate(rows):
+            for tag in _tags(row['tags']):
+                self._tag_mask(tag)[pos] = True
+        self._title_rank = None
+
+    def __len__(self):
+        return int(self.alive.sum())
+
+    @staticmethod
+    def _text(row):
+        return fold(' \n '.join([row['title'], row['short_description'] or '', row['description'] or '']))
+
+    def _tag_mask(self, tag):
+        if tag not in self.tags:
+            self.tags[tag] = np.zeros(len(self.ids), dtype=bool)
+        return self.tags[tag]
+
+    def copy(self):
+        """Независимая копия: изменения применяются к ней, а запросы идут по прежним колонкам"""
+        columns = copy.copy(self)
+        for name in ARRAYS:
+            setattr(columns, name, getattr(self, name).copy())
+        columns.positions = dict(self.positions)
+        columns.tags = {tag: mask.copy() for tag, mask in self.tags.items()}
+        return columns
+
+    def _append_row(self):
+        pos = len(self.ids)
+        for name in ARRAYS:
+            column = getattr(self, name)
+            setattr(self, name, np.append(column, np.zeros(1, dtype=column.dtype)))
+        for tag, mask in self.tags.items():
+            self.tags[tag] = np.append(mask, False)
+        return pos
+
+    def upsert(self, row):
+        """Новая или изменённая картина (строка values() с колонками COLUMNS)"""
+        pos = self.positions.get(row['id'])
+        if pos is None:
+            pos = self.positions[row['id']] = self._append_row()
+        self.ids[pos] = row['id']
+        self.alive[pos] = True
+        self.status[pos] = _code(STATUSES, row['status'])
+        self.size[pos] = _code(SIZES, row['size_category'])
+        self.price[pos] = np.nan if row['price'] is None else row['price']
+        self.category[pos] = row['category_id'] or 0
+        self.theme[pos] = row['theme_id'] or 0
+        self.collection[pos] = row['collection_id'] or 0
+        self.views[pos] = row['views']
+        self.created_at[pos] = row['created_at'].timestamp()
+        self.titles[pos] = row['title']
+        self.texts[pos] = self._text(row)
+        tags = _tags(row['tags'])
+        for tag, mask in self.tags.items():
+            mask[pos] = tag in tags
+        for tag in tags:
+            self._tag_mask(tag)[pos] = True
+        self._title_rank = None
+
+    def remove(self, artwork_id):
+        pos = self.positions.pop(artwork_id, None)
+        if pos is not None:
+            self.alive[pos] = False
+
+    def title_rank(self):
+        """Место названия в алфавитном порядке - сортировка по названию без сравнения строк"""
+        if self._title_rank is None:
+            rank = np.empty(len(self.titles), dtype=np.int64)
+            rank[np.argsort(self.titles, kind='stable')] = np.arange(len(self.titles))
+            self._title_rank = rank
+        return self._title_rank
+
+    def search_mask(self, query):
+        """То же, что _catalog_search в views: совпадения по тексту, иначе похожие картины"""
+        if not query:
+            return self.alive.copy()
+        needle = fold(query)
+        mask = np.strings.find(self.texts, needle) >= 0
+        for tag, tag_mask in self.tags.items():
+            if needle in tag:
+                mask |= tag_mask
+        mask &= self.alive
+        if mask.any():
+            return mask
+        return self.alive & np.isin(self.ids, fuzzy_artwork_ids(query))
+
+    def filter_mask(self, cleaned_data):
+        """Маска по cleaned_data формы ArtworkFilter (пустые значения не фильтруют)"""
+        mask = self.alive.copy()
+        if cleaned_data.get('status'):
+            mask &= np.isin(self.status, [_code(STATUSES, value) for value in cleaned_data['status']])
+        if cleaned_data.get('size'):
+            mask &= np.isin(self.size, [_code(SIZES, value) for value in cleaned_data['size']])
+        for name, column in (('category', self.category), ('theme', self.theme)):
+            if cleaned_data.get(name):
+                mask &= np.isin(column, [obj.pk for obj in cleaned_data[name]])
+        if cleaned_data.get('collection'):
+            mask &= self.collection == cleaned_data['collection'].pk
+        if cleaned_data.get('price_min') is not None:
+            mask &= self.price >= float(cleaned_data['price_min'])
+        if cleaned_data.get('price_max') is not None:
+            mask &= self.price <= float(cleaned_data['price_max'])
+        return mask
+
+    def order(self, positions, order_by):
+        """
+        Позиции в порядке сортировки каталога. При равенстве - новые выше;
+        картины без цены - как NULL в ORDER BY базы.
+        """
+        field = order_by.lstrip('-')
+        key = {
+            'created_at': self.created_at,
+            'price': self.price,
+            'views': self.views,
+            'title': self.title_rank(),
+        }[field][positions]
+        if field == 'price':
+            key = np.where(np.isnan(key), np.inf if self.nulls_largest else -np.inf, key)
+        if order_by.startswith('-'):
+            key = -key
+        # lexsort: последний ключ - главный
+        return positions[np.lexsort((-self.created_at[positions], key))]
+
+    def query(self, query, cleaned_data, order_by):
+        """(id картин по порядку после поиска и фильтров, сколько нашлось до фильтров)"""
+        found = self.search_mask(query)
+        positions = np.flatnonzero(found & self.filter_mask(cleaned_data))
+        return self.ids[self.order(positions, order_by)], int(found.sum())
+
+
+class CatalogEngine:
+    """
+    Колонки каталога в памяти процесса. В этом процессе сохранения картин
+    применяются к колонкам построчно (после коммита), другие процессы по
+    смене версии в кэше перестраивают колонки целиком при следующем запросе.
+
+    Колонки не меняются после публикации: сборка и изменения идут на копии
+    под write_lock, а lock берётся только на замену ссылки - запросы
+    читают свой снимок без блокировки.
+    """
+
+    def __init__(self):
+        self.columns = None
+        self.built_at = 0.0
+        self.version = None
+        self.lock = threading.Lock()
+        self.write_lock = threading.Lock()
+
+    def _build(self):
+        from .models import Artwork
+
+        nulls_largest = connections[router.db_for_read(Artwork)].features.nulls_order_largest
+        return CatalogColumns(Artwork.objects.values(*COLUMNS).iterator(), nulls_largest)
+
+    def _is_stale(self, version):
+        return (
+            self.columns is None
+            or version != self.version
+            or time.monotonic() - self.built_at > ENGINE_MAX_AGE
+        )
+
+    def _snapshot(self, version):
+        with self.lock:
+            if not self._is_stale(version):
+                return self.columns
+        with self.write_lock:
+            # Пока ждали, колонки мог собрать другой поток
+            with self.lock:
+                if not self._is_stale(version):
+                    return self.columns
+            columns = self._build()
+            with self.lock:
+                self.columns, self.built_at, self.version = columns, time.monotonic(), version
+            return columns
+
+    def query(self, query, cleaned_data, order_by):
+        version = cache.get(ENGINE_VERSION_KEY, 0)
+        return self._snapshot(version).query(query, cleaned_data, order_by)
+
+    def _bump_version(self):
+        try:
+            return cache.incr(ENGINE_VERSION_KEY)
+        except ValueError:
+            cache.set(ENGINE_VERSION_KEY, 1, None)
+            return 1
+
+    def _apply(self, change):
+        with self.write_lock:
+            version = self._bump_version()
+            if self.columns is None:
+                return
+            columns = self.columns.copy()
+            try:
+                change(columns)
+            except Exception as e:
+                print(f"Ошибка обновления колонок каталога: {e}")
+                columns = None
+            with self.lock:
+                self.columns = columns
+                # Своё изменение уже применено - перестраивать колонки не нужно
+                if columns is not None and self.version == version - 1:
+                    self.version = version
+
+    def artwork_saved(self, artwork_id):
+        from .models import Artwork
+
+        def change(columns):
+            row = Artwork.objects.filter(pk=artwork_id).values(*COLUMNS).first()
+            if row is None:
+                columns.remove(artwork_id)
+            else:
+                columns.upsert(row)
+
+        transaction.on_commit(lambda: self._apply(change))
+
+    def artwork_deleted(self, artwork_id):
+        transaction.on_commit(lambda: self._apply(lambda columns: columns.remove(artwork_id)))
+
+    def invalidate(self):
+        """Полная перестройка (например, удалена категория - у картин обнулился category_id)"""
+        with self.write_lock, self.lock:
+            self._bump_version()
+            self.columns = None
+
+
+engine = CatalogEngine()
+
+
+def supports(filter_class):
+    return set(filter_class.base_filters) <= SUPPORTED_FILTERS
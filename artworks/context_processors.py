@@ -5,7 +5,7 @@ from django.conf import settings
 
 def navigation_context(request):
     try:
-        collections = Collection.objects.all()[:5]
+        collections = Collection.objects.select_related('summary')[:5]
         return {
             'collections': collections,
         }
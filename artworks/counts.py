@@ -0,0 +1,93 @@
+# artworks/counts.py
+import hashlib
+
+from django.core.cache import cache
+from django.core.exceptions import EmptyResultSet
+from django.db import connections
+
+# Версия счётчиков модели в кэше: меняется сигналами при сохранении и удалении
+VERSION_KEY = 'counts_version:{label}'
+# Страховка для изменений без сигналов (update(), другие процессы с LocMemCache)
+COUNT_TTL = 300
+# Меньшие таблицы на PostgreSQL считаются точно - COUNT по ним и так дешёвый
+APPROXIMATE_MIN_ROWS = 10000
+
+
+def model_version(model):
+    return cache.get(VERSION_KEY.format(label=model._meta.label_lower), 0)
+
+
+def invalidate(model):
+    """Сбрасывает закэшированные количества модели во всех процессах с общим кэшем"""
+    key = VERSION_KEY.format(label=model._meta.label_lower)
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.set(key, 1, None)
+
+
+def signature(queryset, using):
+    """
+    Ключ набора фильтров: SQL без сортировки и select_related, с параметрами.
+    None - заведомо пустой набор (id__in=[], none()), SQL для него не строится.
+    """
+    try:
+        sql, params = queryset.values('pk').order_by().query.sql_with_params()
+    except EmptyResultSet:
+        return None
+    return hashlib.md5(f'{using}|{sql}|{params!r}'.encode()).hexdigest()
+
+
+def is_unfiltered(queryset):
+    query = queryset.query
+    return not query.where and not query.distinct and not query.is_sliced and not query.combinator
+
+
+def approximate_count(queryset, using):
+    """Оценка числа строк из статистики PostgreSQL (pg_class.reltuples), None - если её нет"""
+    connection = connections[using]
+    if connection.vendor != 'postgresql' or not is_unfiltered(queryset):
+        return None
+    with connection.cursor() as cursor:
+        cursor.execute(
+            'SELECT reltuples::bigint FROM pg_class WHERE oid = to_regclass(%s)',
+            [queryset.model._meta.db_table],
+        )
+        row = cursor.fetchone()
+    # -1 - таблица ещё не анализировалась
+    if row is None or row[0] < APPROXIMATE_MIN_ROWS:
+        return None
+    return row[0]
+
+
+def count(queryset, request=None, approximate=False):
+    """
+    Количество строк queryset.
+
+    Одинаковые наборы фильтров считаются один раз за запрос (результаты
+    хранятся на request) и кэшируются до изменения модели. approximate=True
+    разрешает для запроса без фильтров оценку из статистики PostgreSQL
+    вместо COUNT(*) по всей таблице.
+    """
+    using = queryset.db
+    key = signature(queryset, using)
+    if key is None:
+        return 0
+
+    counted = getattr(request, '_counts', None)
+    if counted is None:
+        counted = {}
+        if request is not None:
+            request._counts = counted
+    if key in counted:
+        return counted[key]
+
+    cache_key = f'count:{queryset.model._meta.label_lower}:{model_version(queryset.model)}:{key}'
+    value = cache.get(cache_key)
+    if value is None:
+        value = approximate_count(queryset, using) if approximate else None
+        if value is None:
+            value = queryset.count()
+        cache.set(cache_key, value, COUNT_TTL)
+    counted[key] = value
+    return value
@@ -1,16 +1,19 @@
 # artworks/filters.py
 import django_filters
 from django import forms
-from django.db.models import Q
 from .models import Artwork, Category, Theme, Collection
 
 
 class ArtworkFilter(django_filters.FilterSet):
+    # distinct=False: фильтры по собственным полям картины не размножают строки,
+    # а SELECT DISTINCT мешает использовать индекс для сортировки
+
     # Статус (чекбоксы)
     status = django_filters.MultipleChoiceFilter(
         choices=Artwork.STATUS_CHOICES,
         widget=forms.CheckboxSelectMultiple,
         label="Статус",
+        distinct=False,
         field_name='status'
     )
     
@@ -19,6 +22,7 @@ class ArtworkFilter(django_filters.FilterSet):
         queryset=Category.objects.all(),
         widget=forms.CheckboxSelectMultiple,
         label="Категория",
+        distinct=False,
         field_name='category'
     )
     
@@ -27,6 +31,7 @@ class ArtworkFilter(django_filters.FilterSet):
         queryset=Theme.objects.all(),
         widget=forms.CheckboxSelectMultiple,
         label="Тематика",
+        distinct=False,
         field_name='theme'
     )
         
@@ -35,7 +40,8 @@ class ArtworkFilter(django_filters.FilterSet):
         choices=Artwork.SIZE_CHOICES,
         method='filter_by_size',
         widget=forms.CheckboxSelectMultiple,
-        label="Размер"
+        label="Размер",
+        distinct=False
     )
     
     # Цена (диапазон)
@@ -59,21 +65,4 @@ class ArtworkFilter(django_filters.FilterSet):
     def filter_by_size(self, queryset, name, value):
         if not value:
             return queryset
-
-        small_q = Q(width_cm__lte=25, height_cm__lte=25)
-        medium_q = (
-            (Q(width_cm__lte=40, height_cm__lte=60) | Q(width_cm__lte=60, height_cm__lte=40)) &
-            ~small_q
-        )
-        large_q = ~(small_q | medium_q)
-
-        final_q = Q()
-
-        if 'small' in value:
-            final_q |= small_q
-        if 'medium' in value:
-            final_q |= medium_q
-        if 'large' in value:
-            final_q |= large_q
-
-        return queryset.filter(final_q)
\ No newline at end of file
+        return queryset.filter(size_category__in=value)
@@ -0,0 +1,124 @@
+# artworks/fuzzy.py
+import re
+
+from .search_index import fold, lazy_index
+
+# Порог похожести (как similarity_threshold по умолчанию в pg_trgm)
+SIMILARITY_THRESHOLD = 0.3
+FUZZY_LIMIT = 20
+
+NON_WORD_RE = re.compile(r'[^\w\s]')
+
+
+def normalize(text):
+    return fold(NON_WORD_RE.sub(' ', text))
+
+
+def transliterate(text):
+    from unidecode import unidecode
+
+    return normalize(unidecode(text))
+
+
+def trigrams(text):
+    """Триграммы слов с отступами, как в pg_trgm: "  кот " -> "  к", " ко", "кот", "от " """
+    result = set()
+    for word in text.split():
+        padded = f"  {word} "
+        result.update(padded[i:i + 3] for i in range(len(padded) - 2))
+    return result
+
+
+class TrigramIndex:
+    """
+    Триграммный индекс по названиям и тегам картин
+    в исходном и транслитерированном виде.
+
+    Документ - одна форма одного названия/тега. Похожесть запроса
+    с каждым документом считается сразу для всех через np.bincount
+    по спискам вхождений триграмм, оценка картины - максимум по её документам.
+    """
+
+    def __init__(self, artworks):
+        # NumPy импортируется при первом нечётком поиске, а не при загрузке маршрутов
+        import numpy as np
+
+        vocabulary = {}
+        doc_artwork = []
+        doc_sizes = []
+        postings = []
+
+        for artwork_id, texts in artworks:
+            forms = set()
+            for text in texts:
+                forms.add(normalize(text))
+                forms.add(transliterate(text))
+            for form in forms:
+                grams = trigrams(form)
+                if not grams:
+                    continue
+                doc_id = len(doc_artwork)
+                doc_artwork.append(artwork_id)
+                doc_sizes.append(len(grams))
+                for gram in grams:
+                    gram_id = vocabulary.setdefault(gram, len(vocabulary))
+                    postings.append((gram_id, doc_id))
+
+        self.vocabulary = vocabulary
+        self.doc_sizes = np.array(doc_sizes, dtype=np.int32)
+        self.artwork_ids, self.doc_artwork = np.unique(
+            np.array(doc_artwork, dtype=np.int64), return_inverse=True
+        )
+
+        # Списки вхождений в формате CSR: документы триграммы g - doc_ids[offsets[g]:offsets[g + 1]]
+        postings = np.array(postings, dtype=np.int64).reshape(-1, 2)
+        postings = postings[np.argsort(postings[:, 0], kind='stable')]
+        self.doc_ids = postings[:, 1]
+        self.offsets = np.zeros(len(vocabulary) + 1, dtype=np.int64)
+        np.cumsum(np.bincount(postings[:, 0], minlength=len(vocabulary)), out=self.offsets[1:])
+
+    def _similarity(self, query_grams):
+        import numpy as np
+
+        gram_ids = [self.vocabulary[g] for g in query_grams if g in self.vocabulary]
+        if not gram_ids:
+            return None
+        hits = np.concatenate([self.doc_ids[self.offsets[g]:self.offsets[g + 1]] for g in gram_ids])
+        shared = np.bincount(hits, minlength=len(self.doc_sizes))
+        # Коэффициент Жаккара по множествам триграмм
+        return shared / (len(query_grams) + self.doc_sizes - shared)
+
+    def search(self, query, limit=FUZZY_LIMIT, threshold=SIMILARITY_THRESHOLD):
+        """id картин, отсортированные по убыванию похожести"""
+        import numpy as np
+
+        if not len(self.doc_sizes):
+            return []
+
+        scores = np.zeros(len(self.artwork_ids))
+        for form in {normalize(query), transliterate(query)}:
+            grams = trigrams(form)
+            similarity = self._similarity(grams) if grams else None
+            if similarity is not None:
+                np.maximum.at(scores, self.doc_artwork, similarity)
+
+        matched = np.flatnonzero(scores >= threshold)
+        order = matched[np.argsort(-scores[matched], kind='stable')][:limit]
+        return self.artwork_ids[order].tolist()
+
+
+def build_index():
+    from .models import Artwork
+
+    artworks = []
+    for artwork_id, title, tags in Artwork.objects.values_list('id', 'title', 'tags'):
+        texts = [title] + [tag for tag in (tags or '').split(',') if tag.strip()]
+        artworks.append((artwork_id, texts))
+    return TrigramIndex(artworks)
+
+
+fuzzy_index = lazy_index(build_index)
+
+
+def fuzzy_artwork_ids(query, limit=FUZZY_LIMIT):
+    return fuzzy_index.get().search(query, limit)
@@ -0,0 +1,116 @@
+# artworks/http_cache.py
+import hashlib
+from functools import wraps
+
+from django.db.models import Count, Max
+from django.utils.cache import patch_cache_control, patch_vary_headers
+from django.views.decorators.http import condition
+
+
+def latest(*values):
+    """Самая поздняя из дат (None пропускаются)"""
+    values = [value for value in values if value is not None]
+    return max(values) if values else None
+
+
+def content_state(queryset, trending=False):
+    """
+    (дата последнего изменения, состояние набора) одним агрегатным запросом.
+    trending=True учитывает и trending_updated_at - для страниц с блоками
+    "популярное", порядок которых меняет update_trending.
+
+    Удаление строки не меняет max(updated_at) - состояние (число строк и
+    максимальный id) идёт в ETag, чтобы страница без удалённой строки
+    не отдавалась ответом 304.
+    """
+    aggregates = {'last': Max('updated_at'), 'count': Count('pk'), 'max_id': Max('pk')}
+    if trending:
+        aggregates['trending'] = Max('trending_updated_at')
+    result = queryset.aggregate(**aggregates)
+    return latest(result['last'], result.get('trending')), f"{result['count']}.{result['max_id'] or 0}"
+
+
+def combine(*states):
+    """Несколько пар (дата, состояние) в одну: самая поздняя дата и все состояния"""
+    return latest(*(state[0] for state in states)), '/'.join(state[1] for state in states)
+
+
+def site_state():
+    """
+    Дата последнего изменения и состояние общих блоков страницы
+    (меню коллекций и блоки блога из контекст-процессоров, включая популярные посты)
+    """
+    from blog.models import BlogPost
+    from .models import Collection
+
+    return combine(
+        content_state(Collection.objects.all()),
+        content_state(BlogPost.objects.all(), trending=True),
+    )
+
+
+def site_last_modified():
+    """Дата последнего изменения общих блоков страницы (см. site_state)"""
+    return site_state()[0]
+
+
+def validators_version(validators):
+    """Версия блоков страницы для cached_block: меняется вместе с ETag"""
+    return validators[0], validators[2] if len(validators) > 2 else None
+
+
+def request_version(request):
+    """Версия по валидаторам, уже посчитанным cache_policy для этого запроса"""
+    validators = getattr(request, '_cache_validators', None)
+    return validators_version(validators) if validators else None
+
+
+def cache_policy(validators, max_age=0, s_maxage=300, vary=('Accept-Encoding',)):
+    """
+    Условный GET и заголовки для фронтового кэша (nginx/Varnish).
+
+    validators(request, *args, **kwargs) возвращает (last_modified, surrogate_keys)
+    или (last_modified, surrogate_keys, state) и вызывается один раз до рендера;
+    state (например, из content_state) входит в ETag. Если валидаторы совпадают с
+    If-None-Match/If-Modified-Since, отдаётся 304 без выполнения view.
+    """
+    def decorator(view_func):
+        def _validators(request, *args, **kwargs):
+            if not hasattr(request, '_cache_validators'):
+                request._cache_validators = validators(request, *args, **kwargs)
+            return request._cache_validators
+
+        def _last_modified(request, *args, **kwargs):
+            return _validators(request, *args, **kwargs)[0]
+
+        def _etag(request, *args, **kwargs):
+            last_modified, keys, *state = _validators(request, *args, **kwargs)
+            if last_modified is None:
+                return None
+            seed = '|'.join([
+                request.path,
+                request.GET.urlencode(),
+                last_modified.isoformat(),
+                ' '.join(keys),
+                *state,
+            ])
+            return 'W/"%s"' % hashlib.md5(seed.encode()).hexdigest()
+
+        conditional_view = condition(
+            etag_func=_etag,
+            last_modified_func=_last_modified,
+        )(view_func)
+
+        @wraps(view_func)
+        def _wrapped_view(request, *args, **kwargs):
+            response = conditional_view(request, *args, **kwargs)
+            if request.method in ('GET', 'HEAD') and response.status_code in (200, 304):
+                patch_cache_control(response, public=True, max_age=max_age, s_maxage=s_maxage)
+                patch_vary_headers(response, vary)
+                keys = _validators(request, *args, **kwargs)[1]
+                if keys:
+                    response['Surrogate-Key'] = ' '.join(keys)
+            return response
+
+        return _wrapped_view
+    return decorator
@@ -0,0 +1,69 @@
+# artworks/images.py
+import hashlib
+import os
+import posixpath
+from io import BytesIO
+
+from django.utils.text import slugify
+
+# Длина префикса sha256 в именах файлов
+HASH_LENGTH = 16
+
+
+def compress_image(file, max_width=2000, max_height=2000, quality=85):
+    """Уменьшает изображение до max_width×max_height и перекодирует в JPEG (bytes)"""
+    # Pillow импортируется при первой загрузке, а не при старте воркера
+    from PIL import Image
+
+    img = Image.open(file)
+
+    # Изменяем размер если нужно
+    if img.width > max_width or img.height > max_height:
+        img.thumbnail((max_width, max_height), Image.Resampling.LANCZOS)
+
+    # Конвертируем в RGB если нужно
+    if img.mode in ('RGBA', 'LA', 'P'):
+        background = Image.new('RGB', img.size, (255, 255, 255))
+        if img.mode in ('RGBA', 'LA'):
+            background.paste(img, mask=img.split()[-1])
+        else:
+            background.paste(img)
+        img = background
+    elif img.mode != 'RGB':
+        img = img.convert('RGB')
+
+    img_io = BytesIO()
+    img.save(img_io, format='JPEG', quality=quality, optimize=True)
+    return img_io.getvalue()
+
+
+def content_hash(data):
+    return hashlib.sha256(data).hexdigest()[:HASH_LENGTH]
+
+
+def readable_slug(filename):
+    """Транслитерированное имя файла без расширения"""
+    from unidecode import unidecode
+
+    name, ext = os.path.splitext(os.path.basename(filename))
+    return slugify(unidecode(name))
+
+
+def hashed_name(directory, digest, filename, ext='.jpg'):
+    """directory/ab/<hash>_<slug>.jpg - шардирование по первым двум символам хэша"""
+    slug = readable_slug(filename)
+    name = f"{digest}_{slug}{ext}" if slug else f"{digest}{ext}"
+    return posixpath.join(directory, digest[:2], name)
+
+
+def find_by_hash(storage, directory, digest):
+    """Уже сохранённый файл с таким хэшем или None"""
+    shard = posixpath.join(directory, digest[:2])
+    try:
+        _, files = storage.listdir(shard)
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+    for name in sorted(files):
+        if name.startswith(digest) and '_thumb' not in name:
+            return posixpath.join(shard, name)
+    return None
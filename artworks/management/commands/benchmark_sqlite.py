@@ -0,0 +1,118 @@
+# artworks/management/commands/benchmark_sqlite.py
+import sqlite3
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+from django.core.management.base import BaseCommand
+
+from IrenFantasyArt.sqlite import apply_pragmas
+
+ROWS = 2000
+
+
+def create_database(path):
+    conn = sqlite3.connect(path)
+    conn.executescript("""
+        CREATE TABLE artwork (id INTEGER PRIMARY KEY, title TEXT, status TEXT, views INTEGER NOT NULL DEFAULT 0);
+        CREATE INDEX artwork_views ON artwork (status, views);
+        CREATE TABLE artwork_view (id INTEGER PRIMARY KEY, artwork_id INTEGER, viewed_at REAL);
+    """)
+    conn.executemany(
+        'INSERT INTO artwork (title, status) VALUES (?, ?)',
+        ((f"Картина {i}", 'available' if i % 3 else 'sold') for i in range(ROWS)),
+    )
+    conn.commit()
+    conn.close()
+
+
+def connect(path, hardened):
+    # Как в Django: автокоммит выключен вручную, таймаут по умолчанию 5 секунд
+    conn = sqlite3.connect(path, isolation_level=None)
+    if hardened:
+        apply_pragmas(conn.cursor())
+    return conn
+
+
+def reader(path, hardened, stop, result):
+    conn = connect(path, hardened)
+    ops = errors = 0
+    i = 0
+    while not stop.is_set():
+        i += 1
+        try:
+            conn.execute(
+                "SELECT id, title, views FROM artwork WHERE status = 'available' ORDER BY views DESC LIMIT 20"
+            ).fetchall()
+            conn.execute('SELECT title, views FROM artwork WHERE id = ?', (i % ROWS + 1,)).fetchone()
+            ops += 1
+        except sqlite3.OperationalError:
+            errors += 1
+    conn.close()
+    result.append(('read', ops, errors))
+
+
+def writer(path, hardened, stop, result):
+    conn = connect(path, hardened)
+    begin = 'BEGIN IMMEDIATE' if hardened else 'BEGIN'
+    ops = errors = 0
+    i = 0
+    while not stop.is_set():
+        i += 1
+        artwork_id = i * 7 % ROWS + 1
+        try:
+            # Запись просмотра: строка журнала и счётчик картины
+            conn.execute(begin)
+            conn.execute('INSERT INTO artwork_view (artwork_id, viewed_at) VALUES (?, ?)', (artwork_id, time.time()))
+            conn.execute('UPDATE artwork SET views = views + 1 WHERE id = ?', (artwork_id,))
+            conn.execute('COMMIT')
+            ops += 1
+        except sqlite3.OperationalError:
+            errors += 1
+            if conn.in_transaction:
+                conn.execute('ROLLBACK')
+    conn.close()
+    result.append(('write', ops, errors))
+
+
+def run(path, hardened, readers, writers, seconds):
+    stop = threading.Event()
+    result = []
+    threads = [threading.Thread(target=reader, args=(path, hardened, stop, result)) for _ in range(readers)]
+    threads += [threading.Thread(target=writer, args=(path, hardened, stop, result)) for _ in range(writers)]
+    for thread in threads:
+        thread.start()
+    time.sleep(seconds)
+    stop.set()
+    for thread in threads:
+        thread.join()
+
+    totals = {'read': [0, 0], 'write': [0, 0]}
+    for kind, ops, errors in result:
+        totals[kind][0] += ops
+        totals[kind][1] += errors
+    return totals
+
+
+class Command(BaseCommand):
+    help = "Сравнивает пропускную способность SQLite с настройками по умолчанию и с профилем WAL при параллельных чтении и записи"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--readers', type=int, default=4, help="Потоков чтения")
+        parser.add_argument('--writers', type=int, default=2, help="Потоков записи")
+        parser.add_argument('--seconds', type=float, default=5, help="Длительность каждого прогона")
+
+    def handle(self, *args, **options):
+        seconds = options['seconds']
+        with tempfile.TemporaryDirectory() as tmp:
+            for label, hardened in (("По умолчанию", False), ("WAL-профиль", True)):
+                path = str(Path(tmp) / f"bench-{int(hardened)}.sqlite3")
+                create_database(path)
+                totals = run(path, hardened, options['readers'], options['writers'], seconds)
+                read_ops, read_errors = totals['read']
+                write_ops, write_errors = totals['write']
+                self.stdout.write(
+                    f"{label}: чтений/с {read_ops / seconds:.0f}, записей/с {write_ops / seconds:.0f}, "
+                    f"ошибок блокировки {read_errors + write_errors}"
+                )
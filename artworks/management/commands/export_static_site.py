@@ -0,0 +1,31 @@
+# artworks/management/commands/export_static_site.py
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from artworks.static_export import StaticExporter
+from artworks.warmup import _local_host
+
+
+class Command(BaseCommand):
+    help = (
+        "Выгружает публичные страницы (главная, каталог, картины, коллекции, блог, sitemap.xml, "
+        "robots.txt) в HTML-файлы; перерисовываются только страницы, изменившиеся с прошлой выгрузки"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--output', default=settings.STATIC_EXPORT_ROOT, help="Каталог выгрузки")
+        parser.add_argument('--host', default=_local_host(), help="Домен сайта для абсолютных ссылок (sitemap.xml)")
+        parser.add_argument('--https', action='store_true', help="Страницы рендерятся как запрошенные по https")
+        parser.add_argument('--full', action='store_true', help="Перерисовать все страницы")
+
+    def handle(self, *args, **options):
+        exporter = StaticExporter(options['output'], options['host'], secure=options['https'], full=options['full'])
+        rendered, unchanged, removed, errors = exporter.export()
+
+        for url, status in errors:
+            self.stderr.write(f"{status}  {url}")
+        summary = (
+            f"Перерисовано страниц: {rendered}, без изменений: {unchanged}, удалено: {removed} "
+            f"({options['output']})"
+        )
+        self.stdout.write(self.style.SUCCESS(summary) if not errors else summary)
@@ -0,0 +1,158 @@
+# artworks/management/commands/index_advisor.py
+from django.core.management.base import BaseCommand
+from django.db import DatabaseError, connections, router, transaction
+from django.db.models import Sum
+from django.http import QueryDict
+
+from artworks.filters import ArtworkFilter
+from artworks.models import Artwork, Category, Collection, Theme
+from artworks.views import CATALOG_ORDERS
+from blog.models import BlogPost
+
+# Наборы фильтров каталога, которые проверяются с каждой сортировкой
+CATALOG_FILTERS = [
+    '',
+    'status=available',
+    'category={category}',
+    'category={category}&status=available',
+    'theme={theme}',
+    'theme={theme}&status=available',
+    'size=small',
+    'price_min=1000&price_max=50000',
+]
+PAGE_SIZE = 12
+LEARNED_QUERIES = 20
+
+
+def catalog_queryset(params):
+    """Тот же запрос, что строит каталог (без поиска по тексту), первая страница"""
+    query = QueryDict(params)
+    order = query.get('order', '-created_at')
+    if order not in CATALOG_ORDERS:
+        order = '-created_at'
+    return ArtworkFilter(query, queryset=Artwork.objects.all()).qs.order_by(order)[:PAGE_SIZE]
+
+
+def learned_catalog_params(limit=LEARNED_QUERIES):
+    """Частые наборы фильтров из реального трафика (собирает analytics/beacon.py)"""
+    from analytics.models import CatalogQueryDaily
+
+    rows = (
+        CatalogQueryDaily.objects.exclude(query='')
+        .values('query').annotate(total=Sum('hits')).order_by('-total')[:limit]
+    )
+    return [row['query'] for row in rows]
+
+
+def sample_ids():
+    """Существующие id для подстановки в запросы (None - таблица пуста, запросы с ней пропускаются)"""
+    return {
+        'category': Category.objects.values_list('id', flat=True).first(),
+        'theme': Theme.objects.values_list('id', flat=True).first(),
+        'collection': Collection.objects.values_list('id', flat=True).first(),
+    }
+
+
+def query_shapes(learned_params=()):
+    """(название, queryset) для всех проверяемых запросов каталога и блога"""
+    values = sample_ids()
+    shapes = []
+    for filters in CATALOG_FILTERS:
+        if any(f'{{{name}}}' in filters for name, pk in values.items() if pk is None):
+            continue
+        for order in CATALOG_ORDERS:
+            params = '&'.join(filter(None, [filters.format(**values), f'order={order}']))
+            shapes.append((f'catalog?{params}', catalog_queryset(params)))
+    for params in learned_params:
+        shapes.append((f'catalog?{params} (из трафика)', catalog_queryset(params)))
+
+    available = Artwork.objects.filter(status='available')
+    shapes.append(('home: featured', available.order_by('-trending_score')[:3]))
+    if values['theme'] is not None:
+        shapes.append(('similar: theme', available.filter(theme_id=values['theme'])[:4]))
+    if values['collection'] is not None:
+        shapes.append(('collection page', Artwork.objects.filter(collection_id=values['collection'])[:PAGE_SIZE]))
+    shapes.append(('warm_cache: top artworks', Artwork.objects.order_by('-views')[:20]))
+
+    published = BlogPost.objects.filter(status='published')
+    shapes += [
+        ('blog list', published.order_by('-published_at')[:10]),
+        ('blog: popular', published.order_by('-trending_score')[:5]),
+        ('blog: recent', published.order_by('-created_at')[:4]),
+        ('blog: tag', published.filter(tags__icontains='тег').order_by('-published_at')[:10]),
+    ]
+    return shapes
+
+
+def plan_problems(vendor, plan):
+    """Полные сканирования и сортировки во временной структуре в тексте плана"""
+    problems = []
+    for line in plan.splitlines():
+        text = line.strip(' -|`>')
+        if vendor == 'sqlite':
+            # Строки Django для SQLite: "id parent notused detail"
+            parts = text.split(' ', 3)
+            if len(parts) == 4 and all(part.isdigit() for part in parts[:3]):
+                text = parts[3]
+            # "SCAN t" - полный проход таблицы, "SCAN t USING INDEX" - по индексу в нужном порядке
+            if text.startswith('SCAN ') and 'USING' not in text:
+                problems.append(f"полное сканирование: {text}")
+            elif 'USE TEMP B-TREE' in text:
+                problems.append(f"временная сортировка: {text}")
+        elif vendor == 'postgresql':
+            if text.startswith('Seq Scan'):
+                problems.append(f"полное сканирование: {text.split('  ')[0]}")
+            elif text.startswith(('Sort ', 'Incremental Sort')):
+                problems.append(f"сортировка: {text.split('  ')[0]}")
+    return problems
+
+
+class Command(BaseCommand):
+    help = (
+        "Прогоняет типовые запросы каталога и блога через EXPLAIN (SQLite и PostgreSQL) "
+        "и показывает полные сканирования таблиц и временные сортировки"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--learned', type=int, default=LEARNED_QUERIES, help="Сколько частых запросов каталога добавить из трафика")
+        parser.add_argument(
+            '--force-index', action='store_true',
+            help="PostgreSQL: enable_seqscan=off, чтобы на маленькой базе проверить, есть ли подходящий индекс"
+        )
+
+    def handle(self, *args, **options):
+        alias = router.db_for_read(Artwork)
+        connection = connections[alias]
+        vendor = connection.vendor
+        if vendor not in ('sqlite', 'postgresql'):
+            self.stderr.write(f"EXPLAIN для {vendor} не разбирается")
+            return
+
+        try:
+            learned_params = learned_catalog_params(options['learned'])
+        except DatabaseError as e:
+            self.stderr.write(f"Ошибка чтения запросов каталога: {e}")
+            learned_params = []
+
+        flagged = 0
+        shapes = query_shapes(learned_params)
+        with transaction.atomic(using=alias):
+            if options['force_index'] and vendor == 'postgresql':
+                with connection.cursor() as cursor:
+                    cursor.execute('SET LOCAL enable_seqscan = off')
+
+            for name, queryset in shapes:
+                plan = queryset.explain()
+                problems = plan_problems(vendor, plan)
+                if problems:
+                    flagged += 1
+                    self.stdout.write(self.style.WARNING(name))
+                    for problem in problems:
+                        self.stdout.write(f"    {problem}")
+                elif options['verbosity'] > 1:
+                    self.stdout.write(f"{name}: ок")
+                if options['verbosity'] > 2:
+                    self.stdout.write(plan)
+
+        summary = f"Проверено запросов: {len(shapes)}, с замечаниями: {flagged}"
+        self.stdout.write(self.style.SUCCESS(summary) if not flagged else summary)
@@ -0,0 +1,16 @@
+# artworks/management/commands/rebuild_collection_summaries.py
+from django.core.management.base import BaseCommand
+
+from artworks.models import Collection
+from artworks.summaries import refresh_collection_summary
+
+
+class Command(BaseCommand):
+    help = "Пересчитывает сводки всех коллекций (счётчики, обложки, карусель)"
+
+    def handle(self, *args, **options):
+        count = 0
+        for collection_id in Collection.objects.values_list('id', flat=True):
+            refresh_collection_summary(collection_id)
+            count += 1
+        self.stdout.write(self.style.SUCCESS(f"Пересчитано сводок: {count}"))
@@ -0,0 +1,79 @@
+# artworks/management/commands/rehash_media.py
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from artworks.models import Artwork, ArtworkImage, Collection
+from artworks.storage import is_hashed_name
+from artworks.summaries import refresh_collection_summary
+from blog.models import BlogPost
+
+FIELDS = [
+    (ArtworkImage, 'image'),
+    (Collection, 'image'),
+    (BlogPost, 'preview_image'),
+]
+
+
+class Command(BaseCommand):
+    help = "Переносит старые медиафайлы в хранилище с именами по хэшу содержимого"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--delete-originals', action='store_true', help="Удалить файлы со старыми именами")
+
+    def handle(self, *args, **options):
+        moved = []
+        for model, field_name in FIELDS:
+            field = model._meta.get_field(field_name)
+            storage = field.storage
+            queryset = model.objects.exclude(**{field_name: ''}).exclude(**{f'{field_name}__isnull': True})
+
+            for pk, name in queryset.values_list('pk', field_name).iterator():
+                if is_hashed_name(name):
+                    continue
+                if not storage.exists(name):
+                    self.stderr.write(f"Нет файла: {name}")
+                    continue
+
+                with storage.open(name) as f:
+                    new_name = storage.save(field.generate_filename(None, name.rsplit('/', 1)[-1]), f)
+
+                # update() не вызывает save() модели и повторное сжатие
+                model.objects.filter(pk=pk).update(**{field_name: new_name})
+                moved.append((model, pk, storage, name, new_name))
+
+        # Страницы, сводки и текст постов со старыми адресами обновляются до удаления файлов
+        self.invalidate(moved)
+
+        if options['delete_originals']:
+            for model, pk, storage, name, new_name in moved:
+                if new_name != name:
+                    storage.delete(name)
+
+        self.stdout.write(self.style.SUCCESS(f"Перенесено файлов: {len(moved)}"))
+
+    def invalidate(self, moved):
+        """Меняет updated_at владельцев файлов, пересчитывает сводки коллекций и заменяет адреса в постах"""
+        now = timezone.now()
+        pks = {model: set() for model, field_name in FIELDS}
+        for model, pk, storage, name, new_name in moved:
+            pks[model].add(pk)
+
+        artworks = Artwork.objects.filter(
+            pk__in=ArtworkImage.objects.filter(pk__in=pks[ArtworkImage]).values('artwork_id')
+        )
+        artworks.update(updated_at=now)
+        Collection.objects.filter(pk__in=pks[Collection]).update(updated_at=now)
+        BlogPost.objects.filter(pk__in=pks[BlogPost]).update(updated_at=now)
+
+        collection_ids = set(artworks.exclude(collection=None).values_list('collection_id', flat=True))
+        for collection_id in collection_ids | pks[Collection]:
+            refresh_collection_summary(collection_id)
+
+        # Изображения из медиа могут быть вставлены в текст постов
+        for model, pk, storage, name, new_name in moved:
+            old_url, new_url = storage.url(name), storage.url(new_name)
+            if old_url == new_url:
+                continue
+            for post in BlogPost.objects.filter(content__contains=old_url):
+                post.content = post.content.replace(old_url, new_url)
+                post.save(update_fields=['content', 'updated_at'])
@@ -0,0 +1,20 @@
+# artworks/management/commands/sqlite_maintenance.py
+from django.core.management.base import BaseCommand
+from django.db import connections
+
+from IrenFantasyArt.sqlite import is_read_only, maintain
+
+
+class Command(BaseCommand):
+    help = "PRAGMA optimize и сброс WAL в основной файл для баз SQLite (запускать по cron)"
+
+    def handle(self, *args, **options):
+        for alias in connections:
+            connection = connections[alias]
+            if connection.vendor != 'sqlite' or is_read_only(connection.settings_dict):
+                continue
+            busy, wal_pages, moved = maintain(connection)
+            if busy:
+                self.stderr.write(f"{alias}: база занята, WAL перенесён частично ({moved} из {wal_pages} страниц)")
+            else:
+                self.stdout.write(self.style.SUCCESS(f"{alias}: перенесено страниц WAL: {moved}"))
@@ -0,0 +1,106 @@
+# artworks/management/commands/startup_profile.py
+import os
+import subprocess
+import sys
+import time
+from collections import defaultdict
+
+from django.apps import apps
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+# -X importtime не видит модули, загруженные через importlib.import_module
+# (так Django загружает models, admin, urls), - их время пишется в том же формате
+TRACE_IMPORT_MODULE = """
+import importlib, importlib.util, sys, time
+_import_module = importlib.import_module
+def import_module(name, package=None):
+    name = importlib.util.resolve_name(name, package) if name.startswith('.') else name
+    if name in sys.modules:
+        return _import_module(name)
+    started = time.perf_counter_ns()
+    try:
+        return _import_module(name)
+    finally:
+        elapsed = (time.perf_counter_ns() - started) // 1000
+        print(f'import time: 0 | {elapsed} | {name}', file=sys.stderr)
+importlib.import_module = import_module
+"""
+# Что делает воркер gunicorn при старте; с --urls ещё и то, что платит первый запрос
+STARTUP_SCRIPT = """
+from django.core.wsgi import get_wsgi_application
+get_wsgi_application()
+"""
+URLS_SCRIPT = """
+from django.urls import get_resolver
+get_resolver().url_patterns
+"""
+
+
+def run_python(script, importtime=False):
+    args = [sys.executable]
+    if importtime:
+        args += ['-X', 'importtime']
+    started = time.perf_counter()
+    result = subprocess.run(args + ['-c', script], env=os.environ.copy(), capture_output=True, text=True)
+    elapsed = time.perf_counter() - started
+    if result.returncode:
+        raise CommandError(result.stderr.strip().splitlines()[-1] if result.stderr.strip() else "Ошибка запуска")
+    return elapsed, result.stderr
+
+
+def parse_importtime(output):
+    """Строки -X importtime: 'import time: self [us] | cumulative | package'"""
+    modules = []
+    for line in output.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, cumulative_us, name = line[len('import time:'):].split('|')
+        modules.append((name.strip(), int(self_us), int(cumulative_us)))
+    return modules
+
+
+class Command(BaseCommand):
+    help = "Время импорта модулей и холодного старта воркера (для оценки стоимости перезапуска воркеров)"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--top', type=int, default=20, help="Сколько модулей и пакетов показать")
+        parser.add_argument('--repeat', type=int, default=5, help="Число холодных стартов для замера")
+        parser.add_argument('--urls', action='store_true', help="Загружать и маршруты (как первый запрос)")
+
+    def handle(self, *args, **options):
+        script = STARTUP_SCRIPT + (URLS_SCRIPT if options['urls'] else '')
+        top = options['top']
+
+        _, output = run_python(TRACE_IMPORT_MODULE + script, importtime=True)
+        modules = parse_importtime(output)
+
+        # Модули проекта: их импорт вместе с зависимостями - то, что можно сделать ленивым
+        project_packages = {
+            config.name.split('.')[0] for config in apps.get_app_configs()
+            if str(config.path).startswith(str(settings.BASE_DIR))
+        } | {settings.ROOT_URLCONF.split('.')[0]}
+        project_modules = [m for m in modules if m[0].lstrip().split('.')[0] in project_packages]
+
+        self.stdout.write("Модули проекта по времени импорта вместе с зависимостями, мс:")
+        for name, _, cumulative in sorted(project_modules, key=lambda m: m[2], reverse=True)[:top]:
+            self.stdout.write(f"  {cumulative / 1000:8.1f}  {name}")
+
+        packages = defaultdict(int)
+        for name, self_us, _ in modules:
+            packages[name.lstrip().split('.')[0]] += self_us
+        self.stdout.write("Пакеты по собственному времени импорта, мс:")
+        for package, self_us in sorted(packages.items(), key=lambda p: p[1], reverse=True)[:top]:
+            self.stdout.write(f"  {self_us / 1000:8.1f}  {package}")
+
+        for heavy in ('PIL', 'unidecode', 'numpy', 'pymysql'):
+            loaded = any(name == heavy for name, _, _ in modules)
+            self.stdout.write(f"{heavy}: {'загружается при старте' if loaded else 'не загружается'}")
+
+        # Холодный старт целиком: интерпретатор, Django, приложения (и маршруты)
+        timings = sorted(run_python(script)[0] for _ in range(max(options['repeat'], 1)))
+        median = timings[len(timings) // 2]
+        self.stdout.write(self.style.SUCCESS(
+            f"Холодный старт: медиана {median * 1000:.0f} мс, минимум {timings[0] * 1000:.0f} мс "
+            f"({len(timings)} запусков)"
+        ))
@@ -0,0 +1,57 @@
+# artworks/management/commands/warm_cache.py
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from artworks.warmup import collect_paths, is_failed, warm
+
+
+class Command(BaseCommand):
+    help = (
+        "Прогревает кэши после деплоя: страницы из sitemap, самые просматриваемые картины "
+        "и частые наборы фильтров каталога"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--base-url', default=settings.WARM_CACHE_BASE_URL,
+            help="Адрес запущенного сайта (например, http://127.0.0.1:8000), по умолчанию WARM_CACHE_BASE_URL"
+        )
+        parser.add_argument(
+            '--sources', default=','.join(settings.WARM_CACHE_SOURCES),
+            help="Источники через запятую: artworks, catalog, sitemap"
+        )
+        parser.add_argument('--top-artworks', type=int, default=settings.WARM_CACHE_TOP_ARTWORKS)
+        parser.add_argument('--top-queries', type=int, default=settings.WARM_CACHE_TOP_QUERIES)
+        parser.add_argument('--max-paths', type=int, default=settings.WARM_CACHE_MAX_PATHS)
+        parser.add_argument('--concurrency', type=int, default=settings.WARM_CACHE_CONCURRENCY, help="Одновременных запросов")
+
+    def handle(self, *args, **options):
+        # Рендер в процессе команды прогрел бы только её собственный LocMemCache и индексы,
+        # которые исчезают вместе с ней, - прогревать нужно запущенные воркеры
+        if not options['base_url']:
+            raise CommandError("Укажите --base-url или WARM_CACHE_BASE_URL: адрес запущенного сайта")
+
+        try:
+            paths = collect_paths(
+                sources=[source.strip() for source in options['sources'].split(',') if source.strip()],
+                top_artworks=options['top_artworks'],
+                top_queries=options['top_queries'],
+                max_paths=options['max_paths'],
+            )
+        except ValueError as e:
+            raise CommandError(e)
+
+        results = warm(paths, base_url=options['base_url'], concurrency=options['concurrency'])
+
+        failed = 0
+        for path, status, seconds in results:
+            if is_failed(status):
+                failed += 1
+                self.stderr.write(f"{status}  {path}")
+            elif options['verbosity'] > 1:
+                self.stdout.write(f"{status}  {seconds * 1000:6.0f} мс  {path}")
+
+        total = sum(seconds for _, _, seconds in results)
+        self.stdout.write(self.style.SUCCESS(
+            f"Прогрето страниц: {len(results) - failed} из {len(results)}, суммарное время рендера {total:.1f} с"
+        ))
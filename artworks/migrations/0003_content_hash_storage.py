@@ -0,0 +1,24 @@
+# Generated by Django 6.0.1 on 2026-10-19 10:00
+
+import artworks.storage
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('artworks', '0002_collection_updated_at'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='artworkimage',
+            name='image',
+            field=models.ImageField(storage=artworks.storage.ContentHashStorage(), upload_to='artworks/'),
+        ),
+        migrations.AlterField(
+            model_name='collection',
+            name='image',
+            field=models.ImageField(blank=True, null=True, storage=artworks.storage.ContentHashStorage(), upload_to='collections/', verbose_name='Обложка коллекции'),
+        ),
+    ]
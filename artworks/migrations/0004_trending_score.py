@@ -0,0 +1,22 @@
+# Generated by Django 6.0.1 on 2026-10-19 10:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('artworks', '0003_content_hash_storage'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='artwork',
+            name='trending_score',
+            field=models.FloatField(default=0, editable=False, verbose_name='Популярность сейчас'),
+        ),
+        migrations.AddIndex(
+            model_name='artwork',
+            index=models.Index(fields=['status', '-trending_score'], name='artworks_ar_status_5cd13f_idx'),
+        ),
+    ]
@@ -0,0 +1,31 @@
+# Generated by Django 6.0.1 on 2026-10-19 10:00
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('artworks', '0004_trending_score'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CollectionSummary',
+            fields=[
+                ('collection', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='summary', serialize=False, to='artworks.collection', verbose_name='Коллекция')),
+                ('total_count', models.PositiveIntegerField(default=0, verbose_name='Всего работ')),
+                ('available_count', models.PositiveIntegerField(default=0, verbose_name='Доступно')),
+                ('sold_count', models.PositiveIntegerField(default=0, verbose_name='Продано')),
+                ('cover', models.JSONField(blank=True, default=dict, verbose_name='Обложка')),
+                ('carousel_images', models.JSONField(blank=True, default=list, verbose_name='Карусель')),
+                ('artworks_updated_at', models.DateTimeField(blank=True, null=True, verbose_name='Последнее изменение картин')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='Дата пересчёта')),
+            ],
+            options={
+                'verbose_name': 'Сводка коллекции',
+                'verbose_name_plural': 'Сводки коллекций',
+            },
+        ),
+    ]
@@ -0,0 +1,36 @@
+# Generated by Django 6.0.1 on 2026-10-19 10:00
+
+from django.db import migrations, models
+from django.db.models import Q
+
+
+def fill_size_category(apps, schema_editor):
+    # Те же границы, что в size_category_for: сначала маленькие, из оставшихся - средние
+    Artwork = apps.get_model('artworks', 'Artwork')
+    artworks = Artwork.objects.using(schema_editor.connection.alias)
+    artworks.filter(width_cm__lte=25, height_cm__lte=25).update(size_category='small')
+    artworks.filter(size_category='').filter(
+        Q(width_cm__lte=40, height_cm__lte=60) | Q(width_cm__lte=60, height_cm__lte=40)
+    ).update(size_category='medium')
+    artworks.filter(size_category='').update(size_category='large')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('artworks', '0005_collection_summary'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='artwork',
+            name='size_category',
+            field=models.CharField(choices=[('small', 'Маленькие (до 25×25)'), ('medium', 'Средние (до 40×60)'), ('large', 'Большие (свыше 40×60 см)')], default='', editable=False, max_length=10, verbose_name='Размер'),
+            preserve_default=False,
+        ),
+        migrations.RunPython(fill_size_category, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='artwork',
+            index=models.Index(fields=['size_category'], name='artworks_ar_size_ca_86b394_idx'),
+        ),
+    ]
@@ -0,0 +1,77 @@
+# Generated by Django 6.0.1 on 2026-10-19 10:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('artworks', '0006_artwork_size_category'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='artwork',
+            name='artworks_ar_categor_bdf59c_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='artwork',
+            name='artworks_ar_theme_i_7fd45d_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='artwork',
+            name='artworks_ar_collect_381b0d_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='artwork',
+            name='artworks_ar_created_7f222a_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='artwork',
+            name='artworks_ar_size_ca_86b394_idx',
+        ),
+        migrations.AddIndex(
+            model_name='artwork',
+            index=models.Index(fields=['-created_at'], name='artworks_ar_created_809d6e_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='artwork',
+            index=models.Index(fields=['-views'], name='artworks_ar_views_f776bf_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='artwork',
+            index=models.Index(fields=['status', '-created_at'], name='artworks_ar_status_5b775d_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='artwork',
+            index=models.Index(fields=['status', 'price'], name='artworks_ar_status_9719b9_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='artwork',
+            index=models.Index(fields=['status', '-views'], name='artworks_ar_status_1982cc_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='artwork',
+            index=models.Index(fields=['status', 'title'], name='artworks_ar_status_794977_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='artwork',
+            index=models.Index(fields=['category', '-created_at'], name='artworks_ar_categor_3adc22_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='artwork',
+            index=models.Index(fields=['theme', '-created_at'], name='artworks_ar_theme_i_68c95f_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='artwork',
+            index=models.Index(fields=['size_category', '-created_at'], name='artworks_ar_size_ca_82661e_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='artwork',
+            index=models.Index(fields=['collection', '-created_year', '-created_at'], name='artworks_ar_collect_93601e_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='artwork',
+            index=models.Index(fields=['-created_year', '-created_at'], name='artworks_ar_created_bd45ba_idx'),
+        ),
+    ]
@@ -4,11 +4,33 @@ from django.utils.text import slugify
 from django.urls import reverse
 from django.utils.functional import cached_property
 from django.core.validators import MinValueValidator, MaxValueValidator
-from io import BytesIO
-from PIL import Image
 from django.core.files.base import ContentFile
-from unidecode import unidecode
-import os
+
+from .images import compress_image, readable_slug
+from .storage import media_storage
+
+def size_category_for(width_cm, height_cm):
+    """Категория размера: small / medium / large"""
+    w, h = width_cm, height_cm
+    if w <= 25 and h <= 25:
+        return 'small'
+    elif (w <= 40 and h <= 60) or (w <= 60 and h <= 40):
+        return 'medium'
+    else:
+        return 'large'
+
+
+def format_price(status, price):
+    if status == 'sold':
+        return "Нет в наличии"
+    if price:
+        return f"{price:,.0f} руб.".replace(',', ' ')
+    return "Цена по запросу"
+
+
+def format_dimensions(width_cm, height_cm):
+    return f"{width_cm}×{height_cm} см"
+
 
 class Category(models.Model):
     name = models.CharField(max_length=100, verbose_name="Название категории")
@@ -40,10 +62,12 @@ class Collection(models.Model):
     description = models.TextField(blank=True, verbose_name="Описание")
     image = models.ImageField(
         upload_to='collections/', 
+        storage=media_storage,
         blank=True, 
         null=True,
         verbose_name="Обложка коллекции"
     )
+    updated_at = models.DateTimeField(auto_now=True, verbose_name="Дата обновления")
     
     class Meta:
         verbose_name = "Коллекция"
@@ -55,8 +79,9 @@ class Collection(models.Model):
     
     @cached_property
     def artwork_count(self):
-        """Количество работ в коллекции"""
-        return self.artwork_set.count()
+        """Количество работ в коллекции (из сводки, если она загружена)"""
+        summary = getattr(self, 'summary', None)
+        return summary.total_count if summary else self.artwork_set.count()
     
     def get_absolute_url(self):
         return reverse('collection_detail', args=[self.slug])
@@ -137,15 +162,13 @@ class Artwork(models.Model):
         validators=[MinValueValidator(1), MaxValueValidator(500)]
     )
     
-    @property
-    def size_category(self):
-        w, h = self.width_cm, self.height_cm
-        if w <= 25 and h <= 25:
-            return 'small'
-        elif (w <= 40 and h <= 60) or (w <= 60 and h <= 40):
-            return 'medium'
-        else:
-            return 'large'
+    # Хранится, чтобы фильтр по размеру был равенством по индексу; считается в save()
+    size_category = models.CharField(
+        max_length=10,
+        choices=SIZE_CHOICES,
+        editable=False,
+        verbose_name="Размер"
+    )
     
     created_year = models.PositiveIntegerField(
         verbose_name="Год создания",
@@ -162,20 +185,43 @@ class Artwork(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     views = models.PositiveIntegerField(default=0, verbose_name="Просмотры")
+    # Просмотры с экспоненциальным затуханием, пересчитывается командой update_trending
+    trending_score = models.FloatField(default=0, editable=False, verbose_name="Популярность сейчас")
+    # Когда update_trending последний раз изменил trending_score (bulk_update не трогает updated_at)
+    trending_updated_at = models.DateTimeField(null=True, blank=True, editable=False, verbose_name="Пересчёт популярности")
     
     class Meta:
         verbose_name = "Картина"
         verbose_name_plural = "Картины"
         ordering = ['-created_year', '-created_at']
+        # Под реальные сочетания фильтров и сортировок (проверка - команда index_advisor)
         indexes = [
-            models.Index(fields=['category']),
-            models.Index(fields=['theme']),
-            models.Index(fields=['collection']),
-            models.Index(fields=['created_year']),
+            # Каталог без фильтров: сортировки по умолчанию и по просмотрам
+            models.Index(fields=['-created_at']),
+            models.Index(fields=['-views']),
             models.Index(fields=['price']),
+            # Каталог "в наличии" с каждой из сортировок, главная и "популярное"
+            models.Index(fields=['status', '-created_at']),
+            models.Index(fields=['status', 'price']),
+            models.Index(fields=['status', '-views']),
+            models.Index(fields=['status', 'title']),
+            models.Index(fields=['status', '-trending_score']),
+            # Фильтр по категории, тематике, размеру с сортировкой по умолчанию, со статусом и без
+            models.Index(fields=['category', '-created_at']),
+            models.Index(fields=['theme', '-created_at']),
+            models.Index(fields=['size_category', '-created_at']),
+            # Страница коллекции и порядок по умолчанию (Meta.ordering)
+            models.Index(fields=['collection', '-created_year', '-created_at']),
+            models.Index(fields=['-created_year', '-created_at']),
         ]
     
     def save(self, *args, **kwargs):
+        update_fields = kwargs.get('update_fields')
+        if update_fields is None or {'width_cm', 'height_cm'} & set(update_fields):
+            self.size_category = size_category_for(self.width_cm, self.height_cm)
+            if update_fields is not None:
+                kwargs['update_fields'] = {*update_fields, 'size_category'}
+
         if not self.slug:
             base_slug = slugify(self.title)
             slug = base_slug
@@ -195,14 +241,10 @@ class Artwork(models.Model):
         return []
     
     def get_price_display(self):
-        if self.status == 'sold':
-            return "Нет в наличии"
-        if self.price:
-            return f"{self.price:,.0f} руб.".replace(',', ' ')
-        return "Цена по запросу"
+        return format_price(self.status, self.price)
     
     def get_dimensions(self):
-        return f"{self.width_cm}×{self.height_cm} см"
+        return format_dimensions(self.width_cm, self.height_cm)
     
     def get_size_category_display(self):
         size_map = {
@@ -226,7 +268,7 @@ class ArtworkImage(models.Model):
         on_delete=models.CASCADE, 
         related_name='images'
     )
-    image = models.ImageField(upload_to='artworks/%Y/%m/%d/')
+    image = models.ImageField(upload_to='artworks/', storage=media_storage)
     order = models.PositiveIntegerField(default=0)
     is_primary = models.BooleanField(default=False)
     
@@ -251,43 +293,13 @@ class ArtworkImage(models.Model):
         
         if is_new_image and self.image:
             try:
-                img = Image.open(self.image)
-                
-                # Максимальные размеры
-                max_width = 2000
-                max_height = 2000
-                
-                # Изменяем размер если нужно
-                if img.width > max_width or img.height > max_height:
-                    img.thumbnail((max_width, max_height), Image.Resampling.LANCZOS)
-                
-                # Конвертируем в RGB если нужно
-                if img.mode in ('RGBA', 'LA', 'P'):
-                    background = Image.new('RGB', img.size, (255, 255, 255))
-                    if img.mode in ('RGBA', 'LA'):
-                        background.paste(img, mask=img.split()[-1])
-                    else:
-                        background.paste(img)
-                    img = background
-                
-                # Сохраняем в буфер
-                img_io = BytesIO()
-                img.save(img_io, format='JPEG', quality=85, optimize=True)
-                img_io.seek(0)
-                
-                # Транслитерируем имя файла
-                original_name = os.path.basename(self.image.name)
-                name, ext = os.path.splitext(original_name)
-                
-                # Конвертируем кириллицу в латиницу
-                name = unidecode(name)  # Транслитерация
-                name = slugify(name)     # Убираем спецсимволы, делаем нижний регистр
-                
-                new_name = f"{name}_compressed.jpg"
+                # Та же обработка, что у загрузок CKEditor (artworks/images.py)
+                data = compress_image(self.image, max_width=2000, max_height=2000)
+                new_name = f"{readable_slug(self.image.name)}_compressed.jpg"
                 
                 self.image.save(
                     new_name,
-                    ContentFile(img_io.getvalue()),
+                    ContentFile(data),
                     save=False
                 )
             except Exception as e:
@@ -309,4 +321,34 @@ class ArtworkImage(models.Model):
         super().save(*args, **kwargs)
     
     def __str__(self):
-        return f"Изображение для {self.artwork.title}"
\ No newline at end of file
+        return f"Изображение для {self.artwork.title}"
+
+
+class CollectionSummary(models.Model):
+    """
+    Денормализованная сводка коллекции для страниц коллекций и sitemap.
+    Пересчитывается сигналами при изменении картин и изображений (artworks/summaries.py).
+    """
+    collection = models.OneToOneField(
+        Collection,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name='summary',
+        verbose_name="Коллекция"
+    )
+    total_count = models.PositiveIntegerField(default=0, verbose_name="Всего работ")
+    available_count = models.PositiveIntegerField(default=0, verbose_name="Доступно")
+    sold_count = models.PositiveIntegerField(default=0, verbose_name="Продано")
+    # {'url', 'srcset', 'width', 'height'} обложки коллекции
+    cover = models.JSONField(default=dict, blank=True, verbose_name="Обложка")
+    # [{'url', 'srcset', 'alt', 'artwork_url'}] для карусели на странице коллекции
+    carousel_images = models.JSONField(default=list, blank=True, verbose_name="Карусель")
+    artworks_updated_at = models.DateTimeField(null=True, blank=True, verbose_name="Последнее изменение картин")
+    updated_at = models.DateTimeField(auto_now=True, verbose_name="Дата пересчёта")
+
+    class Meta:
+        verbose_name = "Сводка коллекции"
+        verbose_name_plural = "Сводки коллекций"
+
+    def __str__(self):
+        return f"Сводка: {self.collection_id}"
@@ -0,0 +1,171 @@
+# artworks/search_index.py
+import bisect
+import threading
+import time
+
+from django.core.cache import cache
+from django.urls import reverse
+from django.utils.http import urlencode
+
+# Версия индекса в общем кэше: меняется сигналами при сохранении моделей
+INDEX_VERSION_KEY = 'search_index_version'
+# Страховка для воркеров, до которых не дошёл сигнал (LocMemCache у каждого свой)
+INDEX_MAX_AGE = 300
+
+SUGGEST_LIMIT = 8
+
+KIND_LABELS = {
+    'artwork': 'Картина',
+    'collection': 'Коллекция',
+    'category': 'Категория',
+    'theme': 'Тематика',
+    'tag': 'Тег',
+    'post': 'Статья',
+}
+
+
+def fold(text):
+    """Нормализация для сравнения: регистр (в т.ч. кириллица) и ё -> е"""
+    return ' '.join(text.casefold().replace('ё', 'е').split())
+
+
+class PrefixIndex:
+    """
+    Отсортированный массив ключей для поиска по префиксу через bisect.
+
+    Для каждой записи индексируется полное название и все его "хвосты"
+    по словам, поэтому "мор" находит и "Море", и "Летнее море".
+    """
+
+    def __init__(self, entries):
+        self.entries = list(entries)
+        pairs = []
+        for entry_id, (label, kind, url) in enumerate(self.entries):
+            words = fold(label).split()
+            for i in range(len(words)):
+                pairs.append((' '.join(words[i:]), entry_id))
+        pairs.sort()
+        self.keys = [key for key, _ in pairs]
+        self.ids = [entry_id for _, entry_id in pairs]
+
+    def __len__(self):
+        return len(self.entries)
+
+    def search(self, prefix, limit=SUGGEST_LIMIT):
+        prefix = fold(prefix)
+        if not prefix:
+            return []
+
+        results = []
+        seen = set()
+        for pos in range(bisect.bisect_left(self.keys, prefix), len(self.keys)):
+            if not self.keys[pos].startswith(prefix):
+                break
+            entry_id = self.ids[pos]
+            if entry_id in seen:
+                continue
+            seen.add(entry_id)
+            results.append(self.entries[entry_id])
+            if len(results) >= limit:
+                break
+        return results
+
+
+def build_index():
+    from blog.models import BlogPost
+    from .models import Artwork, Category, Collection, Theme
+
+    catalog_url = reverse('catalog')
+    entries = []
+    tags = {}
+
+    for title, slug, tags_str in Artwork.objects.values_list('title', 'slug', 'tags'):
+        entries.append((title, 'artwork', reverse('artwork_detail', kwargs={'slug': slug})))
+        for tag in (tags_str or '').split(','):
+            tag = tag.strip()
+            if tag:
+                tags.setdefault(fold(tag), tag)
+
+    for name, slug in Collection.objects.values_list('name', 'slug'):
+        entries.append((name, 'collection', reverse('collection_detail', args=[slug])))
+    for pk, name in Category.objects.values_list('pk', 'name'):
+        entries.append((name, 'category', f"{catalog_url}?category={pk}"))
+    for pk, name in Theme.objects.values_list('pk', 'name'):
+        entries.append((name, 'theme', f"{catalog_url}?theme={pk}"))
+    for tag in tags.values():
+        entries.append((tag, 'tag', f"{catalog_url}?{urlencode({'q': tag})}"))
+
+    for title, slug in BlogPost.objects.filter(status='published').values_list('title', 'slug'):
+        entries.append((title, 'post', reverse('blog_post_detail', kwargs={'slug': slug})))
+
+    return PrefixIndex(entries)
+
+
+class LazyIndex:
+    """
+    Индекс в памяти процесса, который лениво перестраивается,
+    если сменилась версия в кэше или истёк INDEX_MAX_AGE.
+    """
+
+    def __init__(self, builder):
+        self.builder = builder
+        self.index = None
+        self.built_at = 0.0
+        self.built_version = None
+        self.lock = threading.Lock()
+
+    def is_stale(self, version):
+        return (
+            self.index is None
+            or version != self.built_version
+            or time.monotonic() - self.built_at > INDEX_MAX_AGE
+        )
+
+    def get(self):
+        version = cache.get(INDEX_VERSION_KEY, 0)
+        if self.is_stale(version):
+            with self.lock:
+                if self.is_stale(version):
+                    self.index = self.builder()
+                    self.built_at = time.monotonic()
+                    self.built_version = version
+        return self.index
+
+    def reset(self):
+        self.built_version = None
+
+
+_indexes = []
+
+
+def lazy_index(builder):
+    index = LazyIndex(builder)
+    _indexes.append(index)
+    return index
+
+
+def invalidate():
+    """Сбрасывает все индексы: локально сразу, в других процессах - через версию в кэше"""
+    for index in _indexes:
+        index.reset()
+    try:
+        cache.incr(INDEX_VERSION_KEY)
+    except ValueError:
+        cache.set(INDEX_VERSION_KEY, 1, None)
+
+
+def build_all():
+    """Строит все индексы процесса заранее, не дожидаясь первого поиска (warm_cache)"""
+    for index in _indexes:
+        index.get()
+    return len(_indexes)
+
+
+suggest_index = lazy_index(build_index)
+
+
+def suggest(query, limit=SUGGEST_LIMIT):
+    return [
+        {'label': label, 'kind': kind, 'kind_display': KIND_LABELS[kind], 'url': url}
+        for label, kind, url in suggest_index.get().search(query, limit)
+    ]
@@ -0,0 +1,123 @@
+# artworks/signals.py
+from django.conf import settings
+from django.db.models.signals import post_save, post_delete, pre_save
+from django.dispatch import receiver
+from django.utils import timezone
+
+from blog.models import BlogPost
+
+from . import counts, search_index
+from .models import Artwork, ArtworkImage, Category, Collection, Theme
+from .summaries import refresh_collection_summary
+
+
+@receiver(post_save, sender=ArtworkImage)
+@receiver(post_delete, sender=ArtworkImage)
+def touch_artwork_on_image_change(sender, instance, **kwargs):
+    """Изменение изображений меняет страницу картины - обновляем её updated_at"""
+    Artwork.objects.filter(pk=instance.artwork_id).update(updated_at=timezone.now())
+    collection_id = Artwork.objects.filter(pk=instance.artwork_id).values_list('collection_id', flat=True).first()
+    if collection_id:
+        refresh_collection_summary(collection_id)
+
+
+@receiver(post_save, sender=Category)
+@receiver(post_save, sender=Theme)
+def touch_artworks_on_taxonomy_change(sender, instance, **kwargs):
+    """Переименование категории/тематики меняет карточки связанных картин"""
+    field = 'category' if sender is Category else 'theme'
+    artworks = Artwork.objects.filter(**{field: instance})
+    artworks.update(updated_at=timezone.now())
+    collection_ids = artworks.exclude(collection=None).values_list('collection_id', flat=True).distinct()
+    for collection_id in list(collection_ids):
+        refresh_collection_summary(collection_id)
+
+
+# Поля, которые не попадают на страницы коллекций
+SUMMARY_IGNORED_FIELDS = {'views', 'trending_score', 'trending_updated_at'}
+
+
+@receiver(pre_save, sender=Artwork)
+def remember_artwork_collection(sender, instance, update_fields=None, **kwargs):
+    """Запоминаем прежнюю коллекцию, чтобы пересчитать и её сводку"""
+    if instance.pk and not (update_fields and set(update_fields) <= SUMMARY_IGNORED_FIELDS):
+        instance._previous_collection_id = (
+            Artwork.objects.filter(pk=instance.pk).values_list('collection_id', flat=True).first()
+        )
+
+
+@receiver(post_save, sender=Artwork)
+@receiver(post_delete, sender=Artwork)
+def refresh_summaries_on_artwork_change(sender, instance, update_fields=None, **kwargs):
+    if update_fields and set(update_fields) <= SUMMARY_IGNORED_FIELDS:
+        return
+    collection_ids = {instance.collection_id, getattr(instance, '_previous_collection_id', None)}
+    for collection_id in collection_ids - {None}:
+        refresh_collection_summary(collection_id)
+
+
+@receiver(post_save, sender=Collection)
+def refresh_summary_on_collection_change(sender, instance, **kwargs):
+    """Обложка коллекции входит в сводку"""
+    refresh_collection_summary(instance.pk)
+
+
+# Поля, от которых зависит индекс подсказок поиска
+SEARCH_INDEX_FIELDS = {'title', 'slug', 'tags', 'name', 'status'}
+
+
+def invalidate_search_index(sender, instance, update_fields=None, **kwargs):
+    # Счётчик просмотров сохраняется с update_fields=['views'] - индекс не трогаем
+    if update_fields and not SEARCH_INDEX_FIELDS & set(update_fields):
+        return
+    search_index.invalidate()
+
+
+for model in (Artwork, Collection, Category, Theme, BlogPost):
+    post_save.connect(invalidate_search_index, sender=model, dispatch_uid=f'search_index_save_{model.__name__}')
+    post_delete.connect(invalidate_search_index, sender=model, dispatch_uid=f'search_index_delete_{model.__name__}')
+
+
+def invalidate_counts(sender, instance, update_fields=None, **kwargs):
+    # Просмотры и рейтинг не меняют состав выборок каталога и поиска
+    if update_fields and set(update_fields) <= SUMMARY_IGNORED_FIELDS:
+        return
+    counts.invalidate(sender)
+
+
+for model in (Artwork, Collection, BlogPost):
+    post_save.connect(invalidate_counts, sender=model, dispatch_uid=f'counts_save_{model.__name__}')
+    post_delete.connect(invalidate_counts, sender=model, dispatch_uid=f'counts_delete_{model.__name__}')
+
+
+def memory_engine():
+    """Движок каталога в памяти или None; без CATALOG_MEMORY_ENGINE NumPy не импортируется"""
+    if not settings.CATALOG_MEMORY_ENGINE:
+        return None
+    from .catalog_engine import engine
+
+    return engine
+
+
+@receiver(post_save, sender=Artwork)
+def update_catalog_engine(sender, instance, **kwargs):
+    engine = memory_engine()
+    if engine is not None:
+        engine.artwork_saved(instance.pk)
+
+
+@receiver(post_delete, sender=Artwork)
+def remove_from_catalog_engine(sender, instance, **kwargs):
+    engine = memory_engine()
+    if engine is not None:
+        engine.artwork_deleted(instance.pk)
+
+
+@receiver(post_delete, sender=Category)
+@receiver(post_delete, sender=Theme)
+@receiver(post_delete, sender=Collection)
+def invalidate_catalog_engine(sender, instance, **kwargs):
+    # SET_NULL у картин выполняется одним UPDATE без сигналов
+    engine = memory_engine()
+    if engine is not None:
+        engine.invalidate()
@@ -24,11 +24,11 @@ class CollectionSitemap(Sitemap):
     protocol = 'http'  # ← http для локальной разработки
 
     def items(self):
-        return Collection.objects.all()
+        return Collection.objects.select_related('summary')
 
     def lastmod(self, obj):
-        artworks = obj.artwork_set.order_by('-updated_at')
-        return artworks.first().updated_at if artworks.exists() else None
+        summary = getattr(obj, 'summary', None)
+        return summary.artworks_updated_at if summary else None
 
     def location(self, obj):
         return obj.get_absolute_url()
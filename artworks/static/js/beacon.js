@@ -0,0 +1,99 @@
+// Пачка событий аналитики для /analytics/collect: просмотр, увеличение изображения, время на странице,
+// на странице каталога - набор фильтров (по популярным наборам warm_cache прогревает каталог)
+(function() {
+    'use strict';
+
+    const config = document.getElementById('analytics-beacon');
+    if (!config) {
+        return;
+    }
+
+    function start() {
+        const url = config.dataset.collectUrl;
+        if (url && config.dataset.catalog !== undefined) {
+            const body = new Blob([JSON.stringify({ events: [{ type: 'catalog', query: window.location.search }] })], { type: 'text/plain' });
+            if (!(navigator.sendBeacon && navigator.sendBeacon(url, body))) {
+                fetch(url, { method: 'POST', body: body, keepalive: true, credentials: 'same-origin' }).catch(() => {});
+            }
+            return;
+        }
+
+        const target = config.dataset.artwork ? 'artwork' : 'post';
+        const targetId = parseInt(config.dataset.artwork || config.dataset.post, 10);
+        if (!url || !targetId) {
+            return;
+        }
+
+        let queue = [];
+        // Время считаем только пока вкладка видима
+        let visibleSince = document.visibilityState === 'visible' ? Date.now() : null;
+        let visibleTotal = 0;
+
+        function track(type, value) {
+            const event = { type: type };
+            event[target] = targetId;
+            if (value !== undefined) {
+                event.value = value;
+            }
+            queue.push(event);
+        }
+
+        function takeTime() {
+            if (visibleSince !== null) {
+                visibleTotal += Date.now() - visibleSince;
+                visibleSince = null;
+            }
+            const seconds = Math.round(visibleTotal / 1000);
+            visibleTotal = 0;
+            if (seconds > 0) {
+                track('time', seconds);
+            }
+        }
+
+        function flush() {
+            if (!queue.length) {
+                return;
+            }
+            // text/plain не требует preflight-запроса
+            const body = new Blob([JSON.stringify({ events: queue })], { type: 'text/plain' });
+            queue = [];
+            if (navigator.sendBeacon && navigator.sendBeacon(url, body)) {
+                return;
+            }
+            fetch(url, { method: 'POST', body: body, keepalive: true, credentials: 'same-origin' }).catch(() => {});
+        }
+
+        track('view');
+        flush();
+
+        // Увеличение изображения: открытие модального окна с картиной
+        document.addEventListener('shown.bs.modal', function(e) {
+            if (e.target.id === 'imageModal') {
+                const active = document.querySelector('.thumbnail.active');
+                const thumbnails = Array.from(document.querySelectorAll('.thumbnail'));
+                track('zoom', active ? thumbnails.indexOf(active) : 0);
+            }
+        });
+
+        document.addEventListener('visibilitychange', function() {
+            if (document.visibilityState === 'hidden') {
+                takeTime();
+                flush();
+            } else {
+                visibleSince = Date.now();
+            }
+        });
+
+        window.addEventListener('pagehide', function() {
+            takeTime();
+            flush();
+        });
+    }
+
+    // Страница, загруженная заранее (Speculation Rules), учитывается только после перехода на неё
+    if (document.prerendering) {
+        document.addEventListener('prerenderingchange', start, { once: true });
+    } else {
+        start();
+    }
+})();
@@ -300,4 +300,101 @@ document.addEventListener('DOMContentLoaded', function() {
     adjustFilterHeight();
     window.addEventListener('resize', adjustFilterHeight);
     window.addEventListener('scroll', adjustFilterHeight);
+    
+    // Подгрузка следующих страниц через JSON API (бесконечная прокрутка)
+    const loadMoreBtn = document.getElementById('load-more');
+    
+    function escapeHtml(value) {
+        const div = document.createElement('div');
+        div.textContent = value == null ? '' : String(value);
+        return div.innerHTML;
+    }
+    
+    function renderCard(card) {
+        const image = card.image
+            ? `<img src="${escapeHtml(card.image)}" class="card-img-top artwork-image" alt="${escapeHtml(card.title)}" loading="lazy">`
+            : `<div class="card-img-top artwork-image bg-light d-flex align-items-center justify-content-center">
+                   <i class="bi bi-image text-muted fs-1"></i>
+               </div>`;
+        const category = card.category
+            ? `<span class="badge bg-light text-dark me-1"><i class="bi bi-palette me-1"></i>${escapeHtml(card.category)}</span>`
+            : '';
+        const theme = card.theme
+            ? `<span class="badge bg-light text-dark"><i class="bi bi-tag me-1"></i>${escapeHtml(card.theme)}</span>`
+            : '';
+        let description = card.short_description || '';
+        if (description.length >= 100) {
+            description = description.slice(0, 99) + '…';
+        }
+        
+        const col = document.createElement('div');
+        col.className = 'col';
+        col.innerHTML = `
+            <div class="card h-100 border-0 shadow-sm artwork-card">
+                <a href="${escapeHtml(card.url)}" class="text-decoration-none">
+                    ${image}
+                    <div class="card-body d-flex flex-column">
+                        <h5 class="card-title text-dark mb-2">${escapeHtml(card.title)}</h5>
+                        <div class="mb-2">${category}${theme}</div>
+                        <p class="card-text text-muted small mb-3 flex-grow-1">${escapeHtml(description)}</p>
+                        <div class="mb-3">
+                            <small class="text-muted d-block"><i class="bi bi-rulers me-1"></i>${escapeHtml(card.size)}</small>
+                        </div>
+                        <div class="d-flex justify-content-between align-items-center mt-auto">
+                            <div class="${card.status === 'sold' ? 'text-danger' : 'text-primary'} fw-bold">${escapeHtml(card.price_display)}</div>
+                            <small class="text-muted"><i class="bi bi-eye me-1"></i>${escapeHtml(card.views)}</small>
+                        </div>
+                    </div>
+                </a>
+            </div>`;
+        return col;
+    }
+    
+    if (loadMoreBtn && artworksGrid) {
+        let loading = false;
+        
+        function loadNextPage() {
+            const nextPage = loadMoreBtn.dataset.nextPage;
+            if (loading || !nextPage) return;
+            loading = true;
+            loadMoreBtn.disabled = true;
+            
+            fetch(`${loadMoreBtn.dataset.apiUrl}&page=${nextPage}`, {
+                headers: { 'Accept': 'application/json' }
+            })
+                .then(response => response.json())
+                .then(data => {
+                    data.results.forEach(card => artworksGrid.appendChild(renderCard(card)));
+                    
+                    // После подгрузки номера страниц уже не соответствуют списку
+                    const pagination = document.querySelector('nav[aria-label="Пагинация"]');
+                    if (pagination) {
+                        pagination.style.display = 'none';
+                    }
+                    
+                    if (data.next_page) {
+                        loadMoreBtn.dataset.nextPage = data.next_page;
+                        loadMoreBtn.disabled = false;
+                    } else {
+                        loadMoreBtn.parentElement.remove();
+                        if (observer) observer.disconnect();
+                    }
+                })
+                .catch(() => {
+                    loadMoreBtn.disabled = false;
+                })
+                .finally(() => {
+                    loading = false;
+                });
+        }
+        
+        loadMoreBtn.addEventListener('click', loadNextPage);
+        
+        const observer = 'IntersectionObserver' in window
+            ? new IntersectionObserver(entries => {
+                if (entries.some(entry => entry.isIntersecting)) loadNextPage();
+            }, { rootMargin: '400px' })
+            : null;
+        if (observer) observer.observe(loadMoreBtn);
+    }
 });
\ No newline at end of file
@@ -31,4 +31,72 @@ document.addEventListener('DOMContentLoaded', function() {
             }, 100);
         });
     }
+    
+    // Подсказки в строке поиска
+    const suggestInput = document.querySelector('input[data-suggest-url]');
+    const suggestBox = suggestInput ? suggestInput.parentElement.querySelector('.search-suggestions') : null;
+    
+    if (suggestInput && suggestBox) {
+        let suggestTimeout;
+        let lastQuery = '';
+        
+        function hideSuggestions() {
+            suggestBox.classList.add('d-none');
+            suggestBox.innerHTML = '';
+        }
+        
+        function showSuggestions(items) {
+            suggestBox.innerHTML = '';
+            items.forEach(item => {
+                const link = document.createElement('a');
+                link.className = 'list-group-item list-group-item-action d-flex justify-content-between align-items-center';
+                link.href = item.url;
+                
+                const label = document.createElement('span');
+                label.textContent = item.label;
+                const kind = document.createElement('small');
+                kind.className = 'text-muted ms-2';
+                kind.textContent = item.kind_display;
+                
+                link.append(label, kind);
+                suggestBox.appendChild(link);
+            });
+            suggestBox.classList.toggle('d-none', items.length === 0);
+        }
+        
+        suggestInput.addEventListener('input', function() {
+            clearTimeout(suggestTimeout);
+            const query = this.value.trim();
+            if (!query) {
+                lastQuery = '';
+                hideSuggestions();
+                return;
+            }
+            
+            suggestTimeout = setTimeout(() => {
+                lastQuery = query;
+                fetch(`${suggestInput.dataset.suggestUrl}?q=${encodeURIComponent(query)}`)
+                    .then(response => response.json())
+                    .then(data => {
+                        // Ответ на устаревший запрос не показываем
+                        if (data.query === lastQuery) {
+                            showSuggestions(data.suggestions);
+                        }
+                    })
+                    .catch(hideSuggestions);
+            }, 150);
+        });
+        
+        suggestInput.addEventListener('keydown', function(e) {
+            if (e.key === 'Escape') {
+                hideSuggestions();
+            }
+        });
+        
+        document.addEventListener('click', function(e) {
+            if (!suggestBox.contains(e.target) && e.target !== suggestInput) {
+                hideSuggestions();
+            }
+        });
+    }
 });
\ No newline at end of file
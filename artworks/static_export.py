@@ -0,0 +1,208 @@
+# artworks/static_export.py
+import html
+import json
+import os
+import re
+from pathlib import Path
+from urllib.parse import parse_qsl, urljoin, urlsplit
+
+from django.db import connections
+from django.urls import reverse
+
+from .http_cache import combine, content_state, site_state
+
+# Состояние прошлой выгрузки в каталоге сайта (в nginx закрыть доступ к скрытым файлам)
+MANIFEST_NAME = '.export-manifest.json'
+LINK_RE = re.compile(r'(?P<attr>\bhref|\bsrc)="(?P<url>[^"]*)"')
+
+
+def seed_urls():
+    """Все публичные страницы, которые не зависят от параметров запроса"""
+    from blog.models import BlogPost
+    from .models import Artwork, Collection
+
+    urls = [reverse(name) for name in ('home', 'catalog', 'about', 'contact', 'terms', 'collections', 'blog_list')]
+    urls += [reverse('artwork_detail', kwargs={'slug': slug}) for slug in Artwork.objects.values_list('slug', flat=True)]
+    urls += [reverse('collection_detail', args=[slug]) for slug in Collection.objects.values_list('slug', flat=True)]
+    urls += [
+        reverse('blog_post_detail', kwargs={'slug': slug})
+        for slug in BlogPost.objects.filter(status='published').values_list('slug', flat=True)
+    ]
+    urls += [reverse('django.contrib.sitemaps.views.sitemap'), reverse('robots_txt')]
+    return urls
+
+
+def page_number(url):
+    """Номер страницы, если из параметров в url есть только page, иначе None"""
+    params = [(key, value) for key, value in parse_qsl(urlsplit(url).query) if value]
+    if len(params) == 1 and params[0][0] == 'page' and params[0][1].isdigit():
+        return int(params[0][1])
+    return None
+
+
+def canonical(url):
+    """/catalog/?page=1 -> /catalog/, /catalog/?page=2& -> /catalog/?page=2"""
+    parts = urlsplit(url)
+    number = page_number(url)
+    if number is None or number == 1:
+        return parts.path
+    return f'{parts.path}?page={number}'
+
+
+def static_location(url):
+    """Адрес страницы в выгрузке: параметр page становится частью пути"""
+    parts = urlsplit(url)
+    number = page_number(url)
+    if number is None or number == 1:
+        return parts.path
+    return f'{parts.path}page/{number}/'
+
+
+def file_for(location):
+    """Файл для адреса: каталоги - index.html, sitemap.xml и robots.txt - как есть"""
+    relative = location.lstrip('/')
+    if not relative or relative.endswith('/'):
+        relative += 'index.html'
+    return relative
+
+
+def pagination_links(url, content):
+    """Ссылки страницы на другие её страницы (?page=N на том же пути)"""
+    path = urlsplit(url).path
+    for match in LINK_RE.finditer(content):
+        target = urljoin(url, html.unescape(match['url']))
+        if urlsplit(target).path == path and page_number(target) is not None:
+            yield canonical(target)
+
+
+def rewrite_links(url, content, exported):
+    """Ссылки на выгруженные страницы с ?page=N заменяются адресами файлов"""
+    def replace(match):
+        target = urljoin(url, html.unescape(match['url']))
+        if '?' not in target or canonical(target) not in exported:
+            return match[0]
+        return f'{match["attr"]}="{static_location(target)}"'
+
+    return LINK_RE.sub(replace, content)
+
+
+def content_last_modified():
+    """Дата изменения данных для страниц без своих валидаторов (главная, "Обо мне" - с популярными картинами)"""
+    from .models import Artwork
+
+    stamp, state = combine(content_state(Artwork.objects.all(), trending=True), site_state())
+    return f'{stamp.isoformat()}|{state}' if stamp else None
+
+
+class StaticExporter:
+    """
+    Рендерит публичные страницы тестовым клиентом Django в каталог HTML-файлов.
+
+    Страницы с cache_policy запрашиваются с ETag прошлой выгрузки: ответ 304
+    (валидаторы view не изменились) - файл не перезаписывается. Остальные
+    страницы перерисовываются, только если изменились картины, коллекции или
+    посты. Страницы, которых больше нет, удаляются.
+    """
+
+    def __init__(self, output_dir, host, secure=False, full=False):
+        from django.test import Client
+
+        self.output_dir = Path(output_dir)
+        self.client = Client(HTTP_HOST=host, raise_request_exception=False)
+        self.secure = secure
+        self.manifest_path = self.output_dir / MANIFEST_NAME
+        self.full = full
+        self.previous, self.previous_seeds = self._load_manifest()
+        self.stamp = content_last_modified()
+
+    def _load_manifest(self):
+        try:
+            manifest = json.loads(self.manifest_path.read_text(encoding='utf-8'))
+            return manifest.get('pages', {}), manifest.get('seeds', [])
+        except FileNotFoundError:
+            return {}, []
+        except (OSError, ValueError) as e:
+            print(f"Ошибка чтения {self.manifest_path}: {e}, выгружается всё")
+            return {}, []
+
+    def _fetch(self, url, reuse=True):
+        previous = self.previous.get(url, {}) if reuse else {}
+        if previous and not (self.output_dir / previous['file']).exists():
+            previous = {}
+        headers = {}
+        if previous.get('etag'):
+            headers['HTTP_IF_NONE_MATCH'] = previous['etag']
+        elif previous.get('stamp') and previous['stamp'] == self.stamp:
+            return 304, None, previous
+        response = self.client.get(url, secure=self.secure, **headers)
+        entry = {'file': file_for(static_location(url)), 'etag': response.get('ETag'), 'stamp': self.stamp}
+        content = response.content.decode() if response.status_code == 200 else None
+        return response.status_code, content, entry
+
+    def _write(self, relative, content):
+        path = self.output_dir / relative
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f'.{path.name}.tmp')
+        tmp.write_text(content, encoding='utf-8')
+        os.replace(tmp, path)
+
+    def export(self):
+        """Возвращает (перерисовано, без изменений, удалено, [(url, статус)] ошибок)"""
+        pages = {}
+        rendered = {}
+        errors = []
+        seeds = list(dict.fromkeys(seed_urls()))
+        # Удаление картины, коллекции или поста не меняет max(updated_at) -
+        # при смене набора страниц перерисовывается всё
+        reuse = not self.full and set(seeds) == set(self.previous_seeds)
+        queue = list(seeds)
+        seen = set(queue)
+        try:
+            while queue:
+                url = queue.pop(0)
+                status, content, entry = self._fetch(url, reuse)
+                if status == 304:
+                    pages[url] = self.previous[url]
+                    links = self.previous[url].get('pages', [])
+                elif status == 200:
+                    pages[url] = entry
+                    rendered[url] = content
+                    links = sorted(set(pagination_links(url, content)) - {url})
+                    entry['pages'] = links
+                else:
+                    errors.append((url, status))
+                    # Прежний файл остаётся до следующей удачной выгрузки
+                    if url in self.previous:
+                        pages[url] = self.previous[url]
+                    continue
+                for link in links:
+                    if link not in seen:
+                        seen.add(link)
+                        queue.append(link)
+        finally:
+            connections.close_all()
+
+        for url, content in rendered.items():
+            if pages[url]['file'].endswith('.html'):
+                content = rewrite_links(url, content, pages)
+            self._write(pages[url]['file'], content)
+
+        removed = 0
+        current_files = {entry['file'] for entry in pages.values()}
+        for url, entry in self.previous.items():
+            if url not in pages and entry['file'] not in current_files:
+                path = self.output_dir / entry['file']
+                try:
+                    path.unlink()
+                    removed += 1
+                except FileNotFoundError:
+                    continue
+                # Пустые каталоги страницы (artwork/<slug>/) тоже убираются
+                for parent in path.parents:
+                    if parent == self.output_dir or any(parent.iterdir()):
+                        break
+                    parent.rmdir()
+
+        manifest = {'seeds': seeds, 'pages': pages}
+        self._write(MANIFEST_NAME, json.dumps(manifest, ensure_ascii=False, indent=1))
+        return len(rendered), len(pages) - len(rendered), removed, errors
@@ -0,0 +1,57 @@
+# artworks/storage.py
+import hashlib
+import os
+import posixpath
+import re
+
+from django.core.files.storage import FileSystemStorage
+from django.utils.deconstruct import deconstructible
+
+from .images import HASH_LENGTH, find_by_hash, hashed_name
+
+# ab/<hash>_<slug>.ext - такие файлы никогда не перезаписываются
+HASHED_NAME_RE = re.compile(r'(^|/)[0-9a-f]{2}/[0-9a-f]{%d}(_[^/]*)?\.\w+$' % HASH_LENGTH)
+
+IMMUTABLE_CACHE_CONTROL = 'public, max-age=31536000, immutable'
+
+
+def is_hashed_name(name):
+    return bool(HASHED_NAME_RE.search(name))
+
+
+@deconstructible
+class ContentHashStorage(FileSystemStorage):
+    """
+    Файлы именуются по хэшу содержимого: upload_to/ab/<hash>_<slug>.ext.
+
+    Одинаковые файлы сохраняются один раз, а по одному URL всегда
+    отдаётся одно и то же содержимое, поэтому медиа можно кэшировать навсегда.
+    """
+
+    def get_available_name(self, name, max_length=None):
+        # Имя определяется содержимым, перезапись безопасна
+        return name
+
+    def _save(self, name, content):
+        digest = self._content_hash(content)
+        directory, filename = posixpath.split(name.replace(os.sep, '/'))
+        ext = os.path.splitext(filename)[1].lower() or '.jpg'
+
+        existing = find_by_hash(self, directory, digest)
+        if existing:
+            return existing
+        return super()._save(hashed_name(directory, digest, filename, ext=ext), content)
+
+    @staticmethod
+    def _content_hash(content):
+        sha = hashlib.sha256()
+        if hasattr(content, 'seek'):
+            content.seek(0)
+        for chunk in content.chunks():
+            sha.update(chunk)
+        if hasattr(content, 'seek'):
+            content.seek(0)
+        return sha.hexdigest()[:HASH_LENGTH]
+
+
+media_storage = ContentHashStorage()
@@ -0,0 +1,88 @@
+# artworks/summaries.py
+from django.db.models import Count, Max, Q
+
+from blog.rendering import image_renditions
+
+CAROUSEL_LIMIT = 10
+
+
+def image_variant(field_file):
+    """url, srcset и размеры изображения с адаптивными копиями (blog/rendering.py)"""
+    variant = {'url': field_file.url, 'srcset': '', 'width': None, 'height': None, 'large_url': field_file.url}
+    try:
+        width, height, renditions = image_renditions(field_file.name)
+    except (OSError, ValueError) as e:
+        print(f"Ошибка подготовки копий изображения {field_file.name}: {e}")
+        return variant
+
+    srcset = [f"{url} {w}w" for url, w in renditions] + [f"{field_file.url} {width}w"]
+    variant.update({
+        'srcset': ', '.join(srcset),
+        'width': width,
+        'height': height,
+        # Для фона карусели хватает самой большой копии
+        'large_url': renditions[-1][0] if renditions else field_file.url,
+    })
+    return variant
+
+
+def refresh_collection_summary(collection_id):
+    """Пересчитывает сводку коллекции, возвращает её (None, если коллекции нет)"""
+    from .models import Artwork, ArtworkImage, Collection, CollectionSummary
+
+    collection = Collection.objects.filter(pk=collection_id).first()
+    if collection is None:
+        return None
+
+    stats = Artwork.objects.filter(collection_id=collection_id).aggregate(
+        total=Count('id'),
+        available=Count('id', filter=Q(status='available')),
+        sold=Count('id', filter=Q(status='sold')),
+        updated=Max('updated_at'),
+    )
+
+    primary_images = (
+        ArtworkImage.objects
+        .filter(artwork__collection_id=collection_id, is_primary=True)
+        .select_related('artwork')
+        .order_by('-artwork__created_year', '-artwork__created_at')[:CAROUSEL_LIMIT]
+    )
+    carousel_images = []
+    for image in primary_images:
+        variant = image_variant(image.image)
+        carousel_images.append({
+            'url': variant['large_url'],
+            'srcset': variant['srcset'],
+            'alt': image.artwork.title,
+            'artwork_url': image.artwork.get_absolute_url(),
+        })
+
+    cover = image_variant(collection.image) if collection.image else {}
+    if not carousel_images and cover:
+        carousel_images.append({
+            'url': cover['large_url'],
+            'srcset': cover['srcset'],
+            'alt': collection.name,
+            'artwork_url': None,
+        })
+
+    summary, _ = CollectionSummary.objects.update_or_create(
+        collection=collection,
+        defaults={
+            'total_count': stats['total'],
+            'available_count': stats['available'],
+            'sold_count': stats['sold'],
+            'cover': cover,
+            'carousel_images': carousel_images,
+            'artworks_updated_at': stats['updated'],
+        },
+    )
+    return summary
+
+
+def ensure_summaries(collections):
+    """Досоздаёт отсутствующие сводки (например, сразу после миграции)"""
+    for collection in collections:
+        if getattr(collection, 'summary', None) is None:
+            collection.summary = refresh_collection_summary(collection.pk)
+    return collections
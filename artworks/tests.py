@@ -1,3 +1,125 @@
-from django.test import TestCase
+import shutil
+import tempfile
+from io import BytesIO, StringIO
+from pathlib import Path
 
-# Create your tests here.
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from . import counts
+from .models import Artwork, ArtworkImage
+from .storage import is_hashed_name
+
+
+class CatalogSearchTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        Artwork.objects.create(
+            title='Лунный сад', slug='lunnyi-sad', tags='луна, сад',
+            width_cm=30, height_cm=40, created_year=2024,
+            short_description='Ночной пейзаж', description='Ночной пейзаж',
+        )
+
+    def test_no_match_search(self):
+        # Нечёткий поиск ничего не нашёл - queryset с id__in=[]
+        for url in (reverse('catalog'), reverse('catalog_api'), reverse('search')):
+            response = self.client.get(url, {'q': 'qwertyuiop'})
+            self.assertEqual(response.status_code, 200, url)
+
+    def test_count_of_empty_queryset(self):
+        self.assertEqual(counts.count(Artwork.objects.filter(id__in=[])), 0)
+        self.assertEqual(counts.count(Artwork.objects.none()), 0)
+
+
+class CatalogValidatorsTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        for title, slug in (('Лунный сад', 'lunnyi-sad'), ('Утро', 'utro'), ('Вечер', 'vecher')):
+            Artwork.objects.create(
+                title=title, slug=slug, width_cm=30, height_cm=40, created_year=2024,
+                short_description='Пейзаж', description='Пейзаж',
+            )
+
+    def test_delete_changes_etag(self):
+        # Удаление не меняет max(updated_at), но меняет состояние набора
+        for url in (reverse('catalog'), reverse('catalog_api')):
+            etag = self.client.get(url)['ETag']
+            self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, 304, url)
+
+            Artwork.objects.filter(pk=Artwork.objects.latest('pk').pk).delete()
+
+            response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+            self.assertEqual(response.status_code, 200, url)
+            self.assertNotEqual(response['ETag'], etag, url)
+
+
+class RehashMediaTests(TestCase):
+    def setUp(self):
+        from PIL import Image
+
+        self.media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.media_root, ignore_errors=True)
+        override = override_settings(MEDIA_ROOT=self.media_root)
+        override.enable()
+        self.addCleanup(override.disable)
+
+        # Файл со старым именем, без сжатия в save()
+        buffer = BytesIO()
+        Image.new('RGB', (40, 30), 'white').save(buffer, format='JPEG')
+        path = Path(self.media_root, 'artworks', 'old.jpg')
+        path.parent.mkdir(parents=True)
+        path.write_bytes(buffer.getvalue())
+
+        self.artwork = Artwork.objects.create(
+            title='Лунный сад', slug='lunnyi-sad', width_cm=30, height_cm=40, created_year=2024,
+            short_description='Пейзаж', description='Пейзаж',
+        )
+        ArtworkImage.objects.bulk_create([ArtworkImage(artwork=self.artwork, image='artworks/old.jpg')])
+
+    def test_rehash_changes_catalog_etag(self):
+        url = reverse('catalog')
+        etag = self.client.get(url)['ETag']
+
+        call_command('rehash_media', '--delete-originals', stdout=StringIO())
+
+        image = ArtworkImage.objects.get(artwork=self.artwork)
+        self.assertTrue(is_hashed_name(image.image.name))
+        self.assertFalse(Path(self.media_root, 'artworks', 'old.jpg').exists())
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response['ETag'], etag)
+
+
+class CatalogEngineTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        for title, slug, price in (('Лунный сад', 'lunnyi-sad', 200), ('Утро', 'utro', None), ('Вечер', 'vecher', 100)):
+            Artwork.objects.create(
+                title=title, slug=slug, price=price, width_cm=30, height_cm=40, created_year=2024,
+                short_description='Пейзаж', description='Пейзаж',
+            )
+
+    def test_price_order_matches_sql(self):
+        from .catalog_engine import CatalogEngine
+
+        engine = CatalogEngine()
+        for order_by in ('price', '-price'):
+            ids, found_count = engine.query('', {}, order_by)
+            self.assertEqual(found_count, 3)
+            self.assertEqual(
+                ids.tolist(), list(Artwork.objects.order_by(order_by).values_list('id', flat=True)), order_by
+            )
+
+    def test_changes_do_not_touch_snapshot(self):
+        from .catalog_engine import CatalogEngine
+
+        engine = CatalogEngine()
+        engine.query('', {}, '-created_at')
+        snapshot = engine.columns
+        artwork = Artwork.objects.get(slug='utro')
+        engine._apply(lambda columns: columns.remove(artwork.pk))
+
+        self.assertEqual(len(snapshot), 3)
+        self.assertEqual(len(engine.columns), 2)
+        self.assertNotIn(artwork.pk, engine.query('', {}, '-created_at')[0].tolist())
@@ -7,6 +7,7 @@ from . import views
 urlpatterns = [
     path('', views.home, name='home'),
     path('catalog/', views.catalog, name='catalog'),
+    path('catalog/api/', views.catalog_api, name='catalog_api'),
     path('artwork/<slug:slug>/', views.artwork_detail, name='artwork_detail'),
     path('collections/', views.collections_list, name='collections'),
     path('collection/<slug:slug>/', views.collection_detail, name='collection_detail'),
@@ -14,4 +15,5 @@ urlpatterns = [
     path('contact/', views.contact, name='contact'),
     path('terms/', views.terms, name='terms'),
     path('search/', views.search, name='search'),
+    path('search/suggest/', views.search_suggest, name='search_suggest'),
 ]
\ No newline at end of file
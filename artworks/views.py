@@ -1,62 +1,172 @@
 # artworks/views.py
 from django.shortcuts import render, get_object_or_404
-from django.db.models import Prefetch, Count, Q
+from django.conf import settings
+from django.views.static import serve
+from django.db.models import Q, Subquery, Sum
+from django.db.models.functions import Substr
+from django.http import JsonResponse
+from django.utils.cache import patch_cache_control
+from django.urls import reverse
 from django.core.paginator import Paginator, EmptyPage, PageNotAnInteger
-from .models import Artwork, Category, Theme, Collection, ArtworkImage
+from .models import (
+    Artwork, Category, Theme, Collection, ArtworkImage, CollectionSummary,
+    format_dimensions, format_price,
+)
 from .filters import ArtworkFilter
+from .block_cache import cached_block
+from .cards import artwork_cards, artwork_cards_by_id, card_page, card_values, primary_image
+from .http_cache import cache_policy, combine, content_state, latest, request_version, site_state
+from .storage import IMMUTABLE_CACHE_CONTROL, is_hashed_name
+from . import counts, search_index
+from .fuzzy import fuzzy_artwork_ids
+from .summaries import ensure_summaries
 import random
 
-from analytics.models import ArtworkView
 
-def catalog(request):
-    """Каталог с фильтрами, поиском и пагинацией"""
-    artworks_qs = Artwork.objects.all().select_related(
-        'category', 'theme'
-    ).prefetch_related('images')
-    
-    query = request.GET.get('q', '').strip()
+def _catalog_validators(request):
+    last_modified, state = combine(content_state(Artwork.objects.all()), site_state())
+    return last_modified, ['artworks', 'catalog'], state
+
+
+def _artwork_detail_validators(request, slug):
+    artwork = Artwork.objects.filter(slug=slug).values(
+        'id', 'updated_at', 'category_id', 'theme_id', 'collection_id'
+    ).first()
+    if artwork is None:
+        return None, []
+
+    # Сама картина и блоки "похожие"/"из коллекции"
+    related_q = Q(id=artwork['id'])
+    if artwork['theme_id']:
+        related_q |= Q(theme_id=artwork['theme_id'])
+    elif artwork['category_id']:
+        related_q |= Q(category_id=artwork['category_id'])
+    if artwork['collection_id']:
+        related_q |= Q(collection_id=artwork['collection_id'])
+
+    last_modified, state = combine(content_state(Artwork.objects.filter(related_q)), site_state())
+    return last_modified, ['artworks', f"artwork-{artwork['id']}"], state
+
+
+def _collections_list_validators(request):
+    # Сводка пересчитывается при любом изменении картин коллекции
+    last_modified, state = combine(content_state(CollectionSummary.objects.all()), site_state())
+    return last_modified, ['collections'], state
+
+
+def _collection_detail_validators(request, slug):
+    collection = Collection.objects.filter(slug=slug).values('id', 'summary__updated_at').first()
+    if collection is None:
+        return None, []
+    last_modified, state = site_state()
+    return (
+        latest(collection['summary__updated_at'], last_modified),
+        ['collections', f"collection-{collection['id']}"],
+        state,
+    )
+
+
+CATALOG_ORDERS = [
+    '-created_at', 'created_at', 
+    'price', '-price', 
+    '-views', 
+    'title', '-title'
+]
+CATALOG_PER_PAGE = [12, 24, 48]
+
+
+def _catalog_search(queryset, query):
     if query:
-        artworks_qs = artworks_qs.filter(
+        exact = queryset.filter(
             Q(title__icontains=query) |
             Q(tags__icontains=query) |
             Q(short_description__icontains=query) |
             Q(description__icontains=query)
         )
-    
-    artwork_filter = ArtworkFilter(request.GET, queryset=artworks_qs)
-    filtered_artworks = artwork_filter.qs
-    
+        if exact.exists():
+            return exact
+        # Ничего не нашли - картины с похожими названиями/тегами
+        return queryset.filter(id__in=fuzzy_artwork_ids(query))
+    return queryset
+
+
+def _catalog_order(request):
     order_by = request.GET.get('order', '-created_at')
-    
-    valid_orders = [
-        '-created_at', 'created_at', 
-        'price', '-price', 
-        '-views', 
-        'title', '-title'
-    ]
-    if order_by in valid_orders:
-        filtered_artworks = filtered_artworks.order_by(order_by)
-    else:
+    if order_by not in CATALOG_ORDERS:
         order_by = '-created_at'
-        filtered_artworks = filtered_artworks.order_by(order_by)
-    
+    return order_by
+
+
+def _catalog_per_page(request):
     per_page = request.GET.get('per_page', '12')
     try:
         per_page = int(per_page)
-        if per_page not in [12, 24, 48]:
+        if per_page not in CATALOG_PER_PAGE:
             per_page = 12
     except (ValueError, TypeError):
         per_page = 12
-    
-    paginator = Paginator(filtered_artworks, per_page)
-    page = request.GET.get('page', 1)
-    
+    return per_page
+
+
+def _get_page(paginator, page):
     try:
-        artworks = paginator.page(page)
+        return paginator.page(page)
     except PageNotAnInteger:
-        artworks = paginator.page(1)
+        return paginator.page(1)
     except EmptyPage:
-        artworks = paginator.page(paginator.num_pages)
+        return paginator.page(paginator.num_pages)
+
+
+def _catalog_memory_query(request, query, order_by):
+    """
+    Поиск, фильтры и сортировка каталога по колонкам в памяти (CATALOG_MEMORY_ENGINE).
+    Возвращает (ArtworkFilter, id картин по порядку, найдено до фильтров) или None.
+    """
+    if not settings.CATALOG_MEMORY_ENGINE:
+        return None
+    # NumPy импортируется, только если движок включён
+    from . import catalog_engine
+
+    if not catalog_engine.supports(ArtworkFilter):
+        return None
+    artwork_filter = ArtworkFilter(request.GET, queryset=Artwork.objects.all())
+    # Неверные значения отбрасываются формой, как и при фильтрации queryset
+    artwork_filter.form.is_valid()
+    ids, found_count = catalog_engine.engine.query(query, artwork_filter.form.cleaned_data, order_by)
+    return artwork_filter, ids, found_count
+
+
+@cache_policy(_catalog_validators, max_age=60)
+def catalog(request):
+    """Каталог с фильтрами, поиском и пагинацией"""
+    query = request.GET.get('q', '').strip()
+    order_by = _catalog_order(request)
+    per_page = _catalog_per_page(request)
+    page = request.GET.get('page', 1)
+    
+    memory = _catalog_memory_query(request, query, order_by)
+    if memory is not None:
+        # Из БД - только картины видимой страницы
+        artwork_filter, ids, total_count = memory
+        filtered_count = len(ids)
+        artworks = _get_page(Paginator(ids, per_page), page)
+        artworks.object_list = artwork_cards_by_id(artworks.object_list.tolist())
+    else:
+        artworks_qs = _catalog_search(Artwork.objects.all(), query)
+        artwork_filter = ArtworkFilter(request.GET, queryset=artworks_qs)
+        filtered_artworks = artwork_filter.qs.order_by(order_by)
+        
+        # Один COUNT на набор фильтров: тот же результат у пагинатора и в filtered_count
+        total_count = counts.count(artworks_qs, request, approximate=not query)
+        filtered_count = counts.count(filtered_artworks, request)
+        # Карточки из узкого values()-запроса вместо полных моделей
+        paginator = Paginator(card_values(filtered_artworks), per_page)
+        paginator.count = filtered_count
+        artworks = card_page(_get_page(paginator, page))
+    
+    # Параметры запроса без страницы - для подгрузки следующих страниц через API
+    base_query = request.GET.copy()
+    base_query.pop('page', None)
     
     # Получаем все категории, тематики, коллекции для фильтров
     all_categories = Category.objects.all()
@@ -84,8 +194,8 @@ def catalog(request):
         'all_categories': all_categories,
         'all_themes': all_themes,
         'query': query,
-        'total_count': artworks_qs.count(),
-        'filtered_count': filtered_artworks.count(),
+        'total_count': total_count,
+        'filtered_count': filtered_count,
         'seo_title': seo_title,
         'selected_categories': selected_categories,
         'selected_themes': selected_themes,
@@ -96,12 +206,103 @@ def catalog(request):
         'per_page': per_page,
         'page': page,
         'current_order': order_by,
+        'base_querystring': base_query.urlencode(),
         'request': request,
     }
     
     return render(request, 'artworks/catalog.html', context)
 
 
+# Поля карточки для catalog_api и колонки, которые нужны для каждого из них
+CARD_FIELDS = {
+    'id': ('id',),
+    'title': ('title',),
+    'slug': ('slug',),
+    'url': ('slug',),
+    'status': ('status',),
+    'price': ('price',),
+    'price_display': ('status', 'price'),
+    'size': ('width_cm', 'height_cm'),
+    'size_category': ('size_category',),
+    'image': ('primary_image',),
+    'category': ('category__name',),
+    'theme': ('theme__name',),
+    'views': ('views',),
+    'short_description': ('short_text',),
+}
+
+
+def _catalog_api_validators(request):
+    # В JSON нет блоков из контекст-процессоров, достаточно картин
+    last_modified, state = content_state(Artwork.objects.all())
+    return last_modified, ['artworks', 'catalog'], state
+
+
+def _card_value(field, row, image_storage):
+    if field == 'url':
+        return reverse('artwork_detail', kwargs={'slug': row['slug']})
+    if field == 'price_display':
+        return format_price(row['status'], row['price'])
+    if field == 'size':
+        return format_dimensions(row['width_cm'], row['height_cm'])
+    if field == 'image':
+        return image_storage.url(row['primary_image']) if row['primary_image'] else None
+    return row[CARD_FIELDS[field][0]]
+
+
+@cache_policy(_catalog_api_validators, max_age=60)
+def catalog_api(request):
+    """
+    JSON-страница каталога для подгрузки карточек.
+
+    Принимает те же параметры, что и catalog, плюс fields=title,slug,...
+    для выбора полей карточки. Данные берутся одним values()-запросом.
+    """
+    requested = [f for f in request.GET.get('fields', '').split(',') if f in CARD_FIELDS]
+    fields = requested or list(CARD_FIELDS)
+    columns = sorted({column for field in fields for column in CARD_FIELDS[field]})
+
+    query = request.GET.get('q', '').strip()
+    order_by = _catalog_order(request)
+    memory = _catalog_memory_query(request, query, order_by)
+    if memory is not None:
+        artworks_qs = Artwork.objects.all()
+    else:
+        artworks_qs = _catalog_search(Artwork.objects.all(), query)
+        artworks_qs = ArtworkFilter(request.GET, queryset=artworks_qs).qs.order_by(order_by)
+
+    if 'primary_image' in columns:
+        artworks_qs = artworks_qs.annotate(primary_image=Subquery(primary_image()))
+    if 'short_text' in columns:
+        artworks_qs = artworks_qs.annotate(short_text=Substr('short_description', 1, 100))
+
+    if memory is not None:
+        paginator = Paginator(memory[1], _catalog_per_page(request))
+        page = _get_page(paginator, request.GET.get('page', 1))
+        ids = page.object_list.tolist()
+        rows = {row['id']: row for row in artworks_qs.filter(id__in=ids).values(*{'id', *columns})}
+        page.object_list = [rows[pk] for pk in ids if pk in rows]
+    else:
+        paginator = Paginator(artworks_qs.values(*columns), _catalog_per_page(request))
+        paginator.count = counts.count(artworks_qs, request)
+        page = _get_page(paginator, request.GET.get('page', 1))
+
+    image_storage = ArtworkImage._meta.get_field('image').storage
+    results = [
+        {field: _card_value(field, row, image_storage) for field in fields}
+        for row in page.object_list
+    ]
+
+    return JsonResponse({
+        'count': paginator.count,
+        'page': page.number,
+        'num_pages': paginator.num_pages,
+        'next_page': page.next_page_number() if page.has_next() else None,
+        'results': results,
+    }, json_dumps_params={'ensure_ascii': False})
+
+
+@cache_policy(_artwork_detail_validators)
 def artwork_detail(request, slug):
     """Детальная страница картины"""
     artwork = get_object_or_404(
@@ -110,37 +311,28 @@ def artwork_detail(request, slug):
         slug=slug
     )
 
-    viewed_artworks = request.session.get('viewed_artworks', [])
-    
-    if artwork.id not in viewed_artworks:
-        artwork.increment_views()
-        ArtworkView.objects.create(artwork=artwork)
-        viewed_artworks.append(artwork.id)
-        if len(viewed_artworks) > 50:
-            viewed_artworks = viewed_artworks[-50:]
-        request.session['viewed_artworks'] = viewed_artworks
-    
+    # Просмотр засчитывает /analytics/collect по beacon со страницы
     similar_artworks = Artwork.objects.filter(
         status='available'
     ).exclude(
         id=artwork.id
-    ).select_related('category', 'theme').prefetch_related('images')
+    )
     
     if artwork.theme:
         similar_artworks = similar_artworks.filter(theme=artwork.theme)
     elif artwork.category:
         similar_artworks = similar_artworks.filter(category=artwork.category)
     
-    similar_artworks = similar_artworks[:4]
+    similar_artworks = artwork_cards(similar_artworks, limit=4)
     
     collection_artworks = None
     if artwork.collection:
-        collection_artworks = Artwork.objects.filter(
+        collection_artworks = artwork_cards(Artwork.objects.filter(
             collection=artwork.collection,
             status='available'
         ).exclude(
             id=artwork.id
-        ).select_related('category', 'theme').prefetch_related('images')[:4]
+        ), limit=4)
     
     context = {
         'artwork': artwork,
@@ -151,161 +343,118 @@ def artwork_detail(request, slug):
     return render(request, 'artworks/detail.html', context)
 
 
+@cache_policy(_collections_list_validators, max_age=60)
 def collections_list(request):
     """Страница со списком всех коллекций"""
-    collections = Collection.objects.annotate(
-        artwork_count=Count('artwork')
-    ).order_by('name')
+    collections = ensure_summaries(list(
+        Collection.objects.select_related('summary').order_by('name')
+    ))
 
-    collections_with_images = Collection.objects.filter(
-        Q(image__isnull=False) & ~Q(image='')
-    ).annotate(
-        artwork_count=Count('artwork')
-    ).order_by('name')[:10]
-    
-    total_artworks = Artwork.objects.filter(collection__isnull=False).count()
-    available_artworks = Artwork.objects.filter(
-        status='available',
-        collection__isnull=False
-    ).count()
+    collections_with_images = [collection for collection in collections if collection.image][:10]
+
+    totals = cached_block(
+        'collections_totals',
+        lambda: CollectionSummary.objects.aggregate(
+            total=Sum('total_count'),
+            available=Sum('available_count'),
+        ),
+        version=request_version(request),
+    )
     
     context = {
         'collections': collections,
         'collections_with_images': collections_with_images,
-        'total_artworks': total_artworks,
-        'available_artworks': available_artworks,
+        'total_artworks': totals['total'] or 0,
+        'available_artworks': totals['available'] or 0,
     }
     
     return render(request, 'artworks/collections.html', context)
 
 
+@cache_policy(_collection_detail_validators)
 def collection_detail(request, slug):
     """Детальная страница коллекции"""
-    collection = get_object_or_404(Collection, slug=slug)
-    
-    artworks_qs = Artwork.objects.filter(
-        collection=collection
-    ).select_related('category', 'theme').prefetch_related(
-        Prefetch('images', queryset=ArtworkImage.objects.filter(is_primary=True))
-    )
-    
-    carousel_images = []
-    
-    artworks_with_images = artworks_qs.filter(
-        images__isnull=False
-    ).distinct()[:10]
-    
-    for artwork in artworks_with_images:
-        primary_image = artwork.images.filter(is_primary=True).first()
-        
-        if primary_image:
-            carousel_images.append({
-                'url': primary_image.image.url,
-                'alt': artwork.title,
-                'artwork_url': artwork.get_absolute_url()
-            })
-
-    if not carousel_images and collection.image:
-        carousel_images.append({
-            'url': collection.image.url,
-            'alt': collection.name,
-            'artwork_url': None
-        })
+    collection = get_object_or_404(Collection.objects.select_related('summary'), slug=slug)
+    summary = ensure_summaries([collection])[0].summary
     
-    available_count = artworks_qs.filter(status='available').count()
-    sold_count = artworks_qs.filter(status='sold').count()
+    artworks_qs = card_values(Artwork.objects.filter(collection=collection))
     
     paginator = Paginator(artworks_qs, 12)
+    # Количество уже есть в сводке - без отдельного COUNT
+    paginator.count = summary.total_count
     page = request.GET.get('page', 1)
     
-    try:
-        artworks = paginator.page(page)
-    except PageNotAnInteger:
-        artworks = paginator.page(1)
-    except EmptyPage:
-        artworks = paginator.page(paginator.num_pages)
+    artworks = card_page(_get_page(paginator, page))
     
     other_collections = Collection.objects.exclude(
         id=collection.id
-    ).annotate(
-        artwork_count=Count('artwork')
-    ).filter(
+    ).select_related('summary').filter(
         Q(image__isnull=False) & ~Q(image='')
     ).order_by('?')[:6]
     
     context = {
         'collection': collection,
         'artworks': artworks,
-        'carousel_images': carousel_images,
-        'available_count': available_count,
-        'sold_count': sold_count,
+        'carousel_images': summary.carousel_images,
+        'available_count': summary.available_count,
+        'sold_count': summary.sold_count,
         'other_collections': other_collections,
     }
     
     return render(request, 'artworks/collection.html', context)
 
 
+# Главная: наборы кандидатов для случайных картин и блоки пересчитываются
+# не чаще раза в HOME_BLOCKS_TTL секунд (block_cache.cached_block)
+HOME_BLOCKS_TTL = 300
+
+
+def _home_blocks():
+    from blog.models import BlogPost
+
+    available = Artwork.objects.filter(status='available')
+    return {
+        # Лучшие работы для слайдера (3 самые популярные сейчас, см. update_trending)
+        'featured': list(available.order_by('-trending_score').values_list('id', flat=True)[:3]),
+        # Кандидаты для случайных картин: маслом (ID категории 4), пастелью (ID 2),
+        # маленькие и из коллекций - только id, сами картины загружаются по выбранным
+        'picks': {
+            'oil_artwork': list(available.filter(category_id=4).values_list('id', flat=True)),
+            'pastel_artwork': list(available.filter(category_id=2).values_list('id', flat=True)),
+            'small_artwork': list(available.filter(size_category='small').values_list('id', flat=True)),
+            'artwork_in_collection': list(available.filter(collection__isnull=False).values_list('id', flat=True)),
+        },
+        'recent_posts': list(
+            BlogPost.objects.filter(status='published').order_by('-created_at').values_list('id', flat=True)[:4]
+        ),
+    }
+
+
 def home(request):
     """Главная страница"""
-    # Лучшие работы для слайдера (3 самые популярные)
-    featured_artworks = Artwork.objects.filter(
-        status='available'
-    ).order_by('-views')[:3]
-    
-    # Одна случайная картина маслом (ID категории 1)
-    oil_artworks = Artwork.objects.filter(
-        status='available',
-        category_id=4
-    )
-    oil_artwork = random.choice(list(oil_artworks)) if oil_artworks.exists() else None
-    
-    # Одна случайная картина пастелью (ID категории 2)
-    pastel_artworks = Artwork.objects.filter(
-        status='available',
-        category_id=2
-    )
-    pastel_artwork = random.choice(list(pastel_artworks)) if pastel_artworks.exists() else None
-    
-    # Одна случайная маленькая картина
-    small_artworks = Artwork.objects.filter(
-        status='available',
-        width_cm__lte=25,
-        height_cm__lte=25
-    )
-    small_artwork = random.choice(list(small_artworks)) if small_artworks.exists() else None
-    
-    # Одна случайная большая картина
-    artworks_in_collections = Artwork.objects.filter(
-        status='available',
-        collection__isnull=False  # Только картинки, которые в коллекциях
-    )
+    blocks = cached_block('home_blocks', _home_blocks, soft_ttl=HOME_BLOCKS_TTL)
+
+    picks = {name: random.choice(ids) if ids else None for name, ids in blocks['picks'].items()}
+    cards = artwork_cards_by_id(blocks['featured'] + [pk for pk in picks.values() if pk])
+    artworks = {card.id: card for card in cards}
+
+    from blog.models import BlogPost
+
+    posts = BlogPost.objects.in_bulk(blocks['recent_posts'])
 
-    artwork_in_collection = random.choice(list(artworks_in_collections)) if artworks_in_collections.exists() else None
-    
-    recent_posts = []
-    try:
-        from blog.models import BlogPost
-        recent_posts = BlogPost.objects.filter(
-            status='published'
-        ).order_by('-created_at')[:4]
-    except (ImportError, RuntimeError):
-        pass
-    
     context = {
-        'featured_artworks': featured_artworks,
-        'oil_artwork': oil_artwork,
-        'pastel_artwork': pastel_artwork,
-        'small_artwork': small_artwork,
-        'artwork_in_collection': artwork_in_collection,
-        'recent_posts': recent_posts,
+        'featured_artworks': [artworks[pk] for pk in blocks['featured'] if pk in artworks],
+        'recent_posts': [posts[pk] for pk in blocks['recent_posts'] if pk in posts],
     }
+    for name, pk in picks.items():
+        context[name] = artworks.get(pk)
     return render(request, 'artworks/home.html', context)
 
 def about(request):
     """Страница 'Обо мне'"""
-    popular_artworks = Artwork.objects.filter(
+    popular_artworks = artwork_cards(Artwork.objects.filter(
         status='available'
-    ).order_by('-views')[:12]
+    ).order_by('-trending_score'), limit=12)
     
     context = {
         'popular_artworks': popular_artworks,
@@ -315,16 +464,16 @@ def about(request):
 
 def contact(request):
     """Страница 'Контакты'"""
-    popular_artworks = Artwork.objects.filter(
+    popular_artworks = artwork_cards(Artwork.objects.filter(
         status='available'
-    ).order_by('-views')[:12]
+    ).order_by('-trending_score'), limit=12)
     
     popular_posts = []
     try:
         from blog.models import BlogPost
         popular_posts = BlogPost.objects.filter(
             status='published'
-        ).order_by('-views')[:12]
+        ).order_by('-trending_score')[:12]
     except (ImportError, RuntimeError):
         pass
     
@@ -349,29 +498,35 @@ def search(request):
         'posts': [],
     }
     
-    total_artworks = Artwork.objects.count()
-    total_collections = Collection.objects.count()
+    total_artworks = counts.count(Artwork.objects.all(), request, approximate=True)
+    total_collections = counts.count(Collection.objects.all(), request, approximate=True)
     
     try:
         from blog.models import BlogPost
-        total_posts = BlogPost.objects.filter(status='published').count()
+        total_posts = counts.count(BlogPost.objects.filter(status='published'), request)
     except (ImportError, RuntimeError):
         total_posts = 0
     
+    fuzzy_artworks = False
     if query:
         # Поиск по картинам
-        results['artworks'] = Artwork.objects.filter(
+        results['artworks'] = artwork_cards(Artwork.objects.filter(
             Q(title__icontains=query) |
             Q(description__icontains=query) |
             Q(short_description__icontains=query) |
             Q(tags__icontains=query)
-        ).select_related('category', 'theme', 'collection').prefetch_related('images')[:20]
+        ), limit=20)
+        
+        # Опечатки и транслитерация: похожие картины из триграммного индекса
+        if not results['artworks']:
+            results['artworks'] = artwork_cards_by_id(fuzzy_artwork_ids(query))
+            fuzzy_artworks = bool(results['artworks'])
         
         # Поиск по коллекциям
         results['collections'] = Collection.objects.filter(
             Q(name__icontains=query) |
             Q(description__icontains=query)
-        )[:10]
+        ).select_related('summary')[:10]
         
         # Поиск по постам блога
         try:
@@ -395,6 +550,26 @@ def search(request):
         'total_artworks': total_artworks,
         'total_collections': total_collections,
         'total_posts': total_posts,
+        'fuzzy_artworks': fuzzy_artworks,
     }
     
-    return render(request, 'artworks/search.html', context)
\ No newline at end of file
+    return render(request, 'artworks/search.html', context)
+
+
+def search_suggest(request):
+    """Подсказки для строки поиска из индекса в памяти, без запросов к БД"""
+    query = request.GET.get('q', '').strip()[:100]
+    response = JsonResponse({
+        'query': query,
+        'suggestions': search_index.suggest(query) if query else [],
+    }, json_dumps_params={'ensure_ascii': False})
+    patch_cache_control(response, public=True, max_age=60)
+    return response
+
+
+def media(request, path):
+    """Отдача MEDIA без nginx: файлы с хэшем в имени кэшируются на год"""
+    response = serve(request, path, document_root=settings.MEDIA_ROOT)
+    if response.status_code in (200, 304) and is_hashed_name(path):
+        response['Cache-Control'] = IMMUTABLE_CACHE_CONTROL
+    return response
@@ -0,0 +1,187 @@
+# artworks/warmup.py
+import threading
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from urllib.parse import urljoin
+
+from django.conf import settings
+from django.db import connections
+from django.db.models import Sum
+from django.urls import reverse
+from django.utils import timezone
+
+from .block_cache import cached_block
+from .http_cache import validators_version
+
+# За сколько дней брать популярные наборы фильтров каталога
+CATALOG_QUERY_DAYS = 7
+USER_AGENT = 'IrenFantasyArt-warmup'
+HTTP_TIMEOUT = 30
+
+
+def sitemap_paths():
+    from IrenFantasyArt.urls import sitemaps
+
+    for sitemap_class in sitemaps.values():
+        sitemap = sitemap_class()
+        for item in sitemap.items():
+            yield sitemap.location(item)
+
+
+def top_artwork_paths(limit):
+    from .models import Artwork
+
+    for slug in Artwork.objects.order_by('-views').values_list('slug', flat=True)[:limit]:
+        yield reverse('artwork_detail', kwargs={'slug': slug})
+
+
+def catalog_query_paths(limit, days=CATALOG_QUERY_DAYS):
+    """Самые частые наборы фильтров каталога за последние дни (собирает analytics/beacon.py)"""
+    from analytics.models import CatalogQueryDaily
+
+    catalog_url = reverse('catalog')
+    queries = (
+        CatalogQueryDaily.objects
+        .filter(day__gte=timezone.localdate() - timedelta(days=days))
+        .values('query')
+        .annotate(total=Sum('hits'))
+        .order_by('-total')[:limit]
+    )
+    for row in queries:
+        yield f"{catalog_url}?{row['query']}" if row['query'] else catalog_url
+
+
+def collect_paths(sources=None, top_artworks=None, top_queries=None, max_paths=None):
+    """Список путей для прогрева по источникам из WARM_CACHE_SOURCES, без повторов"""
+    sources = sources or settings.WARM_CACHE_SOURCES
+    top_artworks = settings.WARM_CACHE_TOP_ARTWORKS if top_artworks is None else top_artworks
+    top_queries = settings.WARM_CACHE_TOP_QUERIES if top_queries is None else top_queries
+    max_paths = max_paths or settings.WARM_CACHE_MAX_PATHS
+
+    generators = {
+        'artworks': lambda: top_artwork_paths(top_artworks),
+        'catalog': lambda: catalog_query_paths(top_queries),
+        'sitemap': sitemap_paths,
+    }
+    paths = {}
+    for source in sources:
+        if source not in generators:
+            raise ValueError(f"Неизвестный источник прогрева: {source}")
+        for path in generators[source]():
+            paths.setdefault(path, None)
+            if len(paths) >= max_paths:
+                return list(paths)
+    return list(paths)
+
+
+def _local_host():
+    for host in settings.ALLOWED_HOSTS:
+        if host != '*' and not host.startswith('.'):
+            return host
+    return 'localhost'
+
+
+def fetch_http(base_url, path):
+    """Запрос к запущенному сайту: прогревает его воркеры и фронтовой кэш (nginx/Varnish)"""
+    request = urllib.request.Request(
+        urljoin(base_url, path),
+        headers={'User-Agent': USER_AGENT, 'Accept-Encoding': 'gzip'},
+    )
+    try:
+        with urllib.request.urlopen(request, timeout=HTTP_TIMEOUT) as response:
+            response.read()
+            return response.status
+    except urllib.error.HTTPError as e:
+        return e.code
+
+
+def is_failed(status):
+    return not isinstance(status, int) or status >= 400
+
+
+def warm(paths, base_url, concurrency=None):
+    """
+    Запрашивает пути у сайта base_url не более чем в concurrency потоков.
+    Возвращает [(путь, статус или текст ошибки, секунды)] в исходном порядке.
+    """
+    concurrency = concurrency or settings.WARM_CACHE_CONCURRENCY
+
+    def fetch(path):
+        started = time.perf_counter()
+        try:
+            status = fetch_http(base_url, path)
+        except Exception as e:
+            status = f"{type(e).__name__}: {e}"
+        return path, status, time.perf_counter() - started
+
+    with ThreadPoolExecutor(max_workers=max(concurrency, 1)) as pool:
+        return list(pool.map(fetch, paths))
+
+
+def process_warmers():
+    """Кэши и индексы процесса, которые иначе строит первый запрос: (название, функция)"""
+    from blog import views as blog_views
+    from . import counts, search_index, views
+    from .models import Artwork
+
+    def search_indexes():
+        from . import fuzzy  # noqa: F401 - регистрирует нечёткий индекс в search_index
+
+        search_index.build_all()
+
+    # Версии блоков - те же даты, что считают валидаторы cache_policy у этих страниц
+    warmers = [
+        ('индексы поиска', search_indexes),
+        ('блоки главной', lambda: cached_block('home_blocks', views._home_blocks, soft_ttl=views.HOME_BLOCKS_TTL)),
+        ('блоки блога', lambda: cached_block(
+            blog_views.SIDEBAR_CACHE_KEY, blog_views._sidebar_blocks, soft_ttl=blog_views.SIDEBAR_TTL,
+            version=validators_version(blog_views._blog_list_validators(None)),
+        )),
+        ('количество картин', lambda: counts.count(Artwork.objects.all(), approximate=True)),
+    ]
+    if settings.CATALOG_MEMORY_ENGINE:
+        from .catalog_engine import engine
+
+        warmers.append(('колонки каталога', lambda: engine.query('', {}, '-created_at')))
+    return warmers
+
+
+def warm_process():
+    """
+    Прогрев кэшей этого процесса напрямую, без рендера страниц.
+    Возвращает [(название, текст ошибки или None, секунды)].
+    """
+    results = []
+    try:
+        for name, warmer in process_warmers():
+            started = time.perf_counter()
+            try:
+                warmer()
+                error = None
+            except Exception as e:
+                error = f"{type(e).__name__}: {e}"
+            results.append((name, error, time.perf_counter() - started))
+    finally:
+        # Соединения фонового потока не должны оставаться открытыми
+        connections.close_all()
+    return results
+
+
+def warm_in_background():
+    """Хук после старта воркера (IrenFantasyArt/wsgi.py): прогрев его кэшей в фоновом потоке"""
+    def run():
+        try:
+            results = warm_process()
+        except Exception as e:
+            print(f"Ошибка прогрева кэша: {e}")
+            return
+        for name, error, _ in results:
+            if error:
+                print(f"Ошибка прогрева кэша ({name}): {error}")
+
+    thread = threading.Thread(target=run, name='warm-cache', daemon=True)
+    thread.start()
+    return thread
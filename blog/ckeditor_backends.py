@@ -0,0 +1,47 @@
+# blog/ckeditor_backends.py
+from io import BytesIO
+
+from django.conf import settings
+from PIL import Image
+from ckeditor_uploader.backends import PillowBackend
+
+from artworks.images import compress_image, content_hash, find_by_hash, hashed_name
+
+
+class CompressingPillowBackend(PillowBackend):
+    """
+    Загрузки CKEditor сжимаются так же, как изображения картин,
+    и хранятся по хэшу содержимого: повторная загрузка того же
+    изображения возвращает уже существующий файл.
+    """
+
+    def save_as(self, filepath):
+        if not self.is_image:
+            return super().save_as(filepath)
+
+        image = Image.open(self.file_object)
+        is_animated = getattr(image, 'is_animated', False)
+        self.file_object.seek(0)
+        if is_animated:
+            return super().save_as(filepath)
+
+        data = compress_image(self.file_object)
+        # CKEditor уже заменил кириллицу в filepath случайной строкой,
+        # для читаемого суффикса берём исходное имя
+        filename = getattr(self.file_object, 'name', None) or filepath
+        return save_deduplicated(self.storage_engine, data, filename, self.create_thumbnail)
+
+
+def save_deduplicated(storage, data, filename, create_thumbnail=None):
+    """Сохраняет сжатое изображение в CKEDITOR_UPLOAD_PATH по хэшу, возвращает путь"""
+    directory = settings.CKEDITOR_UPLOAD_PATH.rstrip('/')
+    digest = content_hash(data)
+
+    existing = find_by_hash(storage, directory, digest)
+    if existing:
+        return existing
+
+    saved_path = storage.save(hashed_name(directory, digest, filename), BytesIO(data))
+    if create_thumbnail:
+        create_thumbnail(BytesIO(data), saved_path)
+    return saved_path
@@ -0,0 +1,25 @@
+# blog/ckeditor_urls.py
+from django.contrib.admin.views.decorators import staff_member_required
+from django.urls import re_path
+from django.views.decorators.cache import never_cache
+from django.views.decorators.csrf import csrf_exempt
+
+
+def lazy_view(name):
+    """
+    Вьюха ckeditor_uploader, импортируемая при первом запросе: ckeditor_uploader.views
+    загружает Pillow, а загрузка маршрутов не должна его тянуть
+    """
+    def view(request, *args, **kwargs):
+        from ckeditor_uploader import views
+
+        return getattr(views, name)(request, *args, **kwargs)
+
+    return view
+
+
+# Те же адреса и имена, что в ckeditor_uploader.urls
+urlpatterns = [
+    re_path(r'^upload/', csrf_exempt(staff_member_required(lazy_view('upload'))), name='ckeditor_upload'),
+    re_path(r'^browse/', never_cache(staff_member_required(lazy_view('browse'))), name='ckeditor_browse'),
+]
@@ -3,7 +3,7 @@ from .models import BlogPost
 from collections import Counter
 
 def blog_context(request):
-    popular_posts = BlogPost.objects.filter(status='published').order_by('-views')[:5]
+    popular_posts = BlogPost.objects.filter(status='published').order_by('-trending_score')[:5]
     recent_posts = BlogPost.objects.filter(status='published').order_by('-published_at')[:5]
     
     all_tags = []
@@ -0,0 +1,90 @@
+# blog/management/commands/compress_ckeditor_uploads.py
+import posixpath
+import re
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from PIL import Image
+from ckeditor_uploader.backends import PillowBackend
+from ckeditor_uploader.utils import get_thumb_filename, storage
+
+from artworks.images import compress_image, content_hash, find_by_hash
+from blog.ckeditor_backends import save_deduplicated
+from blog.models import BlogPost
+
+
+def walk(storage, path):
+    dirs, files = storage.listdir(path)
+    for name in files:
+        yield posixpath.join(path, name)
+    for name in dirs:
+        yield from walk(storage, posixpath.join(path, name))
+
+
+class Command(BaseCommand):
+    help = "Сжимает и дедуплицирует старые загрузки CKEditor, обновляет ссылки в постах"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--dry-run', action='store_true', help="Только показать, что будет сделано")
+        parser.add_argument('--keep-originals', action='store_true', help="Не удалять исходные файлы")
+
+    def handle(self, *args, **options):
+        dry_run = options['dry_run']
+        directory = settings.CKEDITOR_UPLOAD_PATH.rstrip('/')
+        hashed_re = re.compile(r'^%s/[0-9a-f]{2}/[0-9a-f]{16}' % re.escape(directory))
+
+        if not storage.exists(directory):
+            self.stdout.write("Каталог загрузок пуст")
+            return
+
+        thumbnailer = PillowBackend(storage, None)
+        replacements = {}
+        seen = set()
+        duplicates = 0
+
+        for name in list(walk(storage, directory)):
+            if '_thumb' in name or hashed_re.match(name):
+                continue
+            try:
+                with storage.open(name) as f:
+                    if getattr(Image.open(f), 'is_animated', False):
+                        continue
+                    f.seek(0)
+                    data = compress_image(f)
+            except Exception as e:
+                self.stderr.write(f"Пропущен {name}: {e}")
+                continue
+
+            digest = content_hash(data)
+            if digest in seen or find_by_hash(storage, directory, digest):
+                duplicates += 1
+            seen.add(digest)
+
+            if dry_run:
+                replacements[name] = None
+                continue
+            replacements[name] = save_deduplicated(storage, data, name, thumbnailer.create_thumbnail)
+
+        self.stdout.write(f"Файлов: {len(replacements)}, дубликатов: {duplicates}")
+        if dry_run or not replacements:
+            return
+
+        urls = {storage.url(old): storage.url(new) for old, new in replacements.items()}
+        updated_posts = 0
+        for post in BlogPost.objects.all().iterator():
+            content = post.content
+            for old_url, new_url in urls.items():
+                content = content.replace(old_url, new_url)
+            if content != post.content:
+                post.content = content
+                post.save()
+                updated_posts += 1
+        self.stdout.write(f"Обновлено постов: {updated_posts}")
+
+        if not options['keep_originals']:
+            for old in replacements:
+                for path in (old, get_thumb_filename(old)):
+                    if storage.exists(path):
+                        storage.delete(path)
+
+        self.stdout.write(self.style.SUCCESS("Готово"))
@@ -0,0 +1,44 @@
+# Generated by Django 6.0.1 on 2026-10-19 10:00
+
+from django.db import migrations, models
+
+
+def render_existing_posts(apps, schema_editor):
+    from blog.rendering import render_content
+
+    BlogPost = apps.get_model('blog', 'BlogPost')
+    for post in BlogPost.objects.all().iterator():
+        for field, value in render_content(post.content).items():
+            setattr(post, field, value)
+        post.save(update_fields=['content_html', 'content_text', 'word_count', 'reading_time'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0002_remove_blogpost_blog_blogpo_status_9c1956_idx_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='blogpost',
+            name='content_html',
+            field=models.TextField(blank=True, editable=False, verbose_name='Обработанный HTML'),
+        ),
+        migrations.AddField(
+            model_name='blogpost',
+            name='content_text',
+            field=models.TextField(blank=True, editable=False, verbose_name='Текст без разметки'),
+        ),
+        migrations.AddField(
+            model_name='blogpost',
+            name='word_count',
+            field=models.PositiveIntegerField(default=0, editable=False, verbose_name='Количество слов'),
+        ),
+        migrations.AddField(
+            model_name='blogpost',
+            name='reading_time',
+            field=models.PositiveIntegerField(default=0, editable=False, verbose_name='Время чтения (мин)'),
+        ),
+        migrations.RunPython(render_existing_posts, migrations.RunPython.noop),
+    ]
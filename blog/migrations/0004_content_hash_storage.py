@@ -0,0 +1,19 @@
+# Generated by Django 6.0.1 on 2026-10-19 10:00
+
+import artworks.storage
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0003_blogpost_rendered_content'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='blogpost',
+            name='preview_image',
+            field=models.ImageField(blank=True, help_text='Изображение для превью в списке постов', null=True, storage=artworks.storage.ContentHashStorage(), upload_to='blog/previews/', verbose_name='Превью изображение'),
+        ),
+    ]
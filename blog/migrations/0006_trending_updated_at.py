@@ -0,0 +1,36 @@
+# Generated by Django 6.0.1 on 2026-10-19 10:00
+
+import math
+
+from django.db import migrations, models
+
+# ALL_TIME_WEIGHT из analytics/trending.py
+ALL_TIME_WEIGHT = 0.01
+
+
+def fill_trending_score(apps, schema_editor):
+    # До первого запуска update_trending блоки "популярное" упорядочены
+    # по накопленным просмотрам, а не произвольно (у всех trending_score = 0)
+    BlogPost = apps.get_model('blog', 'BlogPost')
+    objects = BlogPost.objects.using(schema_editor.connection.alias)
+    changed = []
+    for obj in objects.filter(trending_score=0, views__gt=0).only('id', 'views').iterator():
+        obj.trending_score = round(ALL_TIME_WEIGHT * math.log1p(obj.views), 6)
+        changed.append(obj)
+    objects.bulk_update(changed, ['trending_score'], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0005_trending_score'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='blogpost',
+            name='trending_updated_at',
+            field=models.DateTimeField(blank=True, editable=False, null=True, verbose_name='Пересчёт популярности'),
+        ),
+        migrations.RunPython(fill_trending_score, migrations.RunPython.noop),
+    ]
@@ -7,11 +7,12 @@ from ckeditor.fields import RichTextField
 from ckeditor_uploader.fields import RichTextUploadingField
 import re
 from django.utils import timezone
-from PIL import Image
-from io import BytesIO
 from django.core.files.base import ContentFile
-from unidecode import unidecode
-import os
+
+from artworks.images import compress_image, readable_slug
+from artworks.storage import media_storage
+
+from .rendering import render_content
 
 
 class BlogPost(models.Model):
@@ -44,7 +45,17 @@ class BlogPost(models.Model):
         config_name='default'
     )
     
+    # Подготовленные при сохранении версии контента (см. blog/rendering.py)
+    content_html = models.TextField(blank=True, editable=False, verbose_name="Обработанный HTML")
+    content_text = models.TextField(blank=True, editable=False, verbose_name="Текст без разметки")
+    word_count = models.PositiveIntegerField(default=0, editable=False, verbose_name="Количество слов")
+    reading_time = models.PositiveIntegerField(default=0, editable=False, verbose_name="Время чтения (мин)")
+    
     views = models.PositiveIntegerField(default=0, verbose_name="Просмотры")
+    # Просмотры с экспоненциальным затуханием, пересчитывается командой update_trending
+    trending_score = models.FloatField(default=0, editable=False, verbose_name="Популярность сейчас")
+    # Когда update_trending последний раз изменил trending_score (bulk_update не трогает updated_at)
+    trending_updated_at = models.DateTimeField(null=True, blank=True, editable=False, verbose_name="Пересчёт популярности")
     
     status = models.CharField(
         max_length=20, 
@@ -58,7 +69,8 @@ class BlogPost(models.Model):
     published_at = models.DateTimeField(null=True, blank=True, verbose_name="Дата публикации")
     
     preview_image = models.ImageField(
-        upload_to='blog/previews/%Y/%m/%d/', 
+        upload_to='blog/previews/', 
+        storage=media_storage,
         blank=True, 
         null=True,
         verbose_name="Превью изображение",
@@ -79,6 +91,7 @@ class BlogPost(models.Model):
         indexes = [
             models.Index(fields=['status', '-published_at']),
             models.Index(fields=['status', '-views']),
+            models.Index(fields=['status', '-trending_score']),
             models.Index(fields=['status', '-created_at']),
             models.Index(fields=['author']),
             models.Index(fields=['slug']),
@@ -107,43 +120,13 @@ class BlogPost(models.Model):
         # Сжимаем и транслитерируем только новые или изменённые изображения
         if is_new_image and self.preview_image:
             try:
-                img = Image.open(self.preview_image)
-                
-                # Максимальные размеры для превью
-                max_width = 1200
-                max_height = 800
-                
-                # Изменяем размер если нужно
-                if img.width > max_width or img.height > max_height:
-                    img.thumbnail((max_width, max_height), Image.Resampling.LANCZOS)
-                
-                # Конвертируем в RGB если нужно
-                if img.mode in ('RGBA', 'LA', 'P'):
-                    background = Image.new('RGB', img.size, (255, 255, 255))
-                    if img.mode in ('RGBA', 'LA'):
-                        background.paste(img, mask=img.split()[-1])
-                    else:
-                        background.paste(img)
-                    img = background
-                
-                # Сохраняем в буфер
-                img_io = BytesIO()
-                img.save(img_io, format='JPEG', quality=85, optimize=True)
-                img_io.seek(0)
-                
-                # Транслитерируем имя файла
-                original_name = os.path.basename(self.preview_image.name)
-                name, ext = os.path.splitext(original_name)
-                
-                # Конвертируем кириллицу в латиницу
-                name = unidecode(name)  # Транслитерация
-                name = slugify(name)     # Убираем спецсимволы, делаем нижний регистр
-                
-                new_name = f"{name}_preview.jpg"
+                # Превью меньше изображений картин
+                data = compress_image(self.preview_image, max_width=1200, max_height=800)
+                new_name = f"{readable_slug(self.preview_image.name)}_preview.jpg"
                 
                 self.preview_image.save(
                     new_name,
-                    ContentFile(img_io.getvalue()),
+                    ContentFile(data),
                     save=False
                 )
             except Exception as e:
@@ -162,15 +145,32 @@ class BlogPost(models.Model):
         if self.status == 'published' and not self.published_at:
             self.published_at = timezone.now()
         
-        if not self.excerpt and self.content:
-            from django.utils.html import strip_tags
-            plain_text = strip_tags(self.content)[:500]
+        # Обновление счётчика просмотров и т.п. не трогает контент
+        update_fields = kwargs.get('update_fields')
+        derived_fields = set()
+        if update_fields is None or 'content' in update_fields:
+            derived_fields.update(self.render_content())
+        
+        if not self.excerpt and self.content_text:
+            plain_text = self.content_text[:500]
             if len(plain_text) > 497:
                 plain_text = plain_text[:plain_text.rfind(' ')]
             self.excerpt = plain_text + '...'
+            derived_fields.add('excerpt')
+        
+        # save(update_fields=['content']) сохраняет и пересчитанные из него поля
+        if update_fields is not None and derived_fields:
+            kwargs['update_fields'] = {*update_fields, *derived_fields}
         
         super().save(*args, **kwargs)
     
+    def render_content(self):
+        """Пересчитывает content_html, content_text, word_count и reading_time, возвращает имена полей"""
+        rendered = render_content(self.content)
+        for field, value in rendered.items():
+            setattr(self, field, value)
+        return list(rendered)
+    
     def get_absolute_url(self):
         return reverse('blog_post_detail', kwargs={'slug': self.slug})
     
@@ -185,4 +185,4 @@ class BlogPost(models.Model):
         self.save(update_fields=['views'])
     
     def get_content_html(self):
-        return self.content
\ No newline at end of file
+        return self.content_html or self.content
\ No newline at end of file
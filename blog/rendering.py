@@ -0,0 +1,172 @@
+# blog/rendering.py
+import math
+import os
+import re
+from html import escape, unescape
+from html.parser import HTMLParser
+from io import BytesIO
+from urllib.parse import unquote, urlparse
+
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.utils.html import strip_tags
+
+# Ширины адаптивных копий изображений из текста поста
+RENDITION_WIDTHS = (480, 960, 1440)
+RENDITION_DIR = 'renditions'
+CONTENT_IMAGE_SIZES = '(max-width: 768px) 100vw, 768px'
+
+WORDS_PER_MINUTE = 200
+
+IMG_RE = re.compile(r'<img\b[^>]*>', re.IGNORECASE)
+IFRAME_RE = re.compile(r'<iframe\b[^>]*>', re.IGNORECASE)
+WORD_RE = re.compile(r'\w+')
+SPACES_RE = re.compile(r'\s+')
+
+
+class _TagParser(HTMLParser):
+    """Разбирает один открывающий тег в (имя, атрибуты)"""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.tag = None
+        self.attrs = {}
+
+    def handle_starttag(self, tag, attrs):
+        self.tag = tag
+        self.attrs = dict(attrs)
+
+    handle_startendtag = handle_starttag
+
+
+def _parse_tag(tag_html):
+    parser = _TagParser()
+    parser.feed(tag_html)
+    parser.close()
+    return parser.tag, parser.attrs
+
+
+def _build_tag(tag, attrs):
+    parts = [tag]
+    for name, value in attrs.items():
+        if value is None:
+            parts.append(name)
+        else:
+            parts.append(f'{name}="{escape(value, quote=True)}"')
+    return '<%s>' % ' '.join(parts)
+
+
+def _media_name(src):
+    """Имя файла в хранилище для ссылки на MEDIA_URL, иначе None"""
+    url = urlparse(src)
+    path = unquote(url.path)
+    if url.netloc or not path.startswith(settings.MEDIA_URL):
+        return None
+    return path[len(settings.MEDIA_URL):]
+
+
+def _rendition_name(name, width):
+    root, ext = os.path.splitext(name)
+    return f"{RENDITION_DIR}/{root}_{width}w.jpg"
+
+
+def _to_rgb(img):
+    from PIL import Image
+
+    if img.mode in ('RGBA', 'LA', 'P'):
+        if img.mode == 'P':
+            img = img.convert('RGBA')
+        background = Image.new('RGB', img.size, (255, 255, 255))
+        background.paste(img, mask=img.split()[-1])
+        return background
+    if img.mode != 'RGB':
+        return img.convert('RGB')
+    return img
+
+
+def image_renditions(name):
+    """
+    Размер исходного изображения и список уменьшенных копий [(url, ширина)].
+    Отсутствующие копии создаются в RENDITION_DIR.
+    """
+    # Pillow нужен только при создании сводок и отрисовке постов, не при старте
+    from PIL import Image
+
+    with default_storage.open(name) as f:
+        img = Image.open(f)
+        width, height = img.size
+        renditions = []
+
+        for target_width in RENDITION_WIDTHS:
+            if target_width >= width:
+                break
+            rendition_name = _rendition_name(name, target_width)
+            if not default_storage.exists(rendition_name):
+                target_height = round(height * target_width / width)
+                copy = _to_rgb(img).resize((target_width, target_height), Image.Resampling.LANCZOS)
+                img_io = BytesIO()
+                copy.save(img_io, format='JPEG', quality=85, optimize=True)
+                rendition_name = default_storage.save(rendition_name, ContentFile(img_io.getvalue()))
+            renditions.append((default_storage.url(rendition_name), target_width))
+
+    return width, height, renditions
+
+
+def _rewrite_img(match):
+    tag, attrs = _parse_tag(match.group(0))
+    if tag != 'img':
+        return match.group(0)
+
+    attrs.setdefault('loading', 'lazy')
+    attrs.setdefault('decoding', 'async')
+
+    src = attrs.get('src') or ''
+    name = _media_name(src)
+    if name:
+        try:
+            width, height, renditions = image_renditions(name)
+        except Exception as e:
+            # Битая ссылка или не изображение - оставляем тег как есть
+            print(f"Ошибка обработки изображения {name}: {e}")
+        else:
+            if 'width' not in attrs and 'height' not in attrs:
+                attrs['width'] = str(width)
+                attrs['height'] = str(height)
+            if renditions and 'srcset' not in attrs:
+                srcset = [f"{url} {w}w" for url, w in renditions]
+                srcset.append(f"{src} {width}w")
+                attrs['srcset'] = ', '.join(srcset)
+                attrs['sizes'] = CONTENT_IMAGE_SIZES
+
+    return _build_tag(tag, attrs)
+
+
+def _rewrite_iframe(match):
+    tag, attrs = _parse_tag(match.group(0))
+    if tag != 'iframe':
+        return match.group(0)
+    attrs.setdefault('loading', 'lazy')
+    return _build_tag(tag, attrs)
+
+
+def render_content(html):
+    """
+    Обработка HTML из CKEditor при сохранении поста.
+
+    Возвращает словарь с готовым HTML (ленивые адаптивные изображения и iframe),
+    простым текстом, количеством слов и временем чтения в минутах.
+    """
+    html = html or ''
+    rendered = IMG_RE.sub(_rewrite_img, html)
+    rendered = IFRAME_RE.sub(_rewrite_iframe, rendered)
+
+    text = SPACES_RE.sub(' ', unescape(strip_tags(html))).strip()
+    word_count = len(WORD_RE.findall(text))
+
+    return {
+        'content_html': rendered,
+        'content_text': text,
+        'word_count': word_count,
+        'reading_time': math.ceil(word_count / WORDS_PER_MINUTE),
+    }
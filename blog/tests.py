@@ -1,3 +1,53 @@
-from django.test import TestCase
+import shutil
+import tempfile
+from io import BytesIO
 
-# Create your tests here.
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from .models import BlogPost
+
+
+class BlogPostSaveTests(TestCase):
+    def test_update_fields_content_saves_derived_fields(self):
+        post = BlogPost.objects.create(title='Весна', slug='vesna', content='<p>Первый абзац</p>')
+        post.content = '<p>' + ' '.join(['слово'] * 450) + '</p>'
+        post.save(update_fields=['content'])
+
+        post.refresh_from_db()
+        self.assertEqual(post.word_count, 450)
+        self.assertEqual(post.reading_time, 3)
+        self.assertIn('слово', post.content_text)
+        self.assertNotIn('Первый', post.content_html)
+
+    def test_preview_image_compressed(self):
+        from PIL import Image
+
+        media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, media_root, ignore_errors=True)
+        buffer = BytesIO()
+        Image.new('RGBA', (2400, 1200), (255, 0, 0, 128)).save(buffer, format='PNG')
+
+        with override_settings(MEDIA_ROOT=media_root):
+            post = BlogPost.objects.create(
+                title='Весна', slug='vesna', content='<p>Текст</p>',
+                preview_image=SimpleUploadedFile('Весна.png', buffer.getvalue(), content_type='image/png'),
+            )
+            self.assertTrue(post.preview_image.name.endswith('_vesna_preview.jpg'), post.preview_image.name)
+            with Image.open(post.preview_image) as img:
+                self.assertEqual((img.format, img.size), ('JPEG', (1200, 600)))
+
+
+class BlogValidatorsTests(TestCase):
+    def test_delete_changes_etag(self):
+        for title, slug in (('Весна', 'vesna'), ('Лето', 'leto')):
+            BlogPost.objects.create(title=title, slug=slug, content='<p>Текст</p>')
+        url = reverse('blog_list')
+        etag = self.client.get(url)['ETag']
+
+        BlogPost.objects.get(slug='leto').delete()
+
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response['ETag'], etag)
@@ -7,15 +7,66 @@ from .models import BlogPost
 from collections import Counter
 import re
 
-from analytics.models import BlogPostView
+from artworks.block_cache import cached_block
+from artworks.http_cache import cache_policy, request_version, site_state
 
+
+def _blog_list_validators(request):
+    # Все опубликованные посты уже учтены в site_state
+    last_modified, state = site_state()
+    return last_modified, ['blog'], state
+
+
+def _blog_detail_validators(request, slug):
+    post_id = BlogPost.objects.filter(
+        slug=slug, status='published'
+    ).values_list('id', flat=True).first()
+    if post_id is None:
+        return None, []
+    last_modified, state = site_state()
+    return last_modified, ['blog', f'post-{post_id}'], state
+
+
+# Топ тегов, популярные и недавние посты: общие для всех страниц списка
+SIDEBAR_CACHE_KEY = 'blog_sidebar'
+SIDEBAR_TTL = 300
+
+
+def _sidebar_blocks():
+    # Получаем топ теги (оптимизированно)
+    all_posts_with_tags = BlogPost.objects.filter(
+        status='published'
+    ).values_list('tags', flat=True)
+    
+    # Собираем все теги
+    all_tags = []
+    for tags_str in all_posts_with_tags:
+        if tags_str:
+            tags_list = [t.strip() for t in tags_str.split(',')]
+            all_tags.extend(tags_list)
+    
+    # Получаем популярные посты (оптимизированно)
+    popular_posts = BlogPost.objects.filter(
+        status='published'
+    ).select_related('author').order_by('-trending_score')[:5]
+    
+    # Получаем недавние посты (оптимизированно)
+    recent_posts = BlogPost.objects.filter(
+        status='published'
+    ).select_related('author').order_by('-published_at')[:5]
+    
+    return {
+        # Считаем топ-10 тегов
+        'top_tags': Counter(all_tags).most_common(10),
+        'popular_posts': list(popular_posts),
+        'recent_posts': list(recent_posts),
+    }
+
+
+@cache_policy(_blog_list_validators, max_age=60)
 def blog_list(request):
     """Список постов блога"""
     
-    # Кэширование популярных и недавних постов (опционально)
-    cache_key_popular = 'blog_popular_posts'
-    cache_key_recent = 'blog_recent_posts'
-    
     # Основной запрос с оптимизацией
     posts = BlogPost.objects.filter(status='published').select_related('author')
     
@@ -53,32 +104,9 @@ def blog_list(request):
     except EmptyPage:
         posts_page = paginator.page(paginator.num_pages)
     
-    # Получаем топ теги (оптимизированно)
-    top_tags = []
-    all_posts_with_tags = BlogPost.objects.filter(
-        status='published'
-    ).values_list('tags', flat=True)
-    
-    # Собираем все теги
-    all_tags = []
-    for tags_str in all_posts_with_tags:
-        if tags_str:
-            tags_list = [t.strip() for t in tags_str.split(',')]
-            all_tags.extend(tags_list)
-    
-    # Считаем топ-10 тегов
-    tag_counter = Counter(all_tags)
-    top_tags = tag_counter.most_common(10)
-    
-    # Получаем популярные посты (оптимизированно)
-    popular_posts = BlogPost.objects.filter(
-        status='published'
-    ).select_related('author').order_by('-views')[:5]
-    
-    # Получаем недавние посты (оптимизированно)
-    recent_posts = BlogPost.objects.filter(
-        status='published'
-    ).select_related('author').order_by('-published_at')[:5]
+    sidebar = cached_block(
+        SIDEBAR_CACHE_KEY, _sidebar_blocks, soft_ttl=SIDEBAR_TTL, version=request_version(request)
+    )
     
     context = {
         'posts': posts_page,
@@ -86,14 +114,13 @@ def blog_list(request):
         'tag': tag,
         'is_paginated': posts_page.has_other_pages(),
         'page_obj': posts_page,
-        'top_tags': top_tags,
-        'popular_posts': popular_posts,
-        'recent_posts': recent_posts,
+        **sidebar,
     }
     
     return render(request, 'blog/blog_list.html', context)
 
 
+@cache_policy(_blog_detail_validators)
 def blog_detail(request, slug):
     """Детальная страница поста"""
     # Оптимизированный запрос
@@ -103,19 +130,7 @@ def blog_detail(request, slug):
         status='published'
     )
     
-    # Отслеживание просмотров (оптимизированно)
-    viewed_posts = request.session.get('viewed_posts', [])
-    
-    if post.id not in viewed_posts:
-        # Используем F-выражение для атомарного обновления
-        from django.db.models import F
-        BlogPost.objects.filter(id=post.id).update(views=F('views') + 1)
-        post.views += 1  # Обновляем локально для отображения
-        BlogPostView.objects.create(post=post)
-        viewed_posts.append(post.id)
-        if len(viewed_posts) > 50:
-            viewed_posts = viewed_posts[-50:]
-        request.session['viewed_posts'] = viewed_posts
+    # Просмотр засчитывает /analytics/collect по beacon со страницы
     
     # Похожие посты (оптимизированно)
     similar_posts = BlogPost.objects.filter(